@@ -0,0 +1,106 @@
+"""Persistent MIME type cache for the media scanner.
+
+This module stores libmagic verification results in a small SQLite
+database so that re-scanning an unchanged library skips header reads.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sqlite3
+import struct
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Keys bound per SELECT, below SQLite's default host parameter limit
+LOOKUP_BATCH_SIZE = 500
+
+
+class MimeCache:
+    """SQLite-backed cache mapping (path, mtime, size) to a MIME type.
+
+    Lookups hit the database directly, while new entries are buffered and
+    written in one transaction by :meth:`flush`. The connection may be used
+    from worker threads, one call at a time, so the scanner can keep
+    database I/O off the event loop.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            cache_path: Path to the SQLite database file
+        """
+        self.cache_path = cache_path
+        self._connection = sqlite3.connect(cache_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS mime (key BLOB PRIMARY KEY, mime TEXT NOT NULL)"
+        )
+        self._pending: list[tuple[bytes, str]] = []
+
+        logger.debug("MIME cache opened", cache_path=str(cache_path))
+
+    @staticmethod
+    def make_key(file_path: Path, stat_result: os.stat_result) -> bytes:
+        """Build the cache key for a file.
+
+        The modification time and size are part of the key, so any change
+        to the file produces a cache miss.
+        """
+        return struct.pack(
+            "<qQ", stat_result.st_mtime_ns, stat_result.st_size
+        ) + os.fsencode(file_path.absolute())
+
+    def get(self, key: bytes) -> str | None:
+        """Get the cached MIME type for a key, if any."""
+        row = self._connection.execute(
+            "SELECT mime FROM mime WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, str]:
+        """Get the cached MIME types for several keys at once.
+
+        Returns:
+            Mapping of each cached key to its MIME type; misses are absent
+        """
+        found: dict[bytes, str] = {}
+        for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            batch = keys[start : start + LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            found.update(
+                self._connection.execute(
+                    f"SELECT key, mime FROM mime WHERE key IN ({placeholders})",
+                    batch,
+                )
+            )
+        return found
+
+    def put(self, key: bytes, mime_type: str) -> None:
+        """Queue a MIME type to be written on the next flush."""
+        self._pending.append((key, mime_type))
+
+    def flush(self) -> None:
+        """Write all queued entries in a single transaction."""
+        if not self._pending:
+            return
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO mime (key, mime) VALUES (?, ?)",
+                self._pending,
+            )
+
+        logger.debug("MIME cache flushed", entries=len(self._pending))
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush queued entries and close the database."""
+        self.flush()
+        self._connection.close()
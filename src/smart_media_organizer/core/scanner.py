@@ -7,11 +7,15 @@ for discovering and analyzing media files in directory structures.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import nullcontext
+from datetime import datetime
+import itertools
+import os
 from pathlib import Path
+import threading
+import time
 
-import aiofiles
-import aiofiles.os
 import magic
 from rich.console import Console
 from rich.progress import (
@@ -26,6 +30,7 @@ from rich.progress import (
 )
 import structlog
 
+from smart_media_organizer.core.mime_cache import MimeCache
 from smart_media_organizer.models.config import Settings
 from smart_media_organizer.models.media_file import (
     MediaFile,
@@ -33,14 +38,60 @@ from smart_media_organizer.models.media_file import (
     ProcessingStatus,
 )
 from smart_media_organizer.utils.file_ops import (
+    IMAGE_EXTENSIONS,
+    SUBTITLE_EXTENSIONS,
+    VIDEO_EXTENSIONS,
+    classify_media,
     get_file_info,
-    is_image_file,
-    is_subtitle_file,
     is_video_file,
+    name_suffix,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Bytes read from each file for magic-number sniffing; container signatures
+# (ftyp, EBML, RIFF, OggS) all live well inside the first sector
+MAGIC_HEADER_SIZE = 512
+
+# Leading bytes used as the MIME memoization key; libmagic still sees the
+# whole header
+MAGIC_PREFIX_SIZE = 64
+
+# Header prefixes whose MIME type is memoized
+MIME_MEMO_SIZE = 4096
+
+# Extensions accepted as media, applied during the walk
+MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | SUBTITLE_EXTENSIONS | IMAGE_EXTENSIONS
+
+# MIME type prefixes accepted as media by magic-number verification
+MEDIA_MIME_PREFIXES = (
+    "video/",
+    "audio/",
+    "image/",
+    "application/ogg",  # OGG containers
+    "application/x-matroska",  # MKV files
+)
+
+# Worker threads walking top-level subdirectories in parallel
+WALK_WORKERS = min(8, os.cpu_count() or 1)
+
+# Minimum seconds between progress bar updates (at most 20 per second)
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Shared libmagic MIME detector, opened lazily on first use
+_magic_mime: magic.Magic | None = None
+_magic_lock = threading.Lock()
+
+
+def _get_magic_mime() -> magic.Magic:
+    """Get the process-wide libmagic MIME detector."""
+    global _magic_mime
+    if _magic_mime is None:
+        with _magic_lock:
+            if _magic_mime is None:
+                _magic_mime = magic.Magic(mime=True)
+    return _magic_mime
+
 
 class ScannerError(Exception):
     """Base exception for scanner errors."""
@@ -50,11 +101,176 @@ class InvalidDirectoryError(ScannerError):
     """Invalid directory error."""
 
 
+def _read_directory(
+    directory: Path, *, extensions: frozenset[str] | None = None
+) -> tuple[list[tuple[Path, os.stat_result]], list[Path]]:
+    """Read a single directory with ``os.scandir``.
+
+    ``DirEntry.is_file``/``is_dir`` reuse the file type reported by the
+    directory read, and each file is stat'ed once through ``DirEntry.stat``.
+    Symlinked directories are not returned, matching ``Path.rglob``.
+
+    Args:
+        directory: Directory to read
+        extensions: Lowercase suffixes to keep; other files are dropped
+            before being stat'ed. All files are kept if omitted.
+
+    Returns:
+        Tuple of the (path, stat result) pairs for files and the
+        subdirectories of the directory
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    files: list[tuple[Path, os.stat_result]] = []
+    subdirectories: list[Path] = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if extensions is not None and name_suffix(entry.name) not in (
+                    extensions
+                ):
+                    continue
+                try:
+                    files.append((Path(entry.path), entry.stat()))
+                except OSError:
+                    # File vanished or became unreadable mid-walk
+                    continue
+            elif entry.is_dir(follow_symlinks=False):
+                subdirectories.append(Path(entry.path))
+
+    return files, subdirectories
+
+
+def _iter_walk(
+    directory: Path, *, extensions: frozenset[str] | None = None
+) -> Iterator[list[tuple[Path, os.stat_result]]]:
+    """Walk a directory tree depth-first, one batch per directory.
+
+    Unreadable directories, including ``directory`` itself, are skipped
+    like ``Path.rglob`` does.
+
+    Args:
+        directory: Directory to walk
+        extensions: Lowercase suffixes to keep, or None for all files
+
+    Yields:
+        Non-empty lists of (path, stat result) tuples, one per directory
+    """
+    pending = [directory]
+
+    while pending:
+        try:
+            batch, subdirectories = _read_directory(
+                pending.pop(), extensions=extensions
+            )
+        except OSError:
+            continue
+
+        pending.extend(subdirectories)
+        if batch:
+            yield batch
+
+
+def _count_directory(directory: Path) -> dict[str, int]:
+    """Count files and their total size under a directory in a single pass.
+
+    Raises:
+        OSError: If the directory itself cannot be read
+    """
+    stats = {
+        "total_files": 0,
+        "video_files": 0,
+        "subtitle_files": 0,
+        "image_files": 0,
+        "other_files": 0,
+        "total_size": 0,
+    }
+
+    files, subdirectories = _read_directory(directory)
+    batches = itertools.chain(
+        [files], *(_iter_walk(subdirectory) for subdirectory in subdirectories)
+    )
+
+    for batch in batches:
+        for file_path, stat_result in batch:
+            stats["total_files"] += 1
+            stats["total_size"] += stat_result.st_size
+
+            kind = classify_media(file_path)
+            stats[f"{kind}_files" if kind else "other_files"] += 1
+
+    return stats
+
+
+# MIME types by (detector, header prefix), oldest first
+_mime_memo: dict[tuple[magic.Magic, bytes], str] = {}
+
+
+def _mime_for_header(detector: magic.Magic, header: bytes) -> str:
+    """Get the MIME type of a file header, memoized per detector.
+
+    libmagic is given the full header, so formats whose magic lies past
+    the first ``MAGIC_PREFIX_SIZE`` bytes are still detected; headers
+    sharing that prefix reuse the first result.
+    """
+    key = (detector, bytes(header[:MAGIC_PREFIX_SIZE]))
+    mime_type = _mime_memo.get(key)
+    if mime_type is None:
+        mime_type = detector.from_buffer(header)
+        if len(_mime_memo) >= MIME_MEMO_SIZE:
+            del _mime_memo[next(iter(_mime_memo))]
+        _mime_memo[key] = mime_type
+    return mime_type
+
+
+# O_NOATIME keeps header sniffing from dirtying inodes; it is Linux-only and
+# only allowed on files owned by the caller
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _read_header(file_path: Path, size: int = MAGIC_HEADER_SIZE) -> bytes:
+    """Read the first bytes of a file for magic-number sniffing.
+
+    Where supported, the kernel is told the access is random so it does not
+    read ahead into (and evict page cache for) the rest of a large file.
+    """
+    if not hasattr(os, "pread"):
+        # No positional reads (Windows); use a plain buffered read
+        with file_path.open("rb") as f:
+            return f.read(size)
+
+    try:
+        fd = os.open(file_path, os.O_RDONLY | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        fd = os.open(file_path, os.O_RDONLY)
+
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_RANDOM)
+        return os.pread(fd, size, 0)
+    finally:
+        os.close(fd)
+
+
 class ScanProgress:
-    """Progress tracking for file scanning operations."""
+    """Progress tracking for file scanning operations.
+
+    Analysis updates are throttled to ``update_interval`` seconds; advances
+    made in between are accumulated and applied with the next update.
+    """
 
-    def __init__(self, console: Console | None = None) -> None:
+    def __init__(
+        self,
+        console: Console | None = None,
+        *,
+        update_interval: float = PROGRESS_UPDATE_INTERVAL,
+    ) -> None:
         self.console = console or Console()
+        self.update_interval = update_interval
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -68,12 +284,16 @@ class ScanProgress:
         )
         self.scan_task: TaskID | None = None
         self.analyze_task: TaskID | None = None
+        self._pending_analysis = 0
+        self._pending_description: str | None = None
+        self._last_analysis_update = float("-inf")
 
     async def __aenter__(self):
         self.progress.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.flush_analysis()
         self.progress.stop()
 
     def start_scan(self, description: str, total: int | None = None) -> TaskID:
@@ -94,11 +314,30 @@ class ScanProgress:
             )
 
     def update_analysis(self, advance: int = 1, description: str | None = None) -> None:
-        """Update analysis progress."""
-        if self.analyze_task is not None:
-            self.progress.update(
-                self.analyze_task, advance=advance, description=description
-            )
+        """Update analysis progress, throttled to ``update_interval``."""
+        if self.analyze_task is None:
+            return
+
+        self._pending_analysis += advance
+        if description is not None:
+            self._pending_description = description
+
+        if time.monotonic() - self._last_analysis_update >= self.update_interval:
+            self.flush_analysis()
+
+    def flush_analysis(self) -> None:
+        """Apply any analysis progress held back by throttling."""
+        if self.analyze_task is None:
+            return
+
+        self.progress.update(
+            self.analyze_task,
+            advance=self._pending_analysis,
+            description=self._pending_description,
+        )
+        self._pending_analysis = 0
+        self._pending_description = None
+        self._last_analysis_update = time.monotonic()
 
     def set_scan_total(self, total: int) -> None:
         """Set the total for scan task."""
@@ -114,15 +353,22 @@ class ScanProgress:
 class MediaFileScanner:
     """High-performance async media file scanner."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, cache_path: Path | None = None) -> None:
         """Initialize the scanner.
 
         Args:
             settings: Application settings
+            cache_path: Optional SQLite file for persisting MIME verification
+                results between scans
         """
         self.settings = settings
-        self.magic_mime = magic.Magic(mime=True)
-        self.magic_type = magic.Magic()
+        self.magic_mime = _get_magic_mime()
+        self.mime_cache = MimeCache(cache_path) if cache_path else None
+
+    def close(self) -> None:
+        """Release resources held by the scanner."""
+        if self.mime_cache is not None:
+            self.mime_cache.close()
 
     async def scan_directory(
         self,
@@ -146,13 +392,15 @@ class MediaFileScanner:
         Raises:
             InvalidDirectoryError: If directory doesn't exist or isn't accessible
         """
-        if not await aiofiles.os.path.exists(directory):
+        # One-shot checks before the scan starts; a single stat syscall is
+        # cheaper than a thread-pool round-trip
+        if not directory.exists():
             raise InvalidDirectoryError(f"Directory not found: {directory}")
 
-        if not await aiofiles.os.path.isdir(directory):
+        if not directory.is_dir():
             raise InvalidDirectoryError(f"Path is not a directory: {directory}")
 
-        max_concurrent = max_concurrent or self.settings.max_concurrent_api_calls
+        max_concurrent = max_concurrent or self.settings.max_concurrent
 
         logger.info(
             "Starting directory scan",
@@ -161,88 +409,204 @@ class MediaFileScanner:
             max_concurrent=max_concurrent,
         )
 
-        # Use semaphore to limit concurrent operations
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Without a progress bar, skip Rich's live display and refresh thread
+        progress_context = ScanProgress() if show_progress else nullcontext()
 
-        async with ScanProgress() as progress:
-            if show_progress:
+        async with progress_context as progress:
+            if progress is not None:
                 progress.start_scan("🔍 Discovering files...")
-
-            # First pass: discover all files
-            file_paths = []
-            async for file_path in self._discover_files(directory, recursive=recursive):
-                file_paths.append(file_path)
-                if show_progress:
+                progress.start_analysis("📊 Analyzing files...")
+
+            # Analysis starts with the first directory the walker reports and
+            # overlaps with the rest of the walk; totals stay unknown until the
+            # walk finishes
+            total_files = 0
+            file_entries: list[tuple[Path, os.stat_result]] = []
+            async for batch in self._discover_batches(
+                directory, recursive=recursive, extensions=MEDIA_EXTENSIONS
+            ):
+                total_files += len(batch)
+                if progress is not None:
                     progress.update_scan(
-                        description=f"🔍 Found {len(file_paths)} files..."
+                        advance=len(batch),
+                        description=f"🔍 Found {total_files} files...",
                     )
 
-            if show_progress:
-                progress.set_scan_total(len(file_paths))
-                progress.start_analysis("📊 Analyzing files...", total=len(file_paths))
+                file_entries.extend(batch)
+                while len(file_entries) >= max_concurrent:
+                    chunk = file_entries[:max_concurrent]
+                    del file_entries[:max_concurrent]
+                    for media_file in await self._analyze_chunk(chunk, progress):
+                        yield media_file
 
-            # Second pass: analyze files concurrently
-            tasks = []
-            for file_path in file_paths:
-                task = asyncio.create_task(
-                    self._analyze_file_with_semaphore(
-                        semaphore, file_path, progress if show_progress else None
-                    )
-                )
-                tasks.append(task)
+            if progress is not None:
+                progress.set_scan_total(total_files)
+                progress.set_analysis_total(total_files)
 
-            # Process results as they complete
-            for completed_task in asyncio.as_completed(tasks):
-                try:
-                    media_file = await completed_task
-                    if media_file:
-                        yield media_file
-                except Exception as e:
-                    logger.error("Error analyzing file", error=str(e), exc_info=True)
+            if file_entries:
+                for media_file in await self._analyze_chunk(file_entries, progress):
+                    yield media_file
+
+        if self.mime_cache is not None:
+            await asyncio.to_thread(self.mime_cache.flush)
 
         logger.info(
             "Directory scan completed",
             directory=str(directory),
-            total_files=len(file_paths),
+            total_files=total_files,
         )
 
-    async def _discover_files(
-        self, directory: Path, *, recursive: bool = True
-    ) -> AsyncGenerator[Path, None]:
-        """Discover all files in directory."""
+    async def _analyze_chunk(
+        self,
+        chunk: list[tuple[Path, os.stat_result]],
+        progress: ScanProgress | None = None,
+    ) -> list[MediaFile]:
+        """Analyze a chunk of files concurrently.
+
+        Args:
+            chunk: (path, stat result) tuples to analyze together
+            progress: Progress tracker to advance, if any
+
+        Returns:
+            MediaFile objects for the media files in the chunk
+        """
+        # One timestamp shared by every MediaFileInfo built for the chunk
+        created_at = datetime.now()
+
+        # One cache query per chunk, on a worker thread, instead of a
+        # SELECT on the event loop for every file
+        cached_mimes = None
+        if self.mime_cache is not None and self.settings.verify_mime:
+            cached_mimes = await asyncio.to_thread(
+                self.mime_cache.get_many,
+                [
+                    MimeCache.make_key(file_path, stat_result)
+                    for file_path, stat_result in chunk
+                ],
+            )
+
+        results = await asyncio.gather(
+            *(
+                self._analyze_file(
+                    file_path,
+                    stat_result,
+                    created_at=created_at,
+                    cached_mimes=cached_mimes,
+                )
+                for file_path, stat_result in chunk
+            ),
+            return_exceptions=True,
+        )
+
+        if progress is not None:
+            progress.update_analysis(
+                advance=len(chunk),
+                description=f"📊 Analyzed {chunk[-1][0].name}",
+            )
+
+        media_files = []
+        for result in results:
+            if isinstance(result, MediaFile):
+                media_files.append(result)
+            elif isinstance(result, Exception):
+                logger.error(
+                    "Error analyzing file",
+                    error=str(result),
+                    exc_info=result,
+                )
+        return media_files
+
+    async def _discover_batches(
+        self,
+        directory: Path,
+        *,
+        recursive: bool = True,
+        extensions: frozenset[str] | None = None,
+    ) -> AsyncGenerator[list[tuple[Path, os.stat_result]], None]:
+        """Discover files in directory, one batch per directory read.
+
+        The root is read first; its subdirectories are then walked in
+        parallel by up to WALK_WORKERS worker threads, which hand batches
+        over through a queue so callers can process earlier directories
+        while later ones are still being read.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan subdirectories
+            extensions: Lowercase suffixes to keep, or None for all files
+
+        Raises:
+            ScannerError: If the directory cannot be read
+        """
         try:
-            if recursive:
-                # Use Path.rglob for recursive discovery
-                for path in directory.rglob("*"):
-                    if await aiofiles.os.path.isfile(path):
-                        yield path
-            else:
-                # Use Path.glob for single-level discovery
-                for path in directory.glob("*"):
-                    if await aiofiles.os.path.isfile(path):
-                        yield path
+            batch, subdirectories = await asyncio.to_thread(
+                _read_directory, directory, extensions=extensions
+            )
         except OSError as e:
             logger.error(
                 "Error discovering files", directory=str(directory), error=str(e)
             )
             raise ScannerError(f"Cannot scan directory {directory}: {e}") from e
 
-    async def _analyze_file_with_semaphore(
+        if batch:
+            yield batch
+
+        if not recursive or not subdirectories:
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[list[tuple[Path, os.stat_result]] | None] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(WALK_WORKERS)
+        stopped = threading.Event()
+
+        def walk(subdirectory: Path) -> None:
+            for batch in _iter_walk(subdirectory, extensions=extensions):
+                if stopped.is_set():
+                    return
+                loop.call_soon_threadsafe(queue.put_nowait, batch)
+
+        async def walk_limited(subdirectory: Path) -> None:
+            async with semaphore:
+                await asyncio.to_thread(walk, subdirectory)
+
+        async def walk_all() -> None:
+            try:
+                await asyncio.gather(*(walk_limited(sub) for sub in subdirectories))
+            finally:
+                queue.put_nowait(None)
+
+        walker = asyncio.create_task(walk_all())
+        try:
+            while (batch := await queue.get()) is not None:
+                yield batch
+            await walker
+        finally:
+            # Let an abandoned walk stop at the next directory
+            stopped.set()
+            walker.cancel()
+
+    async def _analyze_file(
         self,
-        semaphore: asyncio.Semaphore,
         file_path: Path,
-        progress: ScanProgress | None,
+        stat_result: os.stat_result | None = None,
+        *,
+        created_at: datetime | None = None,
+        cached_mimes: dict[bytes, str] | None = None,
     ) -> MediaFile | None:
-        """Analyze a single file with semaphore protection."""
-        async with semaphore:
-            result = await self._analyze_file(file_path)
-            if progress:
-                progress.update_analysis(description=f"📊 Analyzed {file_path.name}")
-            return result
-
-    async def _analyze_file(self, file_path: Path) -> MediaFile | None:
-        """Analyze a single file and create MediaFile if it's a media file."""
+        """Analyze a single file and create MediaFile if it's a media file.
+
+        Args:
+            file_path: Path to the file
+            stat_result: Pre-fetched stat result, stat'ed on demand if omitted
+            created_at: Creation timestamp for the MediaFileInfo, taken now
+                if omitted
+            cached_mimes: MIME cache entries already looked up for the
+                file's chunk
+        """
         try:
+            # Lowercased once and reused by every extension check below
+            suffix = name_suffix(file_path.name)
+
             # Check if file should be skipped
             if self.settings.should_skip_file(file_path):
                 logger.debug(
@@ -251,15 +615,17 @@ class MediaFileScanner:
                 return None
 
             # Check file extension first for quick filtering
-            if not self._is_potential_media_file(file_path):
+            if suffix not in MEDIA_EXTENSIONS:
                 return None
 
-            # Get basic file information
-            file_info_dict = await get_file_info(file_path)
+            # Get file size, reusing the batched stat result when available
+            if stat_result is not None:
+                file_size = stat_result.st_size
+            else:
+                file_size = (await get_file_info(file_path))["size"]
 
             # Check file size constraints
             min_size, max_size = self.settings.get_file_size_limits()
-            file_size = file_info_dict["size"]
 
             if file_size < min_size:
                 logger.debug(
@@ -279,22 +645,31 @@ class MediaFileScanner:
                 )
                 return None
 
-            # Verify it's actually a video file using magic numbers
-            if not await self._verify_media_file(file_path):
+            # Configured video and known subtitle extensions are trusted; only
+            # files with ambiguous extensions are verified using magic numbers
+            needs_verification = self.settings.verify_mime and not (
+                suffix in SUBTITLE_EXTENSIONS or self.settings.is_video_file(file_path)
+            )
+            if needs_verification and not await self._verify_media_file(
+                file_path, stat_result, cached_mimes
+            ):
                 return None
 
-            # Create MediaFileInfo
-            media_file_info = MediaFileInfo(
+            # Create MediaFileInfo. Every value here comes straight from the
+            # filesystem and is already valid, so validation is skipped.
+            media_file_info = MediaFileInfo.model_construct(
                 file_path=file_path,
                 file_size=file_size,
-                file_extension=file_path.suffix.lower(),
+                file_extension=suffix,
+                created_at=created_at or datetime.now(),
                 modified_at=None,  # Will be populated by media parser if needed
             )
 
-            # Create MediaFile
-            media_file = MediaFile(
+            # Create MediaFile, storing the status as its value the way
+            # use_enum_values does for validated instances
+            media_file = MediaFile.model_construct(
                 info=media_file_info,
-                processing_status=ProcessingStatus.SCANNING,
+                processing_status=ProcessingStatus.SCANNING.value,
             )
 
             logger.debug(
@@ -306,62 +681,70 @@ class MediaFileScanner:
             logger.error("Error analyzing file", file_path=str(file_path), error=str(e))
             return None
 
-    def _is_potential_media_file(self, file_path: Path) -> bool:
-        """Quick check if file might be a media file based on extension."""
-        return (
-            is_video_file(file_path)
-            or is_subtitle_file(file_path)
-            or is_image_file(file_path)
-        )
+    async def _verify_media_file(
+        self,
+        file_path: Path,
+        stat_result: os.stat_result | None = None,
+        cached_mimes: dict[bytes, str] | None = None,
+    ) -> bool:
+        """Verify file is actually a media file using magic numbers.
 
-    async def _verify_media_file(self, file_path: Path) -> bool:
-        """Verify file is actually a media file using magic numbers."""
+        Args:
+            file_path: Path to the file
+            stat_result: Stat result used to look up the persistent MIME cache
+            cached_mimes: Entries already looked up from the MIME cache;
+                queried on a worker thread if omitted
+        """
         try:
-            # Read first few bytes to check magic numbers
-            async with aiofiles.open(file_path, "rb") as f:
-                header = await f.read(2048)
+            cache_key = None
+            mime_type = None
+            if self.mime_cache is not None and stat_result is not None:
+                cache_key = MimeCache.make_key(file_path, stat_result)
+                if cached_mimes is None:
+                    cached_mimes = await asyncio.to_thread(
+                        self.mime_cache.get_many, [cache_key]
+                    )
+                mime_type = cached_mimes.get(cache_key)
 
-            if not header:
-                return False
+            if mime_type is None:
+                # Read first few bytes to check magic numbers
+                header = await asyncio.to_thread(_read_header, file_path)
 
-            # Use python-magic to get MIME type
-            try:
-                mime_type = self.magic_mime.from_buffer(header)
-
-                # Check if it's a video/audio/image MIME type
-                media_mimes = [
-                    "video/",
-                    "audio/",
-                    "image/",
-                    "application/ogg",  # OGG containers
-                    "application/x-matroska",  # MKV files
-                ]
-
-                is_media = any(mime_type.startswith(prefix) for prefix in media_mimes)
-
-                if is_media:
-                    logger.debug(
-                        "File verified as media",
-                        file_path=str(file_path),
-                        mime_type=mime_type,
-                    )
-                else:
-                    logger.debug(
-                        "File not recognized as media",
+                if not header:
+                    return False
+
+                # Use python-magic to get MIME type
+                try:
+                    mime_type = _mime_for_header(self.magic_mime, header)
+                except Exception as e:
+                    logger.warning(
+                        "Cannot determine MIME type, assuming media file",
                         file_path=str(file_path),
-                        mime_type=mime_type,
+                        error=str(e),
                     )
+                    # Fallback to extension-based detection
+                    return is_video_file(file_path)
+
+                if cache_key is not None:
+                    self.mime_cache.put(cache_key, mime_type)
 
-                return is_media
+            # Check if it's a video/audio/image MIME type
+            is_media = mime_type.startswith(MEDIA_MIME_PREFIXES)
 
-            except Exception as e:
-                logger.warning(
-                    "Cannot determine MIME type, assuming media file",
+            if is_media:
+                logger.debug(
+                    "File verified as media",
+                    file_path=str(file_path),
+                    mime_type=mime_type,
+                )
+            else:
+                logger.debug(
+                    "File not recognized as media",
                     file_path=str(file_path),
-                    error=str(e),
+                    mime_type=mime_type,
                 )
-                # Fallback to extension-based detection
-                return is_video_file(file_path)
+
+            return is_media
 
         except Exception as e:
             logger.error(
@@ -378,14 +761,20 @@ class MediaFileScanner:
         Returns:
             MediaFile if the file is a valid media file, None otherwise
         """
-        if not await aiofiles.os.path.exists(file_path):
+        if not file_path.exists():
             raise InvalidDirectoryError(f"File not found: {file_path}")
 
-        if not await aiofiles.os.path.isfile(file_path):
+        if not file_path.is_file():
             raise InvalidDirectoryError(f"Path is not a file: {file_path}")
 
         logger.info("Scanning single file", file_path=str(file_path))
-        return await self._analyze_file(file_path)
+        stat_result = file_path.stat()
+        media_file = await self._analyze_file(file_path, stat_result)
+
+        if self.mime_cache is not None:
+            await asyncio.to_thread(self.mime_cache.flush)
+
+        return media_file
 
     async def get_directory_stats(self, directory: Path) -> dict[str, int]:
         """Get statistics about a directory.
@@ -396,37 +785,18 @@ class MediaFileScanner:
         Returns:
             Dictionary with directory statistics
         """
-        if not await aiofiles.os.path.exists(directory):
+        if not directory.exists():
             raise InvalidDirectoryError(f"Directory not found: {directory}")
 
-        stats = {
-            "total_files": 0,
-            "video_files": 0,
-            "subtitle_files": 0,
-            "image_files": 0,
-            "other_files": 0,
-            "total_size": 0,
-        }
-
-        async for file_path in self._discover_files(directory, recursive=True):
-            try:
-                file_info = await get_file_info(file_path)
-                stats["total_files"] += 1
-                stats["total_size"] += file_info["size"]
-
-                if is_video_file(file_path):
-                    stats["video_files"] += 1
-                elif is_subtitle_file(file_path):
-                    stats["subtitle_files"] += 1
-                elif is_image_file(file_path):
-                    stats["image_files"] += 1
-                else:
-                    stats["other_files"] += 1
-
-            except Exception as e:
-                logger.warning(
-                    "Error getting file stats", file_path=str(file_path), error=str(e)
-                )
+        try:
+            # Count everything in one worker thread from the walk's own stat
+            # results instead of dispatching a stat call per file
+            stats = await asyncio.to_thread(_count_directory, directory)
+        except OSError as e:
+            logger.error(
+                "Error discovering files", directory=str(directory), error=str(e)
+            )
+            raise ScannerError(f"Cannot scan directory {directory}: {e}") from e
 
         logger.info("Directory stats calculated", directory=str(directory), stats=stats)
         return stats
@@ -9,8 +9,9 @@ from __future__ import annotations
 from enum import Enum
 import logging
 from pathlib import Path
+import re
 
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, model_validator, validator
 from pydantic_settings import BaseSettings
 
 
@@ -159,6 +160,11 @@ class Settings(BaseSettings):
         env="SKIP_PATTERNS",
         description="Skip files with these patterns",
     )
+    verify_mime: bool = Field(
+        default=True,
+        env="VERIFY_MIME",
+        description="Verify files with ambiguous extensions by their magic numbers",
+    )
 
     # Output Configuration
     create_info_files: bool = Field(
@@ -218,6 +224,11 @@ class Settings(BaseSettings):
         description="Test data directory for development",
     )
 
+    # Lookup tables derived from the file processing settings
+    _video_extension_set: frozenset[str] = PrivateAttr(default=frozenset())
+    _skip_pattern: re.Pattern[str] | None = PrivateAttr(default=None)
+    _file_size_limits: tuple[int, int | None] = PrivateAttr(default=(0, None))
+
     class Config:
         """Pydantic configuration."""
 
@@ -255,28 +266,41 @@ class Settings(BaseSettings):
             return None
         return Path(v)
 
+    @model_validator(mode="after")
+    def build_file_lookups(self) -> Settings:
+        """Precompute file matching lookups (re-run on validated assignment)."""
+        self._video_extension_set = frozenset(
+            ext.lower() for ext in self.video_extensions
+        )
+        self._skip_pattern = (
+            re.compile("|".join(re.escape(p.lower()) for p in self.skip_patterns))
+            if self.skip_patterns
+            else None
+        )
+        max_size = None
+        if self.max_file_size_gb > 0:
+            max_size = self.max_file_size_gb * 1024 * 1024 * 1024
+        self._file_size_limits = (self.min_file_size_mb * 1024 * 1024, max_size)
+        return self
+
     def get_logging_level(self) -> int:
         """Get Python logging level from enum."""
         return getattr(logging, self.log_level.value)
 
     def is_video_file(self, file_path: Path) -> bool:
         """Check if file is a supported video file."""
-        return file_path.suffix.lower() in [
-            ext.lower() for ext in self.video_extensions
-        ]
+        return file_path.suffix.lower() in self._video_extension_set
 
     def should_skip_file(self, file_path: Path) -> bool:
         """Check if file should be skipped based on patterns."""
-        filename = file_path.name.lower()
-        return any(pattern.lower() in filename for pattern in self.skip_patterns)
+        return (
+            self._skip_pattern is not None
+            and self._skip_pattern.search(file_path.name.lower()) is not None
+        )
 
     def get_file_size_limits(self) -> tuple[int, int | None]:
         """Get file size limits in bytes."""
-        min_size = self.min_file_size_mb * 1024 * 1024
-        max_size = None
-        if self.max_file_size_gb > 0:
-            max_size = self.max_file_size_gb * 1024 * 1024 * 1024
-        return min_size, max_size
+        return self._file_size_limits
 
 
 # Global settings instance (lazy initialization)
@@ -6,15 +6,112 @@ media files and their technical information.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Final, TypeVar
+
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_serializer,
+)
+
+_FastEnumT = TypeVar("_FastEnumT", bound="FastEnum")
+
+# Display names for common audio channel counts
+_CHANNEL_LAYOUTS: Final[dict[int, str]] = {
+    1: "1.0 (Mono)",
+    2: "2.0 (Stereo)",
+    6: "5.1 (Surround)",
+    8: "7.1 (Surround)",
+}
+
+
+class FastEnum(str, Enum):
+    """String enumeration with a non-raising lookup by value."""
+
+    @classmethod
+    def from_value(
+        cls: type[_FastEnumT], value: str, default: _FastEnumT | None = None
+    ) -> _FastEnumT | None:
+        """Get the member for a value without going through ``Enum.__call__``.
+
+        Args:
+            value: Member value to look up
+            default: Member returned for unknown values; defaults to the
+                enumeration's ``UNKNOWN`` member, if it has one
+
+        Returns:
+            Matching member, or the default for unknown values
+        """
+        member = cls._value2member_map_.get(value)
+        if member is not None:
+            return member  # type: ignore[return-value]
+        if default is not None:
+            return default
+        return cls.__members__.get("UNKNOWN")
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(duration_seconds: int) -> str:
+    """Format a duration as HH:MM:SS, memoized since durations repeat."""
+    hours, remainder = divmod(duration_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+@lru_cache(maxsize=256)
+def _format_dimensions(width: int, height: int) -> str:
+    """Format frame dimensions as WxH, memoized since a library has few sizes."""
+    return f"{width}x{height}"
+
+
+class CachedPropertyModel(BaseModel):
+    """Base model whose ``cached_property`` values are reset on field changes.
+
+    Derived values are computed once per instance; assigning a field or
+    copying the model drops every cached value so none of them go stale.
+    """
+
+    _cached_property_names: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._cached_property_names = tuple(
+            {
+                name
+                for klass in cls.__mro__
+                for name, attr in vars(klass).items()
+                if isinstance(attr, cached_property)
+            }
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._clear_cached_properties()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> CachedPropertyModel:
+        """Copy the model without carrying over cached derived values."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._clear_cached_properties()
+        return copied
 
-from pydantic import BaseModel, Field, computed_field
+    def _clear_cached_properties(self) -> None:
+        """Drop all cached derived values."""
+        for name in self._cached_property_names:
+            self.__dict__.pop(name, None)
 
 
-class VideoCodec(str, Enum):
+class VideoCodec(FastEnum):
     """Video codec enumeration."""
 
     H264 = "h264"
@@ -28,7 +125,7 @@ class VideoCodec(str, Enum):
     UNKNOWN = "unknown"
 
 
-class AudioCodec(str, Enum):
+class AudioCodec(FastEnum):
     """Audio codec enumeration."""
 
     AAC = "aac"
@@ -42,7 +139,7 @@ class AudioCodec(str, Enum):
     UNKNOWN = "unknown"
 
 
-class VideoResolution(str, Enum):
+class VideoResolution(FastEnum):
     """Video resolution enumeration."""
 
     SD_480P = "480p"
@@ -54,7 +151,7 @@ class VideoResolution(str, Enum):
     UNKNOWN = "unknown"
 
 
-class VideoFormat(str, Enum):
+class VideoFormat(FastEnum):
     """Video source format enumeration."""
 
     BLURAY = "BluRay"
@@ -69,7 +166,43 @@ class VideoFormat(str, Enum):
     UNKNOWN = "unknown"
 
 
-class MediaFileInfo(BaseModel):
+# Parser records: built once per file on the hot path, so these are plain
+# slotted dataclasses rather than validated models. They are frozen because
+# the parser's cache hands the same instances to every caller.
+@dataclass(frozen=True, slots=True)
+class VideoTrackInfo:
+    """Technical details read from a file's video track."""
+
+    codec: VideoCodec = VideoCodec.UNKNOWN
+    resolution: VideoResolution = VideoResolution.UNKNOWN
+    width: int | None = None
+    height: int | None = None
+    bitrate: int | None = None
+    fps: float | None = None
+    bit_depth: int | None = None
+    format: VideoFormat = VideoFormat.UNKNOWN
+
+
+@dataclass(frozen=True, slots=True)
+class AudioTrackInfo:
+    """Technical details read from a file's audio track."""
+
+    codec: AudioCodec = AudioCodec.UNKNOWN
+    channels: int | None = None
+    sample_rate: int | None = None
+    bitrate: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class GeneralTrackInfo:
+    """Container-level details read from a file's general track."""
+
+    duration: int | None = None
+    file_size: int | None = None
+    container: str | None = None
+
+
+class MediaFileInfo(CachedPropertyModel):
     """Technical information about a media file."""
 
     # File information
@@ -128,79 +261,86 @@ class MediaFileInfo(BaseModel):
         """Pydantic configuration."""
 
         use_enum_values = True
-        json_encoders = {Path: str, datetime: lambda v: v.isoformat()}
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def filename(self) -> str:
         """Get the filename without path."""
         return self.file_path.name
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def file_size_mb(self) -> float:
         """Get file size in megabytes."""
         return self.file_size / (1024 * 1024)
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def file_size_gb(self) -> float:
         """Get file size in gigabytes."""
         return self.file_size / (1024 * 1024 * 1024)
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def duration_formatted(self) -> str:
         """Get formatted duration string (HH:MM:SS)."""
         if self.duration_seconds is None:
             return "Unknown"
-
-        hours, remainder = divmod(self.duration_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return _format_duration(self.duration_seconds)
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def resolution_display(self) -> str:
         """Get display-friendly resolution string."""
         if self.video_width and self.video_height:
-            return f"{self.video_width}x{self.video_height}"
-        return self.video_resolution.value
+            return _format_dimensions(self.video_width, self.video_height)
+        # use_enum_values stores validated input as the plain string value
+        return VideoResolution.from_value(self.video_resolution).value
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def audio_channels_display(self) -> str:
         """Get display-friendly audio channels string."""
         if self.audio_channels is None:
             return "Unknown"
 
-        channel_map = {
-            1: "1.0 (Mono)",
-            2: "2.0 (Stereo)",
-            6: "5.1 (Surround)",
-            8: "7.1 (Surround)",
-        }
-
-        return channel_map.get(self.audio_channels, f"{self.audio_channels}.0")
+        return _CHANNEL_LAYOUTS.get(self.audio_channels, f"{self.audio_channels}.0")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary with computed fields."""
-        data = self.model_dump()
-        # Add computed fields
-        data.update(
-            {
-                "filename": self.filename,
-                "file_size_mb": self.file_size_mb,
-                "file_size_gb": self.file_size_gb,
-                "duration_formatted": self.duration_formatted,
-                "resolution_display": self.resolution_display,
-                "audio_channels_display": self.audio_channels_display,
-            }
-        )
-        return data
+        # model_dump already serializes every computed field
+        return self.model_dump()
+
+
+# Validates whole batches of MediaFileInfo records in one pydantic-core call
+_MEDIA_FILE_INFO_BATCH: TypeAdapter[list[MediaFileInfo]] = TypeAdapter(
+    list[MediaFileInfo]
+)
+
+
+def parse_media_file_infos(
+    data: str | bytes | Iterable[dict[str, Any]],
+) -> list[MediaFileInfo]:
+    """Validate a batch of media file records in a single pass.
+
+    JSON input is decoded and validated together without building
+    intermediate Python dicts.
 
+    Args:
+        data: JSON array of records, or already decoded records
 
-class ProcessingStatus(str, Enum):
+    Returns:
+        Validated MediaFileInfo objects in input order
+
+    Raises:
+        ValidationError: If any record is invalid
+    """
+    if isinstance(data, str | bytes):
+        return _MEDIA_FILE_INFO_BATCH.validate_json(data)
+    return _MEDIA_FILE_INFO_BATCH.validate_python(list(data))
+
+
+class ProcessingStatus(FastEnum):
     """Processing status enumeration."""
 
     PENDING = "pending"
@@ -213,6 +353,12 @@ class ProcessingStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+# Statuses that finish processing and stamp ``processed_at``
+_TERMINAL_STATUSES: Final[frozenset[ProcessingStatus]] = frozenset(
+    {ProcessingStatus.COMPLETED, ProcessingStatus.FAILED}
+)
+
+
 class MediaFile(BaseModel):
     """Complete media file representation with processing status."""
 
@@ -242,7 +388,6 @@ class MediaFile(BaseModel):
         """Pydantic configuration."""
 
         use_enum_values = True
-        json_encoders = {Path: str, datetime: lambda v: v.isoformat()}
 
     @computed_field  # type: ignore
     @property
@@ -272,19 +417,15 @@ class MediaFile(BaseModel):
         """Update processing status and timestamp."""
         self.processing_status = status
         self.error_message = error
-        if status in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED):
+        if status in _TERMINAL_STATUSES:
             self.processed_at = datetime.now()
 
+    @field_serializer("file_path")
+    def serialize_file_path(self, file_path: Path) -> str:
+        """Serialize the convenience file path as a string."""
+        return str(file_path)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary with computed fields."""
-        data = self.model_dump()
-        # Add computed fields
-        data.update(
-            {
-                "is_processed": self.is_processed,
-                "has_error": self.has_error,
-                "file_path": str(self.file_path),
-                "filename": self.filename,
-            }
-        )
-        return data
+        # model_dump already serializes every computed field
+        return self.model_dump()
@@ -6,22 +6,45 @@ including TMDB metadata and AI identification results.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import date, datetime
-from typing import Any
+from functools import cached_property, lru_cache
+import heapq
+from operator import attrgetter
+from typing import Any, Final
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, SkipValidation, computed_field
+from pydantic.dataclasses import dataclass
 
-from smart_media_organizer.models.media_file import MediaFile
+from smart_media_organizer.models.media_file import CachedPropertyModel, MediaFile
 
+# Crew job titles counted as directors
+_DIRECTOR_JOBS: Final[frozenset[str]] = frozenset({"Director"})
 
-class MovieGenre(BaseModel):
+# Attribute getters shared by the TMDB list projections
+_get_name = attrgetter("name")
+_get_order = attrgetter("order")
+
+
+@lru_cache(maxsize=1024)
+def _format_runtime(runtime: int) -> str:
+    """Format a runtime in minutes as "Xh Ym", memoized since runtimes repeat."""
+    hours, minutes = divmod(runtime, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+@dataclass(slots=True, frozen=True)
+class MovieGenre:
     """Movie genre information."""
 
     id: int = Field(..., description="TMDB genre ID")
     name: str = Field(..., description="Genre name")
 
 
-class MovieCast(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MovieCast:
     """Movie cast member information."""
 
     id: int = Field(..., description="TMDB person ID")
@@ -31,7 +54,8 @@ class MovieCast(BaseModel):
     profile_path: str | None = Field(default=None, description="Profile image path")
 
 
-class MovieCrew(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MovieCrew:
     """Movie crew member information."""
 
     id: int = Field(..., description="TMDB person ID")
@@ -41,7 +65,8 @@ class MovieCrew(BaseModel):
     profile_path: str | None = Field(default=None, description="Profile image path")
 
 
-class MovieCollection(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MovieCollection:
     """Movie collection information."""
 
     id: int = Field(..., description="TMDB collection ID")
@@ -52,7 +77,8 @@ class MovieCollection(BaseModel):
     )
 
 
-class ProductionCompany(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProductionCompany:
     """Production company information."""
 
     id: int = Field(..., description="TMDB company ID")
@@ -61,7 +87,8 @@ class ProductionCompany(BaseModel):
     origin_country: str = Field(..., description="Origin country")
 
 
-class SpokenLanguage(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SpokenLanguage:
     """Spoken language information."""
 
     iso_639_1: str = Field(..., description="ISO 639-1 language code")
@@ -86,7 +113,10 @@ class AIMovieIdentification(BaseModel):
     processing_time: float = Field(
         ..., ge=0.0, description="Processing time in seconds"
     )
-    raw_response: dict[str, Any] = Field(..., description="Raw AI response")
+    # Stored as received; the provider payload is free-form and never inspected
+    raw_response: SkipValidation[dict[str, Any]] = Field(
+        ..., description="Raw AI response"
+    )
 
     # Processing metadata
     identified_at: datetime = Field(
@@ -105,13 +135,8 @@ class AIMovieIdentification(BaseModel):
         """Check if year information is available."""
         return self.year is not None
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
-
-class TMDBMovieInfo(BaseModel):
+class TMDBMovieInfo(CachedPropertyModel):
     """TMDB movie information."""
 
     # Core movie information
@@ -166,53 +191,62 @@ class TMDBMovieInfo(BaseModel):
     )
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def release_year(self) -> int | None:
         """Get release year."""
         return self.release_date.year if self.release_date else None
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def runtime_formatted(self) -> str:
         """Get formatted runtime string."""
         if not self.runtime:
             return "Unknown"
-        hours, minutes = divmod(self.runtime, 60)
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        return f"{minutes}m"
+        return _format_runtime(self.runtime)
+
+    @cached_property
+    def _crew_by_job(self) -> dict[str, list[MovieCrew]]:
+        """Index crew members by job title."""
+        index: dict[str, list[MovieCrew]] = {}
+        for member in self.crew:
+            index.setdefault(member.job, []).append(member)
+        return index
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def directors(self) -> list[MovieCrew]:
         """Get list of directors."""
-        return [member for member in self.crew if member.job == "Director"]
+        return [
+            member
+            for job in _DIRECTOR_JOBS
+            for member in self._crew_by_job.get(job, ())
+        ]
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def director_names(self) -> list[str]:
         """Get list of director names."""
-        return [director.name for director in self.directors]
+        return list(map(_get_name, self.directors))
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def main_cast(self) -> list[MovieCast]:
         """Get main cast (first 10 members)."""
-        return sorted(self.cast, key=lambda x: x.order)[:10]
+        return heapq.nsmallest(10, self.cast, key=_get_order)
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def genre_names(self) -> list[str]:
         """Get list of genre names."""
-        return [genre.name for genre in self.genres]
+        return list(map(_get_name, self.genres))
 
-    class Config:
-        """Pydantic configuration."""
+    def iter_director_names(self) -> Iterator[str]:
+        """Iterate director names without building the name list."""
+        return map(_get_name, self.directors)
 
-        json_encoders = {
-            date: lambda v: v.isoformat(),
-            datetime: lambda v: v.isoformat(),
-        }
+    def iter_genre_names(self) -> Iterator[str]:
+        """Iterate genre names without building the name list."""
+        return map(_get_name, self.genres)
 
 
 class Movie(BaseModel):
@@ -241,25 +275,45 @@ class Movie(BaseModel):
         default_factory=datetime.now, description="Last update timestamp"
     )
 
+    def _resolve_identity(self) -> tuple[str | None, int | None, bool]:
+        """Resolve title, year and completeness in one pass over the sources.
+
+        Returns:
+            Tuple of (best title, best year, is complete)
+        """
+        tmdb_info = self.tmdb_info
+        ai_identification = self.ai_identification
+
+        title = None
+        year = None
+        if tmdb_info:
+            title = tmdb_info.original_title or tmdb_info.title
+            year = tmdb_info.release_year
+        if ai_identification:
+            if not tmdb_info:
+                title = ai_identification.best_title
+            if not year:
+                year = ai_identification.year or None
+
+        complete = (
+            ai_identification is not None
+            and tmdb_info is not None
+            and title is not None
+            and year is not None
+        )
+        return title, year, complete
+
     @computed_field  # type: ignore
     @property
     def best_title(self) -> str | None:
         """Get the best available title from all sources."""
-        if self.tmdb_info:
-            return self.tmdb_info.original_title or self.tmdb_info.title
-        if self.ai_identification:
-            return self.ai_identification.best_title
-        return None
+        return self._resolve_identity()[0]
 
     @computed_field  # type: ignore
     @property
     def best_year(self) -> int | None:
         """Get the best available year from all sources."""
-        if self.tmdb_info and self.tmdb_info.release_year:
-            return self.tmdb_info.release_year
-        if self.ai_identification and self.ai_identification.year:
-            return self.ai_identification.year
-        return None
+        return self._resolve_identity()[1]
 
     @computed_field  # type: ignore
     @property
@@ -277,44 +331,28 @@ class Movie(BaseModel):
     @property
     def is_complete(self) -> bool:
         """Check if movie has complete information for organization."""
-        return (
-            self.ai_identification is not None
-            and self.tmdb_info is not None
-            and self.best_title is not None
-            and self.best_year is not None
-        )
+        return self._resolve_identity()[2]
 
     @computed_field  # type: ignore
     @property
     def formatted_title(self) -> str:
         """Get formatted title for filename generation."""
-        title = self.best_title or "Unknown Movie"
-        year = self.best_year
+        title, year, _ = self._resolve_identity()
+        title = title or "Unknown Movie"
         if year:
             return f"{title} ({year})"
         return title
 
-    def update_timestamp(self) -> None:
-        """Update the last modified timestamp."""
-        self.updated_at = datetime.now()
+    def update_timestamp(self, now: datetime | None = None) -> None:
+        """Update the last modified timestamp.
+
+        Args:
+            now: Timestamp to record; batch updates can pass one shared value
+                instead of reading the clock per item
+        """
+        self.updated_at = now or datetime.now()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary with computed fields."""
-        data = self.model_dump()
-        # Add computed fields
-        data.update(
-            {
-                "best_title": self.best_title,
-                "best_year": self.best_year,
-                "imdb_id": self.imdb_id,
-                "tmdb_id": self.tmdb_id,
-                "is_complete": self.is_complete,
-                "formatted_title": self.formatted_title,
-            }
-        )
-        return data
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat()}
+        # model_dump already serializes every computed field
+        return self.model_dump()
@@ -6,22 +6,75 @@ seasons, episodes, and related metadata.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime
-from typing import Any
+from functools import cached_property, lru_cache
+import heapq
+from operator import attrgetter
+from typing import Any, Final, TypeVar
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import (
+    BaseModel,
+    Field,
+    SkipValidation,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
+from pydantic.dataclasses import dataclass
 
-from smart_media_organizer.models.media_file import MediaFile
+from smart_media_organizer.models.media_file import CachedPropertyModel, MediaFile
 
+_RecordT = TypeVar("_RecordT")
 
-class TVGenre(BaseModel):
+# Crew job titles counted as show creators
+_CREATOR_JOBS: Final[frozenset[str]] = frozenset({"Creator", "Executive Producer"})
+
+# Attribute getters shared by the TMDB list projections
+_get_name = attrgetter("name")
+_get_order = attrgetter("order")
+
+
+@lru_cache(maxsize=4096)
+def _format_episode_code(season: int, episode: int) -> str:
+    """Format an episode code (e.g., S01E05), memoized since codes repeat."""
+    return f"S{season:02d}E{episode:02d}"
+
+
+@lru_cache(maxsize=1024)
+def _format_runtime(runtime: int) -> str:
+    """Format a runtime in minutes as "Xh Ym", memoized since runtimes repeat."""
+    hours, minutes = divmod(runtime, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+@lru_cache(maxsize=4096)
+def _shared_record(record: _RecordT) -> _RecordT:
+    """Return the first-seen instance equal to a frozen TMDB record.
+
+    Recurring actors, crew, genres and networks then share one object
+    across every show and episode that lists them.
+    """
+    return record
+
+
+def _share_records(records: list[_RecordT]) -> list[_RecordT]:
+    """Swap each record in a validated list for its shared instance."""
+    return list(map(_shared_record, records))
+
+
+@dataclass(slots=True, frozen=True)
+class TVGenre:
     """TV show genre information."""
 
     id: int = Field(..., description="TMDB genre ID")
     name: str = Field(..., description="Genre name")
 
 
-class TVCast(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TVCast:
     """TV show cast member information."""
 
     id: int = Field(..., description="TMDB person ID")
@@ -32,7 +85,8 @@ class TVCast(BaseModel):
     profile_path: str | None = Field(default=None, description="Profile image path")
 
 
-class TVCrew(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TVCrew:
     """TV show crew member information."""
 
     id: int = Field(..., description="TMDB person ID")
@@ -43,7 +97,8 @@ class TVCrew(BaseModel):
     profile_path: str | None = Field(default=None, description="Profile image path")
 
 
-class Network(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Network:
     """TV network information."""
 
     id: int = Field(..., description="TMDB network ID")
@@ -52,7 +107,8 @@ class Network(BaseModel):
     origin_country: str = Field(..., description="Origin country")
 
 
-class Season(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Season:
     """TV season information."""
 
     id: int = Field(..., description="TMDB season ID")
@@ -63,11 +119,6 @@ class Season(BaseModel):
     episode_count: int = Field(..., ge=0, description="Number of episodes")
     poster_path: str | None = Field(default=None, description="Season poster path")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {date: lambda v: v.isoformat()}
-
 
 class Episode(BaseModel):
     """TV episode information."""
@@ -89,11 +140,17 @@ class Episode(BaseModel):
     cast: list[TVCast] = Field(default_factory=list, description="Episode cast")
     crew: list[TVCrew] = Field(default_factory=list, description="Episode crew")
 
+    @field_validator("cast", "crew")
+    @classmethod
+    def share_people(cls, v: list[_RecordT]) -> list[_RecordT]:
+        """Reuse shared instances of recurring cast and crew records."""
+        return _share_records(v)
+
     @computed_field  # type: ignore
     @property
     def episode_code(self) -> str:
         """Get standard episode code (e.g., S01E05)."""
-        return f"S{self.season_number:02d}E{self.episode_number:02d}"
+        return _format_episode_code(self.season_number, self.episode_number)
 
     @computed_field  # type: ignore
     @property
@@ -101,15 +158,7 @@ class Episode(BaseModel):
         """Get formatted runtime string."""
         if not self.runtime:
             return "Unknown"
-        hours, minutes = divmod(self.runtime, 60)
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        return f"{minutes}m"
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {date: lambda v: v.isoformat()}
+        return _format_runtime(self.runtime)
 
 
 class AITVIdentification(BaseModel):
@@ -142,7 +191,10 @@ class AITVIdentification(BaseModel):
     processing_time: float = Field(
         ..., ge=0.0, description="Processing time in seconds"
     )
-    raw_response: dict[str, Any] = Field(..., description="Raw AI response")
+    # Stored as received; the provider payload is free-form and never inspected
+    raw_response: SkipValidation[dict[str, Any]] = Field(
+        ..., description="Raw AI response"
+    )
 
     # Processing metadata
     identified_at: datetime = Field(
@@ -166,7 +218,7 @@ class AITVIdentification(BaseModel):
     def episode_code(self) -> str | None:
         """Get standard episode code if available."""
         if self.season_number is not None and self.episode_number is not None:
-            return f"S{self.season_number:02d}E{self.episode_number:02d}"
+            return _format_episode_code(self.season_number, self.episode_number)
         return None
 
     @computed_field  # type: ignore
@@ -179,13 +231,8 @@ class AITVIdentification(BaseModel):
             and self.best_show_title is not None
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
-
-class TMDBTVShowInfo(BaseModel):
+class TMDBTVShowInfo(CachedPropertyModel):
     """TMDB TV show information."""
 
     # Core show information
@@ -237,20 +284,26 @@ class TMDBTVShowInfo(BaseModel):
         default_factory=datetime.now, description="Data fetch timestamp"
     )
 
+    @field_validator("genres", "networks", "cast", "crew")
+    @classmethod
+    def share_records(cls, v: list[_RecordT]) -> list[_RecordT]:
+        """Reuse shared instances of recurring genre, network and people records."""
+        return _share_records(v)
+
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def start_year(self) -> int | None:
         """Get show start year."""
         return self.first_air_date.year if self.first_air_date else None
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def end_year(self) -> int | None:
         """Get show end year."""
         return self.last_air_date.year if self.last_air_date else None
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def year_range(self) -> str:
         """Get formatted year range."""
         start = self.start_year
@@ -262,7 +315,7 @@ class TMDBTVShowInfo(BaseModel):
         return "Unknown"
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def average_runtime(self) -> int | None:
         """Get average episode runtime."""
         if self.episode_run_time:
@@ -270,46 +323,89 @@ class TMDBTVShowInfo(BaseModel):
         return None
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def creators(self) -> list[TVCrew]:
-        """Get list of creators."""
-        return [
-            member
-            for member in self.crew
-            if member.job in ("Creator", "Executive Producer")
-        ]
+        """Get list of creators, without repeated credits."""
+        # Crew records are frozen and hashable, so equal credits collapse here
+        return list(
+            dict.fromkeys(member for member in self.crew if member.job in _CREATOR_JOBS)
+        )
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def creator_names(self) -> list[str]:
         """Get list of creator names."""
-        return [creator.name for creator in self.creators]
+        return list(map(_get_name, self.creators))
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def main_cast(self) -> list[TVCast]:
         """Get main cast (first 10 members)."""
-        return sorted(self.cast, key=lambda x: x.order)[:10]
+        return heapq.nsmallest(10, self.cast, key=_get_order)
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def genre_names(self) -> list[str]:
         """Get list of genre names."""
-        return [genre.name for genre in self.genres]
+        return list(map(_get_name, self.genres))
 
     @computed_field  # type: ignore
-    @property
+    @cached_property
     def network_names(self) -> list[str]:
         """Get list of network names."""
-        return [network.name for network in self.networks]
+        return list(map(_get_name, self.networks))
+
+
+# Validates whole batches of TMDB show payloads in one pydantic-core call
+_TMDB_TV_SHOW_BATCH: TypeAdapter[list[TMDBTVShowInfo]] = TypeAdapter(
+    list[TMDBTVShowInfo]
+)
 
-    class Config:
-        """Pydantic configuration."""
 
-        json_encoders = {
-            date: lambda v: v.isoformat(),
-            datetime: lambda v: v.isoformat(),
-        }
+def parse_tmdb_tv_shows(
+    data: str | bytes | Iterable[dict[str, Any]],
+) -> list[TMDBTVShowInfo]:
+    """Validate a batch of TMDB TV show payloads in a single pass.
+
+    JSON input is decoded and validated together, including the nested
+    genre, network, season, cast and crew records.
+
+    Args:
+        data: JSON array of show payloads, or already decoded payloads
+
+    Returns:
+        Validated TMDBTVShowInfo objects in input order
+
+    Raises:
+        ValidationError: If any payload is invalid
+    """
+    if isinstance(data, str | bytes):
+        return _TMDB_TV_SHOW_BATCH.validate_json(data)
+    return _TMDB_TV_SHOW_BATCH.validate_python(list(data))
+
+
+# Validates a season's episode payloads in one pydantic-core call
+_TMDB_EPISODE_BATCH: TypeAdapter[list[Episode]] = TypeAdapter(list[Episode])
+
+
+def parse_tmdb_episodes(
+    data: str | bytes | Iterable[dict[str, Any]],
+) -> list[Episode]:
+    """Validate a batch of TMDB episode payloads in a single pass.
+
+    Args:
+        data: JSON array of episode payloads (such as a season's
+            ``episodes`` list), or already decoded payloads
+
+    Returns:
+        Validated Episode objects in input order
+
+    Raises:
+        ValidationError: If any payload is invalid
+    """
+    if isinstance(data, str | bytes):
+        return _TMDB_EPISODE_BATCH.validate_json(data)
+    return _TMDB_EPISODE_BATCH.validate_python(list(data))
 
 
 class TVEpisode(BaseModel):
@@ -371,34 +467,36 @@ class TVEpisode(BaseModel):
             return self.ai_identification.show_year
         return None
 
+    def _resolve_numbers(self) -> tuple[int | None, int | None]:
+        """Resolve season and episode numbers from the best available source.
+
+        Returns:
+            Tuple of (season number, episode number)
+        """
+        source = self.episode_info or self.ai_identification
+        if source is None:
+            return None, None
+        return source.season_number, source.episode_number
+
     @computed_field  # type: ignore
     @property
     def season_number(self) -> int | None:
         """Get season number from best available source."""
-        if self.episode_info:
-            return self.episode_info.season_number
-        if self.ai_identification:
-            return self.ai_identification.season_number
-        return None
+        return self._resolve_numbers()[0]
 
     @computed_field  # type: ignore
     @property
     def episode_number(self) -> int | None:
         """Get episode number from best available source."""
-        if self.episode_info:
-            return self.episode_info.episode_number
-        if self.ai_identification:
-            return self.ai_identification.episode_number
-        return None
+        return self._resolve_numbers()[1]
 
     @computed_field  # type: ignore
     @property
     def episode_code(self) -> str | None:
         """Get standard episode code."""
-        season = self.season_number
-        episode = self.episode_number
+        season, episode = self._resolve_numbers()
         if season is not None and episode is not None:
-            return f"S{season:02d}E{episode:02d}"
+            return _format_episode_code(season, episode)
         return None
 
     @computed_field  # type: ignore
@@ -417,12 +515,13 @@ class TVEpisode(BaseModel):
     @property
     def is_complete(self) -> bool:
         """Check if episode has complete information for organization."""
+        if self.ai_identification is None or self.show_info is None:
+            return False
+        season, episode = self._resolve_numbers()
         return (
-            self.ai_identification is not None
-            and self.show_info is not None
-            and self.best_show_title is not None
-            and self.season_number is not None
-            and self.episode_number is not None
+            self.best_show_title is not None
+            and season is not None
+            and episode is not None
         )
 
     @computed_field  # type: ignore
@@ -437,31 +536,54 @@ class TVEpisode(BaseModel):
             return f"{show_title} {episode_code} - {episode_title}"
         return f"{show_title} {episode_code}"
 
-    def update_timestamp(self) -> None:
-        """Update the last modified timestamp."""
-        self.updated_at = datetime.now()
+    def update_timestamp(self, now: datetime | None = None) -> None:
+        """Update the last modified timestamp.
+
+        Args:
+            now: Timestamp to record; batch updates can pass one shared value
+                instead of reading the clock per item
+        """
+        self.updated_at = now or datetime.now()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary with computed fields."""
-        data = self.model_dump()
-        # Add computed fields
-        data.update(
-            {
-                "best_show_title": self.best_show_title,
-                "best_episode_title": self.best_episode_title,
-                "best_year": self.best_year,
-                "season_number": self.season_number,
-                "episode_number": self.episode_number,
-                "episode_code": self.episode_code,
-                "tmdb_show_id": self.tmdb_show_id,
-                "tmdb_episode_id": self.tmdb_episode_id,
-                "is_complete": self.is_complete,
-                "formatted_title": self.formatted_title,
-            }
-        )
-        return data
+        # model_dump already serializes every computed field
+        return self.model_dump()
+
+
+# Serializes and validates whole episode lists in one pydantic-core call
+_TV_EPISODE_BATCH: TypeAdapter[list[TVEpisode]] = TypeAdapter(list[TVEpisode])
+
+
+def dump_tv_episodes_json(episodes: Iterable[TVEpisode]) -> bytes:
+    """Serialize a batch of episodes to a JSON array in a single pass.
+
+    Args:
+        episodes: Episodes to serialize
+
+    Returns:
+        UTF-8 encoded JSON array, one object per episode in input order
+    """
+    return _TV_EPISODE_BATCH.dump_json(list(episodes))
+
+
+def parse_tv_episodes(
+    data: str | bytes | Iterable[dict[str, Any]],
+) -> list[TVEpisode]:
+    """Validate a batch of episode records in a single pass.
+
+    Accepts the output of :func:`dump_tv_episodes_json`; computed fields in
+    the records are ignored and derived again on the rebuilt episodes.
+
+    Args:
+        data: JSON array of episode records, or already decoded records
 
-    class Config:
-        """Pydantic configuration."""
+    Returns:
+        Validated TVEpisode objects in input order
 
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    Raises:
+        ValidationError: If any record is invalid
+    """
+    if isinstance(data, str | bytes):
+        return _TV_EPISODE_BATCH.validate_json(data)
+    return _TV_EPISODE_BATCH.validate_python(list(data))
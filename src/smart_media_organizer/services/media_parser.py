@@ -7,27 +7,316 @@ technical information like resolution, codecs, bitrates, and duration.
 from __future__ import annotations
 
 import asyncio
-import hashlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+from functools import lru_cache
+import json
+import os
 from pathlib import Path
-from typing import Any
+import re
+import threading
+from types import SimpleNamespace
+from typing import Any, Final
 
-import aiofiles
 from pymediainfo import MediaInfo
 import structlog
 
 from smart_media_organizer.models.media_file import (
     AudioCodec,
+    AudioTrackInfo,
+    GeneralTrackInfo,
     MediaFile,
     MediaFileInfo,
     ProcessingStatus,
     VideoCodec,
     VideoFormat,
     VideoResolution,
+    VideoTrackInfo,
+)
+from smart_media_organizer.utils.batch_stat import batch_stat
+from smart_media_organizer.utils.file_ops import (
+    DEFAULT_HASH_ALGORITHM,
+    calculate_file_hash,
 )
 from smart_media_organizer.utils.retry import retry_file_operation
 
 logger = structlog.get_logger(__name__)
 
+# MediaInfo.parse spends its time inside libmediainfo, which ctypes calls
+# with the GIL released, so parses run in parallel on a dedicated pool
+# instead of competing with other work on the loop's default executor
+PARSE_WORKERS = os.cpu_count() or 1
+_parse_executor = ThreadPoolExecutor(
+    max_workers=PARSE_WORKERS, thread_name_prefix="mediainfo"
+)
+
+# Files verified at once by verify_media_files; keeps the parse pool's
+# queue short instead of holding a task and open handles for every file
+VERIFY_CONCURRENCY = min(32, PARSE_WORKERS * 4)
+
+# Files MediaFileParser.parse_many keeps in flight: one parsing on each pool
+# worker plus one queued behind it, so workers never wait on the loop
+PARSE_PIPELINE_DEPTH = PARSE_WORKERS * 2
+
+# Files whose extracted info each MediaInfoExtractor keeps for re-parses
+PARSE_CACHE_SIZE = 10_000
+
+# Video, audio and general info extracted from one file
+ExtractedInfo = tuple[VideoTrackInfo, AudioTrackInfo, GeneralTrackInfo]
+
+# Track types the extractors read; classification stops once all are found
+_PRIMARY_TRACK_TYPES: Final[frozenset[str]] = frozenset({"General", "Video", "Audio"})
+
+# Parse error messages that point at a damaged file rather than an
+# unsupported format
+_CORRUPTION_PATTERN: Final = re.compile(
+    r"corrupt|invalid|damaged|truncated|malformed", re.IGNORECASE
+)
+
+# Files smaller than this cannot hold a playable stream and are not parsed
+MIN_MEDIA_FILE_SIZE = 1024
+
+# Leading bytes read to check a file's container signature before parsing
+SNIFF_SIZE = 32
+
+# Container signatures as (offset, bytes) per extension; a file whose header
+# matches none of its extension's signatures is not handed to MediaInfo.
+# Extensions without an entry (e.g. MPEG streams) are not sniffed.
+_MP4_SIGNATURES: Final = tuple(
+    (4, atom) for atom in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip")
+)
+_CONTAINER_SIGNATURES: Final[dict[str, tuple[tuple[int, bytes], ...]]] = {
+    ".mp4": _MP4_SIGNATURES,
+    ".m4v": _MP4_SIGNATURES,
+    ".mov": _MP4_SIGNATURES,
+    ".3gp": _MP4_SIGNATURES,
+    ".mkv": ((0, b"\x1a\x45\xdf\xa3"),),
+    ".webm": ((0, b"\x1a\x45\xdf\xa3"),),
+    ".avi": ((0, b"RIFF"),),
+    ".ogv": ((0, b"OggS"),),
+    ".flv": ((0, b"FLV"),),
+    ".wmv": ((0, b"\x30\x26\xb2\x75\x8e\x66\xcf\x11"),),
+    ".asf": ((0, b"\x30\x26\xb2\x75\x8e\x66\xcf\x11"),),
+    ".rm": ((0, b".RMF"),),
+    ".rmvb": ((0, b".RMF"),),
+}
+
+
+# MediaInfo JSON fields the extractors read, mapped to the attribute names
+# pymediainfo gives the same fields when it builds tracks from XML output
+_JSON_TRACK_FIELDS: Final[dict[str, str]] = {
+    "@type": "track_type",
+    "Format": "format",
+    "Duration": "duration",
+    "FileSize": "file_size",
+    "Width": "width",
+    "Height": "height",
+    "BitRate": "bit_rate",
+    "FrameRate": "frame_rate",
+    "BitDepth": "bit_depth",
+    "Channels": "channel_s",
+    "SamplingRate": "sampling_rate",
+}
+
+# First libmediainfo release with JSON output
+_JSON_MIN_LIBRARY_VERSION: Final = (18, 3)
+
+
+class _LibraryHandle:
+    """A libmediainfo handle owned by one thread.
+
+    Stored in thread-local state, it is freed when its thread exits, e.g.
+    when the parse executor shuts down its workers.
+    """
+
+    __slots__ = ("lib", "handle")
+
+    def __init__(self) -> None:
+        self.lib, self.handle, _, _ = MediaInfo._get_library()
+
+    def __del__(self) -> None:
+        self.lib.MediaInfo_Delete(self.handle)
+
+
+# Per-thread libmediainfo handles, reused across files so each parse skips
+# creating and destroying one
+_thread_state = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _json_output_supported() -> bool:
+    """Check whether the installed libmediainfo can emit JSON.
+
+    This relies on pymediainfo's private ``MediaInfo._get_library``; any
+    failure to use it falls back to pymediainfo's public XML parse.
+    """
+    try:
+        lib, handle, _, lib_version = MediaInfo._get_library()
+        lib.MediaInfo_Delete(handle)
+        return tuple(lib_version) >= _JSON_MIN_LIBRARY_VERSION
+    except Exception as e:
+        logger.debug("libmediainfo JSON output unavailable", error=str(e))
+        return False
+
+
+def _inform_json(file_path: str, quick: bool) -> str:
+    """Run libmediainfo on a file with this thread's handle, as JSON."""
+    library = getattr(_thread_state, "library", None)
+    if library is None:
+        library = _thread_state.library = _LibraryHandle()
+    lib, handle = library.lib, library.handle
+
+    # Options persist on the handle, so set every one the output depends on
+    lib.MediaInfo_Option(handle, "CharSet", "UTF-8")
+    lib.MediaInfo_Option(handle, "Cover_Data", "")
+    lib.MediaInfo_Option(handle, "Inform", "JSON")
+    lib.MediaInfo_Option(handle, "Complete", "" if quick else "1")
+    lib.MediaInfo_Option(handle, "ParseSpeed", "0" if quick else "0.5")
+    lib.MediaInfo_Option(handle, "LegacyStreamDisplay", "")
+
+    if lib.MediaInfo_Open(handle, file_path) == 0:
+        lib.MediaInfo_Close(handle)
+        if not Path(file_path).exists():
+            raise FileNotFoundError(file_path)
+        raise RuntimeError(f"libmediainfo could not open {file_path}")
+
+    try:
+        return lib.MediaInfo_Inform(handle, 0)
+    finally:
+        lib.MediaInfo_Close(handle)
+
+
+def _read_media_info(file_path: str, quick: bool = False) -> Any:
+    """Parse a file with libmediainfo, preferring its JSON output.
+
+    Building pymediainfo tracks from XML walks the whole element tree in
+    Python. The JSON path decodes in C and keeps only the fields the
+    extractors read, under pymediainfo's names, so the result can be used
+    in place of a MediaInfo object.
+
+    A quick parse stops after the container headers and skips MediaInfo's
+    "complete" fields, which is enough to tell whether a file is playable.
+    """
+    if not _json_output_supported():
+        # full=False would make pymediainfo report display strings such as
+        # "2 s 0 ms" instead of numbers, so only the parse speed is lowered
+        if quick:
+            return MediaInfo.parse(file_path, parse_speed=0)
+        return MediaInfo.parse(file_path)
+
+    document = json.loads(_inform_json(file_path, quick))
+    media = document.get("media") or {}
+
+    tracks = []
+    for raw_track in media.get("track", ()):
+        fields = {
+            name: raw_track[key]
+            for key, name in _JSON_TRACK_FIELDS.items()
+            if key in raw_track
+        }
+        if "duration" in fields:
+            # JSON reports seconds; pymediainfo tracks carry milliseconds
+            fields["duration"] = float(fields["duration"]) * 1000
+        tracks.append(SimpleNamespace(**fields))
+
+    return SimpleNamespace(tracks=tracks)
+
+
+def _rejection_reason(file_path: Path) -> str | None:
+    """Check a file's size and header before parsing it.
+
+    Returns:
+        Why the file cannot be media, or None if it should be parsed
+    """
+    try:
+        with file_path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < MIN_MEDIA_FILE_SIZE:
+                return f"file is only {size} bytes"
+            header = f.read(SNIFF_SIZE)
+    except OSError:
+        # Leave reporting (and retrying) I/O errors to the parse itself
+        return None
+
+    signatures = _CONTAINER_SIGNATURES.get(file_path.suffix.lower())
+    if signatures and not any(
+        header.startswith(signature, offset) for offset, signature in signatures
+    ):
+        return "header does not match its extension"
+
+    return None
+
+
+@lru_cache(maxsize=512)
+def _video_codec_from_name(codec_name: str) -> VideoCodec:
+    """Classify a lowercased video codec name, memoized since names repeat."""
+    if "h264" in codec_name or "avc" in codec_name:
+        return VideoCodec.H264
+    elif "h265" in codec_name or "hevc" in codec_name:
+        return VideoCodec.H265
+    elif "vp9" in codec_name:
+        return VideoCodec.VP9
+    elif "av1" in codec_name:
+        return VideoCodec.AV1
+    elif "xvid" in codec_name:
+        return VideoCodec.XVID
+    elif "divx" in codec_name:
+        return VideoCodec.DIVX
+    else:
+        return VideoCodec.UNKNOWN
+
+
+@lru_cache(maxsize=512)
+def _audio_codec_from_name(codec_name: str) -> AudioCodec:
+    """Classify a lowercased audio codec name, memoized since names repeat."""
+    if "aac" in codec_name:
+        return AudioCodec.AAC
+    elif "ac-3" in codec_name or "ac3" in codec_name:
+        return AudioCodec.AC3
+    elif "dts" in codec_name:
+        if "hd" in codec_name or "master" in codec_name:
+            return AudioCodec.DTS_HD
+        else:
+            return AudioCodec.DTS
+    elif "truehd" in codec_name or "true hd" in codec_name:
+        return AudioCodec.TRUEHD
+    elif "flac" in codec_name:
+        return AudioCodec.FLAC
+    elif "mp3" in codec_name:
+        return AudioCodec.MP3
+    elif "pcm" in codec_name:
+        return AudioCodec.PCM
+    else:
+        return AudioCodec.UNKNOWN
+
+
+@lru_cache(maxsize=512)
+def _video_format_from_info(format_info: str) -> VideoFormat:
+    """Classify a lowercased video source format, memoized since formats repeat."""
+    if "bluray" in format_info or "blu-ray" in format_info:
+        if "uhd" in format_info:
+            return VideoFormat.UHD_BLURAY
+        else:
+            return VideoFormat.BLURAY
+    elif "remux" in format_info:
+        return VideoFormat.REMUX
+    elif "web-dl" in format_info or "webdl" in format_info:
+        return VideoFormat.WEB_DL
+    elif "webrip" in format_info:
+        return VideoFormat.WEBRIP
+    elif "hdtv" in format_info:
+        return VideoFormat.HDTV
+    elif "dvdrip" in format_info:
+        return VideoFormat.DVDRIP
+    elif "cam" in format_info:
+        return VideoFormat.CAM
+    elif "telesync" in format_info or "ts" in format_info:
+        return VideoFormat.TELESYNC
+    else:
+        return VideoFormat.UNKNOWN
+
 
 class MediaParserError(Exception):
     """Base exception for media parser errors."""
@@ -41,292 +330,346 @@ class CorruptedFileError(MediaParserError):
     """File appears to be corrupted error."""
 
 
+def _has_duration(media_info: Any) -> bool:
+    """Check whether the general track reports a positive duration.
+
+    A duration that is not a number counts as unknown, so callers fall
+    back to a full parse instead of treating the file as broken.
+    """
+    for track in media_info.tracks:
+        if track.track_type == "General":
+            try:
+                return float(getattr(track, "duration", None) or 0) > 0
+            except (TypeError, ValueError):
+                return False
+    return False
+
+
+def _ensure_parseable(file_path: Path) -> None:
+    """Reject obvious non-media before paying for a libmediainfo parse.
+
+    The extension alone is not checked: which extensions count as video is
+    up to the caller's settings. It only selects the container signature
+    the header must match.
+
+    Raises:
+        UnsupportedFileError: If the file cannot be a media file
+    """
+    reason = _rejection_reason(file_path)
+    if reason is not None:
+        raise UnsupportedFileError(f"Not a media file ({reason}): {file_path}")
+
+
 class MediaInfoExtractor:
     """Type-safe wrapper around pymediainfo for extracting media information."""
 
-    def __init__(self) -> None:
-        """Initialize the media info extractor."""
-        pass
+    def __init__(self, cache_size: int = PARSE_CACHE_SIZE) -> None:
+        """Initialize the media info extractor.
 
-    @retry_file_operation(max_attempts=2)
-    async def extract_media_info(self, file_path: Path) -> MediaInfo:
+        Args:
+            cache_size: Maximum number of files whose extracted info is kept
+        """
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, int, int], ExtractedInfo] = OrderedDict()
+
+    async def extract_all(
+        self, file_path: Path, stat_result: os.stat_result | None = None
+    ) -> ExtractedInfo:
+        """Extract video, audio and general info, reusing unchanged results.
+
+        Results are keyed by path, size and modification time, so a file
+        that changed on disk is parsed again.
+
+        Args:
+            file_path: Path to media file
+            stat_result: Stat result for the file, if the caller already has one
+
+        Returns:
+            Tuple of (video, audio, general) track information
+        """
+        if stat_result is None:
+            stat_result = await asyncio.to_thread(file_path.stat)
+        cache_key = (str(file_path), stat_result.st_size, stat_result.st_mtime_ns)
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            logger.debug("Media info cache hit", file_path=str(file_path))
+            return cached
+
+        media_info = await self.extract_media_info(file_path)
+
+        # Extract different types of information from one track scan
+        tracks = self.classify_tracks(media_info)
+        extracted = (
+            self.extract_video_info(media_info, tracks),
+            self.extract_audio_info(media_info, tracks),
+            self.extract_general_info(media_info, tracks),
+        )
+
+        self._cache[cache_key] = extracted
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return extracted
+
+    def clear_cache(self) -> None:
+        """Forget all cached extraction results."""
+        self._cache.clear()
+
+    async def extract_media_info(
+        self, file_path: Path, *, quick: bool = False
+    ) -> MediaInfo:
         """Extract media info from file with retry logic.
 
         Args:
             file_path: Path to media file
+            quick: Only parse the container headers
 
         Returns:
-            MediaInfo object
+            MediaInfo object, or an equivalent exposing the same tracks
 
         Raises:
             UnsupportedFileError: If file format is not supported
             CorruptedFileError: If file appears to be corrupted
         """
+        await asyncio.to_thread(_ensure_parseable, file_path)
+        return await self._parse_media_info(file_path, quick)
+
+    def extract_media_info_sync(self, file_path: Path) -> MediaInfo:
+        """Extract media info on the calling thread, without retries.
+
+        For synchronous callers, which have no event loop to keep
+        responsive and gain nothing from handing one parse to the pool.
+
+        Args:
+            file_path: Path to media file
+
+        Returns:
+            MediaInfo object, or an equivalent exposing the same tracks
+
+        Raises:
+            UnsupportedFileError: If file format is not supported
+            CorruptedFileError: If file appears to be corrupted
+        """
+        _ensure_parseable(file_path)
+
+        try:
+            return self._check_tracks(file_path, _read_media_info(str(file_path)))
+        except Exception as e:
+            raise self._parse_error(file_path, e) from e
+
+    @retry_file_operation(max_attempts=2)
+    async def _parse_media_info(self, file_path: Path, quick: bool) -> MediaInfo:
+        """Parse a file with libmediainfo on the parse pool."""
         try:
-            # Run pymediainfo in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            # Run pymediainfo on the parse pool to avoid blocking
+            loop = asyncio.get_running_loop()
             media_info = await loop.run_in_executor(
-                None, MediaInfo.parse, str(file_path)
+                _parse_executor, _read_media_info, str(file_path), quick
             )
+            return self._check_tracks(file_path, media_info)
+        except Exception as e:
+            raise self._parse_error(file_path, e) from e
 
-            if not media_info.tracks:
-                raise UnsupportedFileError(f"No media tracks found in {file_path}")
+    def _check_tracks(self, file_path: Path, media_info: MediaInfo) -> MediaInfo:
+        """Ensure a parse found tracks, and log the result."""
+        if not media_info.tracks:
+            raise UnsupportedFileError(f"No media tracks found in {file_path}")
 
-            logger.debug(
-                "Media info extracted successfully",
-                file_path=str(file_path),
-                track_count=len(media_info.tracks),
-            )
+        logger.debug(
+            "Media info extracted successfully",
+            file_path=str(file_path),
+            track_count=len(media_info.tracks),
+        )
 
-            return media_info
+        return media_info
 
-        except Exception as e:
-            logger.error(
-                "Error extracting media info",
-                file_path=str(file_path),
-                error=str(e),
-            )
+    def _parse_error(self, file_path: Path, error: Exception) -> MediaParserError:
+        """Log a failed parse and map it to the matching parser error."""
+        logger.error(
+            "Error extracting media info",
+            file_path=str(file_path),
+            error=str(error),
+        )
 
-            if "corrupted" in str(e).lower() or "invalid" in str(e).lower():
-                raise CorruptedFileError(
-                    f"File appears to be corrupted: {file_path}"
-                ) from e
-            else:
-                raise UnsupportedFileError(
-                    f"Cannot extract media info from {file_path}: {e}"
-                ) from e
-
-    def _safe_get_track_value(
-        self, track: Any, attribute: str, default: Any = None
-    ) -> Any:
-        """Safely get value from track with fallback."""
-        try:
-            value = getattr(track, attribute, default)
-            return value if value is not None else default
-        except (AttributeError, TypeError):
-            return default
+        if _CORRUPTION_PATTERN.search(str(error)):
+            return CorruptedFileError(f"File appears to be corrupted: {file_path}")
+        else:
+            return UnsupportedFileError(
+                f"Cannot extract media info from {file_path}: {error}"
+            )
 
-    def extract_video_info(self, media_info: MediaInfo) -> dict[str, Any]:
-        """Extract video track information.
+    def classify_tracks(self, media_info: MediaInfo) -> dict[str, Any]:
+        """Find the first track of each type in a single pass.
 
         Args:
             media_info: MediaInfo object
 
         Returns:
-            Dictionary with video information
+            Dictionary mapping track types ("General", "Video", "Audio") to
+            the first track of that type; missing types are absent
         """
-        video_info = {
-            "codec": VideoCodec.UNKNOWN,
-            "resolution": VideoResolution.UNKNOWN,
-            "width": None,
-            "height": None,
-            "bitrate": None,
-            "fps": None,
-            "bit_depth": None,
-            "format": VideoFormat.UNKNOWN,
-        }
-
-        # Find first video track
-        video_track = None
+        tracks: dict[str, Any] = {}
         for track in media_info.tracks:
-            if track.track_type == "Video":
-                video_track = track
+            tracks.setdefault(track.track_type, track)
+            if tracks.keys() >= _PRIMARY_TRACK_TYPES:
                 break
+        return tracks
+
+    def extract_video_info(
+        self, media_info: MediaInfo, tracks: dict[str, Any] | None = None
+    ) -> VideoTrackInfo:
+        """Extract video track information.
+
+        Args:
+            media_info: MediaInfo object
+            tracks: Tracks already classified by :meth:`classify_tracks`
+
+        Returns:
+            Video track information
+        """
+        if tracks is None:
+            tracks = self.classify_tracks(media_info)
+        video_track = tracks.get("Video")
 
         if not video_track:
             logger.debug("No video track found in media file")
-            return video_info
+            return VideoTrackInfo()
 
-        # Extract codec
-        codec_name = self._safe_get_track_value(video_track, "codec", "").lower()
-        video_info["codec"] = self._parse_video_codec(codec_name)
+        # pymediainfo stores parsed fields in the track's __dict__
+        data = vars(video_track)
 
         # Extract dimensions
-        width = self._safe_get_track_value(video_track, "width")
-        height = self._safe_get_track_value(video_track, "height")
+        width = data.get("width")
+        height = data.get("height")
 
         if width and height:
-            video_info["width"] = int(width)
-            video_info["height"] = int(height)
-            video_info["resolution"] = self._parse_video_resolution(
-                int(width), int(height)
-            )
-
-        # Extract bitrate
-        bitrate = self._safe_get_track_value(video_track, "bit_rate")
-        if bitrate:
-            video_info["bitrate"] = int(bitrate)
-
-        # Extract frame rate
-        fps = self._safe_get_track_value(video_track, "frame_rate")
-        if fps:
-            video_info["fps"] = float(fps)
-
-        # Extract bit depth
-        bit_depth = self._safe_get_track_value(video_track, "bit_depth")
-        if bit_depth:
-            video_info["bit_depth"] = int(bit_depth)
-
-        # Extract format from container or codec info
-        format_info = self._safe_get_track_value(video_track, "format", "")
-        video_info["format"] = self._parse_video_format(format_info)
+            width = int(width)
+            height = int(height)
+            resolution = self._parse_video_resolution(width, height)
+        else:
+            width = height = None
+            resolution = VideoResolution.UNKNOWN
+
+        bitrate = data.get("bit_rate")
+        fps = data.get("frame_rate")
+        bit_depth = data.get("bit_depth")
+
+        video_info = VideoTrackInfo(
+            codec=self._parse_video_codec(data.get("codec") or ""),
+            resolution=resolution,
+            width=width,
+            height=height,
+            bitrate=int(bitrate) if bitrate else None,
+            fps=float(fps) if fps else None,
+            bit_depth=int(bit_depth) if bit_depth else None,
+            # Format from container or codec info
+            format=self._parse_video_format(data.get("format") or ""),
+        )
 
         logger.debug(
             "Video info extracted",
-            codec=video_info["codec"].value,
-            resolution=video_info["resolution"].value,
-            width=video_info["width"],
-            height=video_info["height"],
+            codec=video_info.codec.value,
+            resolution=video_info.resolution.value,
+            width=video_info.width,
+            height=video_info.height,
         )
 
         return video_info
 
-    def extract_audio_info(self, media_info: MediaInfo) -> dict[str, Any]:
+    def extract_audio_info(
+        self, media_info: MediaInfo, tracks: dict[str, Any] | None = None
+    ) -> AudioTrackInfo:
         """Extract audio track information.
 
         Args:
             media_info: MediaInfo object
+            tracks: Tracks already classified by :meth:`classify_tracks`
 
         Returns:
-            Dictionary with audio information
+            Audio track information
         """
-        audio_info = {
-            "codec": AudioCodec.UNKNOWN,
-            "channels": None,
-            "sample_rate": None,
-            "bitrate": None,
-        }
-
-        # Find first audio track
-        audio_track = None
-        for track in media_info.tracks:
-            if track.track_type == "Audio":
-                audio_track = track
-                break
+        if tracks is None:
+            tracks = self.classify_tracks(media_info)
+        audio_track = tracks.get("Audio")
 
         if not audio_track:
             logger.debug("No audio track found in media file")
-            return audio_info
-
-        # Extract codec
-        codec_name = self._safe_get_track_value(audio_track, "codec", "").lower()
-        audio_info["codec"] = self._parse_audio_codec(codec_name)
+            return AudioTrackInfo()
 
-        # Extract channels
-        channels = self._safe_get_track_value(audio_track, "channel_s")
-        if channels:
-            audio_info["channels"] = int(channels)
+        data = vars(audio_track)
 
-        # Extract sample rate
-        sample_rate = self._safe_get_track_value(audio_track, "sampling_rate")
-        if sample_rate:
-            audio_info["sample_rate"] = int(sample_rate)
+        channels = data.get("channel_s")
+        sample_rate = data.get("sampling_rate")
+        bitrate = data.get("bit_rate")
 
-        # Extract bitrate
-        bitrate = self._safe_get_track_value(audio_track, "bit_rate")
-        if bitrate:
-            audio_info["bitrate"] = int(bitrate)
+        audio_info = AudioTrackInfo(
+            codec=self._parse_audio_codec(data.get("codec") or ""),
+            channels=int(channels) if channels else None,
+            sample_rate=int(sample_rate) if sample_rate else None,
+            bitrate=int(bitrate) if bitrate else None,
+        )
 
         logger.debug(
             "Audio info extracted",
-            codec=audio_info["codec"].value,
-            channels=audio_info["channels"],
-            sample_rate=audio_info["sample_rate"],
+            codec=audio_info.codec.value,
+            channels=audio_info.channels,
+            sample_rate=audio_info.sample_rate,
         )
 
         return audio_info
 
-    def extract_general_info(self, media_info: MediaInfo) -> dict[str, Any]:
+    def extract_general_info(
+        self, media_info: MediaInfo, tracks: dict[str, Any] | None = None
+    ) -> GeneralTrackInfo:
         """Extract general file information.
 
         Args:
             media_info: MediaInfo object
+            tracks: Tracks already classified by :meth:`classify_tracks`
 
         Returns:
-            Dictionary with general information
+            General track information
         """
-        general_info = {
-            "duration": None,
-            "file_size": None,
-            "container": None,
-        }
-
-        # Find general track
-        general_track = None
-        for track in media_info.tracks:
-            if track.track_type == "General":
-                general_track = track
-                break
+        if tracks is None:
+            tracks = self.classify_tracks(media_info)
+        general_track = tracks.get("General")
 
         if not general_track:
             logger.debug("No general track found in media file")
-            return general_info
+            return GeneralTrackInfo()
 
-        # Extract duration (in milliseconds, convert to seconds)
-        duration = self._safe_get_track_value(general_track, "duration")
-        if duration:
-            general_info["duration"] = int(float(duration) / 1000)
+        data = vars(general_track)
 
-        # Extract file size
-        file_size = self._safe_get_track_value(general_track, "file_size")
-        if file_size:
-            general_info["file_size"] = int(file_size)
+        # Duration is in milliseconds, stored in seconds
+        duration = data.get("duration")
+        file_size = data.get("file_size")
+        container = data.get("format") or ""
 
-        # Extract container format
-        container = self._safe_get_track_value(general_track, "format", "")
-        general_info["container"] = container.lower() if container else "unknown"
+        general_info = GeneralTrackInfo(
+            duration=int(float(duration) / 1000) if duration else None,
+            file_size=int(file_size) if file_size else None,
+            container=container.lower() if container else "unknown",
+        )
 
         logger.debug(
             "General info extracted",
-            duration=general_info["duration"],
-            file_size=general_info["file_size"],
-            container=general_info["container"],
+            duration=general_info.duration,
+            file_size=general_info.file_size,
+            container=general_info.container,
         )
 
         return general_info
 
     def _parse_video_codec(self, codec_name: str) -> VideoCodec:
         """Parse video codec from string."""
-        codec_name = codec_name.lower()
-
-        if "h264" in codec_name or "avc" in codec_name:
-            return VideoCodec.H264
-        elif "h265" in codec_name or "hevc" in codec_name:
-            return VideoCodec.H265
-        elif "vp9" in codec_name:
-            return VideoCodec.VP9
-        elif "av1" in codec_name:
-            return VideoCodec.AV1
-        elif "xvid" in codec_name:
-            return VideoCodec.XVID
-        elif "divx" in codec_name:
-            return VideoCodec.DIVX
-        else:
-            return VideoCodec.UNKNOWN
+        # Lowercase first so differently-cased names share one cache entry
+        return _video_codec_from_name(codec_name.lower())
 
     def _parse_audio_codec(self, codec_name: str) -> AudioCodec:
         """Parse audio codec from string."""
-        codec_name = codec_name.lower()
-
-        if "aac" in codec_name:
-            return AudioCodec.AAC
-        elif "ac-3" in codec_name or "ac3" in codec_name:
-            return AudioCodec.AC3
-        elif "dts" in codec_name:
-            if "hd" in codec_name or "master" in codec_name:
-                return AudioCodec.DTS_HD
-            else:
-                return AudioCodec.DTS
-        elif "truehd" in codec_name or "true hd" in codec_name:
-            return AudioCodec.TRUEHD
-        elif "flac" in codec_name:
-            return AudioCodec.FLAC
-        elif "mp3" in codec_name:
-            return AudioCodec.MP3
-        elif "pcm" in codec_name:
-            return AudioCodec.PCM
-        else:
-            return AudioCodec.UNKNOWN
+        return _audio_codec_from_name(codec_name.lower())
 
     def _parse_video_resolution(self, _width: int, height: int) -> VideoResolution:
         """Parse video resolution from dimensions."""
@@ -347,29 +690,7 @@ class MediaInfoExtractor:
 
     def _parse_video_format(self, format_info: str) -> VideoFormat:
         """Parse video source format."""
-        format_info = format_info.lower()
-
-        if "bluray" in format_info or "blu-ray" in format_info:
-            if "uhd" in format_info:
-                return VideoFormat.UHD_BLURAY
-            else:
-                return VideoFormat.BLURAY
-        elif "remux" in format_info:
-            return VideoFormat.REMUX
-        elif "web-dl" in format_info or "webdl" in format_info:
-            return VideoFormat.WEB_DL
-        elif "webrip" in format_info:
-            return VideoFormat.WEBRIP
-        elif "hdtv" in format_info:
-            return VideoFormat.HDTV
-        elif "dvdrip" in format_info:
-            return VideoFormat.DVDRIP
-        elif "cam" in format_info:
-            return VideoFormat.CAM
-        elif "telesync" in format_info or "ts" in format_info:
-            return VideoFormat.TELESYNC
-        else:
-            return VideoFormat.UNKNOWN
+        return _video_format_from_info(format_info.lower())
 
 
 class MediaFileParser:
@@ -400,31 +721,28 @@ class MediaFileParser:
             media_file.update_status(ProcessingStatus.SCANNING)
 
             # Extract media information
-            media_info = await self.extractor.extract_media_info(file_path)
-
-            # Extract different types of information
-            video_info = self.extractor.extract_video_info(media_info)
-            audio_info = self.extractor.extract_audio_info(media_info)
-            general_info = self.extractor.extract_general_info(media_info)
+            video_info, audio_info, general_info = await self.extractor.extract_all(
+                file_path
+            )
 
             # Update MediaFileInfo with extracted information
-            media_file.info.duration_seconds = general_info.get("duration")
-            media_file.info.video_codec = video_info["codec"]
-            media_file.info.video_resolution = video_info["resolution"]
-            media_file.info.video_width = video_info["width"]
-            media_file.info.video_height = video_info["height"]
-            media_file.info.video_bitrate = video_info["bitrate"]
-            media_file.info.video_fps = video_info["fps"]
-            media_file.info.bit_depth = video_info["bit_depth"]
-            media_file.info.audio_codec = audio_info["codec"]
-            media_file.info.audio_channels = audio_info["channels"]
-            media_file.info.audio_sample_rate = audio_info["sample_rate"]
-            media_file.info.audio_bitrate = audio_info["bitrate"]
-            media_file.info.video_format = video_info["format"]
+            media_file.info.duration_seconds = general_info.duration
+            media_file.info.video_codec = video_info.codec
+            media_file.info.video_resolution = video_info.resolution
+            media_file.info.video_width = video_info.width
+            media_file.info.video_height = video_info.height
+            media_file.info.video_bitrate = video_info.bitrate
+            media_file.info.video_fps = video_info.fps
+            media_file.info.bit_depth = video_info.bit_depth
+            media_file.info.audio_codec = audio_info.codec
+            media_file.info.audio_channels = audio_info.channels
+            media_file.info.audio_sample_rate = audio_info.sample_rate
+            media_file.info.audio_bitrate = audio_info.bitrate
+            media_file.info.video_format = video_info.format
 
             # Update file size if not set
-            if general_info.get("file_size") and not media_file.info.file_size:
-                media_file.info.file_size = general_info["file_size"]
+            if general_info.file_size and not media_file.info.file_size:
+                media_file.info.file_size = general_info.file_size
 
             # Mark as completed
             media_file.update_status(ProcessingStatus.COMPLETED)
@@ -453,6 +771,33 @@ class MediaFileParser:
 
             raise MediaParserError(error_msg) from e
 
+    async def parse_many(
+        self, media_files: list[MediaFile], concurrency: int = PARSE_PIPELINE_DEPTH
+    ) -> list[MediaFile]:
+        """Parse many media files, overlapping parses with extraction.
+
+        While libmediainfo parses some files on the parse pool, the event
+        loop extracts and applies the results of those already finished.
+
+        Args:
+            media_files: MediaFile objects to update
+            concurrency: Maximum number of files in flight at once
+
+        Returns:
+            The same MediaFile objects, in order; files that failed to parse
+            are marked as failed rather than raising
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def parse(media_file: MediaFile) -> None:
+            async with semaphore:
+                with contextlib.suppress(MediaParserError):
+                    await self.parse_media_file(media_file)
+
+        await asyncio.gather(*(parse(media_file) for media_file in media_files))
+
+        return media_files
+
     async def verify_file_integrity(self, file_path: Path) -> bool:
         """Verify file integrity by attempting to parse it.
 
@@ -463,18 +808,16 @@ class MediaFileParser:
             True if file appears to be valid, False otherwise
         """
         try:
-            media_info = await self.extractor.extract_media_info(file_path)
+            # A header-only parse settles almost every file; the full parse
+            # is only needed when the headers do not state a duration
+            media_info = await self.extractor.extract_media_info(file_path, quick=True)
+            has_duration = _has_duration(media_info)
+            if not has_duration:
+                media_info = await self.extractor.extract_media_info(file_path)
+                has_duration = _has_duration(media_info)
 
             # Basic integrity checks
             has_tracks = len(media_info.tracks) > 0
-            has_duration = False
-
-            for track in media_info.tracks:
-                if track.track_type == "General":
-                    duration = getattr(track, "duration", None)
-                    if duration and float(duration) > 0:
-                        has_duration = True
-                        break
 
             is_valid = has_tracks and has_duration
 
@@ -496,7 +839,9 @@ class MediaFileParser:
             )
             return False
 
-    async def calculate_file_hash(self, file_path: Path, algorithm: str = "md5") -> str:
+    async def calculate_file_hash(
+        self, file_path: Path, algorithm: str = DEFAULT_HASH_ALGORITHM
+    ) -> str:
         """Calculate file hash for integrity verification.
 
         Args:
@@ -504,15 +849,13 @@ class MediaFileParser:
             algorithm: Hash algorithm to use
 
         Returns:
-            Hexadecimal hash string
-        """
-        hash_obj = hashlib.new(algorithm)
+            Hexadecimal hash string, comparable with those from
+            :func:`smart_media_organizer.utils.file_ops.calculate_file_hash`
 
-        async with aiofiles.open(file_path, "rb") as f:
-            while chunk := await f.read(8192):
-                hash_obj.update(chunk)
-
-        return hash_obj.hexdigest()
+        Raises:
+            ValueError: If algorithm is not supported
+        """
+        return await calculate_file_hash(file_path, algorithm=algorithm)
 
 
 # Convenience functions
@@ -527,43 +870,81 @@ async def parse_media_file(file_path: Path) -> MediaFile:
     """
     from smart_media_organizer.utils.file_ops import get_file_info
 
-    # Create basic MediaFile
+    # Create basic MediaFile; the values come straight from stat() and the
+    # path itself, so validation is skipped
     file_info_dict = await get_file_info(file_path)
-    media_file_info = MediaFileInfo(
+    media_file_info = MediaFileInfo.model_construct(
         file_path=file_path,
         file_size=file_info_dict["size"],
         file_extension=file_path.suffix.lower(),
     )
 
-    media_file = MediaFile(info=media_file_info)
+    media_file = MediaFile.model_construct(info=media_file_info)
 
     # Parse and return
     parser = MediaFileParser()
     return await parser.parse_media_file(media_file)
 
 
-async def verify_media_files(file_paths: list[Path]) -> dict[Path, bool]:
-    """Verify integrity of multiple media files.
+async def iter_verified_media_files(
+    file_paths: list[Path],
+) -> AsyncIterator[tuple[Path, bool]]:
+    """Verify integrity of multiple media files as a stream of results.
+
+    Results are yielded in completion order, so one slow file never holds
+    back the others, and only a bounded number of files is in flight.
 
     Args:
         file_paths: List of file paths to verify
 
-    Returns:
-        Dictionary mapping file paths to verification results
+    Yields:
+        Tuples of (file path, verification result)
     """
     parser = MediaFileParser()
-    results = {}
+    pending: dict[asyncio.Task[bool], Path] = {}
 
-    # Verify files concurrently
-    tasks = []
-    for file_path in file_paths:
-        task = asyncio.create_task(parser.verify_file_integrity(file_path))
-        tasks.append((file_path, task))
+    async def drain(*, until: int) -> AsyncIterator[tuple[Path, bool]]:
+        while len(pending) > until:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield pending.pop(
+                    task
+                ), task.exception() is None and task.result() is True
 
-    for file_path, task in tasks:
-        try:
-            results[file_path] = await task
-        except Exception:
-            results[file_path] = False
+    # Stat everything up front so missing files never reach MediaInfo
+    stat_results = await batch_stat(file_paths)
+
+    try:
+        for file_path, stat_result in zip(file_paths, stat_results, strict=True):
+            if stat_result is None:
+                yield file_path, False
+                continue
+
+            async for result in drain(until=VERIFY_CONCURRENCY - 1):
+                yield result
+
+            task = asyncio.create_task(parser.verify_file_integrity(file_path))
+            pending[task] = file_path
+
+        async for result in drain(until=0):
+            yield result
+    finally:
+        # The consumer may stop early; don't leave verifications running
+        for task in pending:
+            task.cancel()
+
+
+async def verify_media_files(file_paths: list[Path]) -> dict[Path, bool]:
+    """Verify integrity of multiple media files.
+
+    Args:
+        file_paths: List of file paths to verify
+
+    Returns:
+        Dictionary mapping file paths to verification results, in input order
+    """
+    results = dict.fromkeys(file_paths, False)
+    async for file_path, is_valid in iter_verified_media_files(file_paths):
+        results[file_path] = is_valid
 
     return results
@@ -0,0 +1,50 @@
+"""Batched stat() helpers.
+
+This module stats many paths with one worker-thread hop per batch
+instead of one per file, for callers that need metadata for a whole
+list of files up front.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+# Paths stat'ed per worker-thread call
+STAT_BATCH_SIZE = 16384
+
+
+def _stat_batch(paths: list[Path]) -> list[os.stat_result | None]:
+    """Stat a batch of paths, mapping missing or unreadable paths to None."""
+    results: list[os.stat_result | None] = []
+    append = results.append
+    stat = os.stat
+
+    for path in paths:
+        try:
+            append(stat(path))
+        except OSError:
+            append(None)
+
+    return results
+
+
+async def batch_stat(paths: list[Path]) -> list[os.stat_result | None]:
+    """Stat many paths without blocking the event loop.
+
+    Args:
+        paths: Paths to stat
+
+    Returns:
+        Stat results in the same order as ``paths``, with None for paths
+        that do not exist or cannot be stat'ed
+    """
+    results: list[os.stat_result | None] = []
+
+    for start in range(0, len(paths), STAT_BATCH_SIZE):
+        results.extend(
+            await asyncio.to_thread(_stat_batch, paths[start : start + STAT_BATCH_SIZE])
+        )
+
+    return results
@@ -6,9 +6,22 @@ for the media organizer application.
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+import builtins
+from collections.abc import AsyncGenerator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import errno
+import fnmatch
 import hashlib
+import mmap
+import os
 from pathlib import Path
+import re
+import shutil
+import stat
+import sys
+from typing import Any, BinaryIO, Literal
 
 import aiofiles
 import aiofiles.os
@@ -16,6 +29,40 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Blocking file operations in flight at once. They run on their own pool, so
+# callers that gather thousands of hashes or copies queue here instead of
+# saturating the loop's default executor and piling up on the disk.
+FILE_IO_WORKERS = 16
+_file_io_executor = ThreadPoolExecutor(
+    max_workers=FILE_IO_WORKERS, thread_name_prefix="file-io"
+)
+
+# Read size for chunked hashing without hashlib.file_digest
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Default hash for file integrity; OpenSSL's SHA-256 uses the CPU's SHA
+# extensions where present and then runs over twice as fast as MD5
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Files at least this large are hashed through mmap in a single update
+MMAP_HASH_THRESHOLD = 10 * 1024 * 1024
+
+# Paths handed back per worker-thread hop while scanning a directory
+SCAN_BATCH_SIZE = 1024
+
+# Tree hash: SHA-256 over the SHA-256 digests of fixed-size shards, which
+# are hashed in parallel. Its digest differs from a plain sha256.
+TREE_HASH_ALGORITHM = "sha256-tree"
+TREE_HASH_SHARD_SIZE = 64 * 1024 * 1024
+
+# Bytes requested per copy_file_range/sendfile/read call when copying
+COPY_CHUNK_SIZE = 1 << 24
+
+# Kernel copy errors that mean "use the next, more portable method"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+)
+
 
 class FileOperationError(Exception):
     """Base exception for file operation errors."""
@@ -46,9 +93,7 @@ async def ensure_directory(path: Path) -> Path:
         FilePermissionError: If unable to create directory
     """
     try:
-        if not await aiofiles.os.path.exists(path):
-            await aiofiles.os.makedirs(path, exist_ok=True)
-            logger.debug("Created directory", path=str(path))
+        await aiofiles.os.makedirs(path, exist_ok=True)
         return path
     except OSError as e:
         raise FilePermissionError(f"Cannot create directory {path}: {e}") from e
@@ -77,26 +122,156 @@ async def get_file_info(file_path: Path) -> dict[str, any]:
             "modified_time": stat_result.st_mtime,
             "created_time": stat_result.st_ctime,
             "permissions": oct(stat_result.st_mode),
-            "is_file": await aiofiles.os.path.isfile(file_path),
-            "is_directory": await aiofiles.os.path.isdir(file_path),
+            "is_file": stat.S_ISREG(stat_result.st_mode),
+            "is_directory": stat.S_ISDIR(stat_result.st_mode),
             "exists": True,
         }
-    except FileNotFoundError as e:
+    except builtins.FileNotFoundError as e:
         raise FileNotFoundError(f"File not found: {file_path}") from e
     except OSError as e:
         logger.error("Error getting file info", file_path=str(file_path), error=str(e))
         raise FileOperationError(f"Cannot get file info for {file_path}: {e}") from e
 
 
+def _drop_cached_pages(fd: int) -> None:
+    """Advise the kernel that a file's cached pages are no longer needed."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _advise_sequential(fd: int) -> None:
+    """Advise the kernel that a file will be read once, front to back."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+@contextlib.contextmanager
+def _single_pass(fd: int) -> Iterator[None]:
+    """Advise sequential access for one pass over a file, then drop its pages.
+
+    Hashing and copying never re-read what they stream through, so their
+    pages are released instead of evicting data other work still uses.
+    """
+    _advise_sequential(fd)
+    try:
+        yield
+    finally:
+        _drop_cached_pages(fd)
+
+
+def _hash_file(file_path: Path, hash_obj: Any, chunk_size: int) -> None:
+    """Feed a whole file to a hash object, opening and sizing it only once.
+
+    Files of at least ``MMAP_HASH_THRESHOLD`` bytes are hashed through a
+    read-only mapping, smaller ones with ``hashlib.file_digest`` or, where
+    that is unavailable, through a reused read buffer.
+    """
+    with file_path.open("rb", buffering=0) as f, _single_pass(f.fileno()):
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hash_obj.update(mapped)
+            return
+
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            hashlib.file_digest(f, lambda: hash_obj)
+            return
+
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            hash_obj.update(view[:size])
+
+
+async def _run_file_io(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking file operation on the bounded file I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_file_io_executor, func, *args)
+
+
+def _hash_shard(mapped: mmap.mmap, start: int, shard_size: int) -> bytes:
+    """Hash one shard of a mapped file, returning the raw SHA-256 digest."""
+    with memoryview(mapped) as view:
+        return hashlib.sha256(view[start : start + shard_size]).digest()
+
+
+def _map_file(file_path: Path) -> tuple[BinaryIO, mmap.mmap] | None:
+    """Open and map a file for one hashing pass, or return None if empty."""
+    f = file_path.open("rb")
+    try:
+        if not os.fstat(f.fileno()).st_size:
+            f.close()
+            return None
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except BaseException:
+        f.close()
+        raise
+
+    _advise_sequential(f.fileno())
+    return f, mapped
+
+
+def _unmap_file(f: BinaryIO, mapped: mmap.mmap) -> None:
+    """Close a mapping from :func:`_map_file` and drop the file's pages."""
+    mapped.close()
+    _drop_cached_pages(f.fileno())
+    f.close()
+
+
+async def _tree_hash(file_path: Path, shard_size: int = TREE_HASH_SHARD_SIZE) -> str:
+    """Compute the ``sha256-tree`` digest of a file.
+
+    Each shard is hashed on its own worker thread; hashlib releases the GIL
+    while hashing, so shards are processed in parallel across cores.
+    """
+    mapping = await _run_file_io(_map_file, file_path)
+    if mapping is None:
+        return hashlib.sha256().hexdigest()
+
+    f, mapped = mapping
+    shard_futures = [
+        _file_io_executor.submit(_hash_shard, mapped, start, shard_size)
+        for start in range(0, len(mapped), shard_size)
+    ]
+    try:
+        shard_digests = await asyncio.gather(
+            *(asyncio.wrap_future(future) for future in shard_futures)
+        )
+    finally:
+        # On cancellation or a failed shard, shards already running still
+        # hold views of the mapping; it cannot be closed until they finish
+        for future in shard_futures:
+            future.cancel()
+        running = [
+            asyncio.wrap_future(future) for future in shard_futures if not future.done()
+        ]
+        if running:
+            await asyncio.wait(running)
+        await _run_file_io(_unmap_file, f, mapped)
+
+    return hashlib.sha256(b"".join(shard_digests)).hexdigest()
+
+
 async def calculate_file_hash(
-    file_path: Path, *, algorithm: str = "md5", chunk_size: int = 8192
+    file_path: Path,
+    *,
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+    chunk_size: int = HASH_CHUNK_SIZE,
 ) -> str:
     """Calculate file hash asynchronously.
 
+    Hashing runs on a worker thread: files of at least
+    ``MMAP_HASH_THRESHOLD`` bytes are mapped into memory and hashed in one
+    call, smaller ones are read into a reused buffer. The
+    ``TREE_HASH_ALGORITHM`` ("sha256-tree") hashes shards of the file in
+    parallel instead; its digests are only comparable with each other.
+
     Args:
         file_path: Path to the file
-        algorithm: Hash algorithm (md5, sha1, sha256, etc.)
-        chunk_size: Size of chunks to read at a time
+        algorithm: Hash algorithm (md5, sha1, sha256, sha256-tree, etc.)
+        chunk_size: Read size for smaller files where hashlib.file_digest
+            (Python 3.11+) is unavailable
 
     Returns:
         Hexadecimal hash string
@@ -105,17 +280,20 @@ async def calculate_file_hash(
         FileNotFoundError: If file doesn't exist
         ValueError: If algorithm is not supported
     """
-    try:
-        hash_obj = hashlib.new(algorithm)
-    except ValueError as e:
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
+    hash_obj = None
+    if algorithm != TREE_HASH_ALGORITHM:
+        try:
+            hash_obj = hashlib.new(algorithm)
+        except ValueError as e:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
 
     try:
-        async with aiofiles.open(file_path, "rb") as f:
-            while chunk := await f.read(chunk_size):
-                hash_obj.update(chunk)
+        if hash_obj is None:
+            result = await _tree_hash(file_path)
+        else:
+            await _run_file_io(_hash_file, file_path, hash_obj, chunk_size)
+            result = hash_obj.hexdigest()
 
-        result = hash_obj.hexdigest()
         logger.debug(
             "Calculated file hash",
             file_path=str(file_path),
@@ -124,13 +302,91 @@ async def calculate_file_hash(
         )
         return result
 
-    except FileNotFoundError as e:
+    except builtins.FileNotFoundError as e:
         raise FileNotFoundError(f"File not found: {file_path}") from e
     except OSError as e:
         logger.error("Error calculating hash", file_path=str(file_path), error=str(e))
         raise FileOperationError(f"Cannot calculate hash for {file_path}: {e}") from e
 
 
+def _kernel_copy(src_fd: int, dst_fd: int) -> bool:
+    """Copy between file descriptors without leaving the kernel.
+
+    Tries ``os.copy_file_range`` (which can reflink on XFS/Btrfs), then
+    ``os.sendfile``. Both advance the descriptors' offsets, so a method
+    that fails part-way hands over to the next one where it stopped.
+
+    Returns:
+        True if the copy completed, False if no kernel method applies
+    """
+    copiers = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(lambda: os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE))
+    if sys.platform == "linux":
+        copiers.append(lambda: os.sendfile(dst_fd, src_fd, None, COPY_CHUNK_SIZE))
+
+    for copy_chunk in copiers:
+        try:
+            while copy_chunk():
+                pass
+            return True
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    return False
+
+
+def _create_file(path: Path, buffering: int = -1) -> BinaryIO:
+    """Create a file for writing, creating its parent directories first."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("wb", buffering=buffering)
+
+
+def _fast_copy(source: Path, destination: Path) -> None:
+    """Copy file contents, in-kernel where the platform supports it.
+
+    The source is opened before anything is created, so a missing source
+    leaves no destination directories behind.
+    """
+    with source.open("rb", buffering=0) as src_f, _create_file(
+        destination, buffering=0
+    ) as dst_f, _single_pass(src_f.fileno()), _single_pass(dst_f.fileno()):
+        if not _kernel_copy(src_f.fileno(), dst_f.fileno()):
+            shutil.copyfileobj(src_f, dst_f, COPY_CHUNK_SIZE)
+
+
+def _copy_and_hash(source: Path, destination: Path, algorithm: str) -> str:
+    """Copy file contents while hashing them in the same pass.
+
+    The destination is flushed to disk and both files are dropped from the
+    page cache, so a later read of the destination checks what was written
+    rather than what is still in memory.
+
+    Like :func:`_fast_copy`, the source is opened before anything is
+    created.
+
+    Returns:
+        Hexadecimal hash of the source contents
+    """
+    hash_obj = hashlib.new(algorithm)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+
+    with source.open("rb", buffering=0) as src_f, _create_file(
+        destination
+    ) as dst_f, _single_pass(src_f.fileno()), _single_pass(dst_f.fileno()):
+        while size := src_f.readinto(buffer):
+            chunk = view[:size]
+            hash_obj.update(chunk)
+            dst_f.write(chunk)
+
+        dst_f.flush()
+        os.fsync(dst_f.fileno())
+
+    return hash_obj.hexdigest()
+
+
 async def copy_file_atomic(
     source: Path,
     destination: Path,
@@ -140,6 +396,9 @@ async def copy_file_atomic(
 ) -> Path:
     """Copy file atomically with integrity verification.
 
+    With verification enabled the source is hashed while it is copied, so
+    only the destination has to be read back.
+
     Args:
         source: Source file path
         destination: Destination file path
@@ -154,22 +413,16 @@ async def copy_file_atomic(
         FileOperationError: If copy operation fails
         FileIntegrityError: If integrity verification fails
     """
-    if not await aiofiles.os.path.exists(source):
-        raise FileNotFoundError(f"Source file not found: {source}")
-
-    # Ensure destination directory exists
-    await ensure_directory(destination.parent)
-
     # Create temporary file with .tmp suffix
     temp_destination = destination.with_suffix(destination.suffix + ".tmp")
 
     try:
-        # Copy file using aiofiles
-        async with aiofiles.open(source, "rb") as src_f, aiofiles.open(
-            temp_destination, "wb"
-        ) as dst_f:
-            while chunk := await src_f.read(8192):
-                await dst_f.write(chunk)
+        if verify_integrity:
+            source_hash = await _run_file_io(
+                _copy_and_hash, source, temp_destination, DEFAULT_HASH_ALGORITHM
+            )
+        else:
+            await _run_file_io(_fast_copy, source, temp_destination)
 
         # Preserve metadata if requested
         if preserve_metadata:
@@ -180,7 +433,6 @@ async def copy_file_atomic(
 
         # Verify integrity if requested
         if verify_integrity:
-            source_hash = await calculate_file_hash(source)
             dest_hash = await calculate_file_hash(temp_destination)
 
             if source_hash != dest_hash:
@@ -203,13 +455,21 @@ async def copy_file_atomic(
 
     except Exception as e:
         # Clean up temporary file if it exists
-        if await aiofiles.os.path.exists(temp_destination):
+        with contextlib.suppress(OSError):
             await aiofiles.os.remove(temp_destination)
+        if isinstance(e, builtins.FileNotFoundError) and e.filename == str(source):
+            raise FileNotFoundError(f"Source file not found: {source}") from e
         raise FileOperationError(
             f"Failed to copy {source} to {destination}: {e}"
         ) from e
 
 
+def _prepare_move(source: Path, destination: Path) -> None:
+    """Stat a move's source, then create the destination's directory."""
+    source.stat()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+
 async def move_file_atomic(
     source: Path,
     destination: Path,
@@ -232,20 +492,29 @@ async def move_file_atomic(
         FileNotFoundError: If source file doesn't exist
         FileOperationError: If move operation fails
     """
-    if not await aiofiles.os.path.exists(source):
-        raise FileNotFoundError(f"Source file not found: {source}")
-
-    # Ensure destination directory exists
-    await ensure_directory(destination.parent)
+    # Check the source on the same hop that creates the destination
+    # directory, so a missing source leaves nothing behind
+    try:
+        await _run_file_io(_prepare_move, source, destination)
+    except builtins.FileNotFoundError as e:
+        raise FileNotFoundError(f"Source file not found: {source}") from e
+    except OSError as e:
+        raise FilePermissionError(
+            f"Cannot create directory {destination.parent}: {e}"
+        ) from e
 
     # Create backup if requested and destination exists
-    backup_path = None
-    if create_backup and await aiofiles.os.path.exists(destination):
+    if create_backup:
         backup_path = destination.with_suffix(destination.suffix + ".backup")
-        await copy_file_atomic(destination, backup_path, verify_integrity=False)
-        logger.debug(
-            "Created backup", original=str(destination), backup=str(backup_path)
-        )
+        try:
+            await copy_file_atomic(destination, backup_path, verify_integrity=False)
+        except FileNotFoundError:
+            # Nothing to back up
+            pass
+        else:
+            logger.debug(
+                "Created backup", original=str(destination), backup=str(backup_path)
+            )
 
     try:
         # Try atomic move first (works if source and dest are on same filesystem)
@@ -254,6 +523,8 @@ async def move_file_atomic(
             "File moved atomically", source=str(source), destination=str(destination)
         )
 
+    except builtins.FileNotFoundError as e:
+        raise FileNotFoundError(f"Source file not found: {source}") from e
     except OSError:
         # Fall back to copy + delete for cross-filesystem moves
         logger.debug("Falling back to copy+delete for cross-filesystem move")
@@ -270,6 +541,65 @@ async def move_file_atomic(
     return destination
 
 
+def _directory_error(directory: Path, error: OSError) -> FileOperationError:
+    """Map an error reading ``directory`` itself to this module's exceptions."""
+    if isinstance(error, builtins.FileNotFoundError):
+        return FileNotFoundError(f"Directory not found: {directory}")
+    if isinstance(error, NotADirectoryError):
+        return FileOperationError(f"Path is not a directory: {directory}")
+
+    logger.error("Error scanning directory", directory=str(directory), error=str(error))
+    return FileOperationError(f"Cannot scan directory {directory}: {error}")
+
+
+def _iter_scan(
+    directory: Path,
+    pattern: str,
+    *,
+    recursive: bool,
+    include_files: bool,
+    include_dirs: bool,
+) -> Iterator[list[Path]]:
+    """Walk a directory with ``os.scandir``, yielding matches in batches.
+
+    ``DirEntry`` file types come from the directory read itself, so
+    entries are not stat'ed again (symlinks excepted). Symlinked
+    directories are not descended into and unreadable subdirectories are
+    skipped, matching ``Path.rglob``.
+
+    Raises:
+        OSError: If ``directory`` itself cannot be read
+    """
+    matches = re.compile(fnmatch.translate(pattern)).match
+    batch: list[Path] = []
+    pending = [directory]
+    top_level = True
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+
+                    if not matches(entry.name):
+                        continue
+                    if (include_files and entry.is_file()) or (
+                        include_dirs and entry.is_dir()
+                    ):
+                        batch.append(Path(entry.path))
+                        if len(batch) >= SCAN_BATCH_SIZE:
+                            yield batch
+                            batch = []
+        except OSError:
+            if top_level:
+                raise
+        top_level = False
+
+    if batch:
+        yield batch
+
+
 async def scan_directory(
     directory: Path,
     *,
@@ -293,31 +623,67 @@ async def scan_directory(
     Raises:
         FileNotFoundError: If directory doesn't exist
     """
-    if not await aiofiles.os.path.exists(directory):
-        raise FileNotFoundError(f"Directory not found: {directory}")
-
-    if not await aiofiles.os.path.isdir(directory):
-        raise FileOperationError(f"Path is not a directory: {directory}")
+    walker = _iter_scan(
+        directory,
+        pattern,
+        recursive=recursive,
+        include_files=include_files,
+        include_dirs=include_dirs,
+    )
 
+    step = None
     try:
-        if recursive:
-            # Use Path.rglob for recursive scanning
-            for path in directory.rglob(pattern):
-                if (include_files and await aiofiles.os.path.isfile(path)) or (
-                    include_dirs and await aiofiles.os.path.isdir(path)
-                ):
-                    yield path
-        else:
-            # Use Path.glob for non-recursive scanning
-            for path in directory.glob(pattern):
-                if (include_files and await aiofiles.os.path.isfile(path)) or (
-                    include_dirs and await aiofiles.os.path.isdir(path)
-                ):
-                    yield path
+        while True:
+            step = _file_io_executor.submit(next, walker, None)
+            batch = await asyncio.wrap_future(step)
+            if not batch:
+                break
+            for path in batch:
+                yield path
 
     except OSError as e:
-        logger.error("Error scanning directory", directory=str(directory), error=str(e))
-        raise FileOperationError(f"Cannot scan directory {directory}: {e}") from e
+        raise _directory_error(directory, e) from e
+    finally:
+        # Cancelled while a pool thread is still inside next(): closing the
+        # generator under it would raise ValueError over the cancellation
+        if step is not None and not step.done():
+            with contextlib.suppress(Exception):
+                await asyncio.shield(asyncio.wrap_future(step))
+        walker.close()
+
+
+def _sum_tree(directory: Path) -> tuple[int, int]:
+    """Total the sizes of all files under a directory in one walk.
+
+    Walks like :func:`_iter_scan` and stats each file through
+    ``DirEntry.stat``; files that vanish or cannot be stat'ed are skipped.
+
+    Raises:
+        OSError: If ``directory`` itself cannot be read
+    """
+    total_size = 0
+    file_count = 0
+    pending = [directory]
+    top_level = True
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.is_file():
+                        try:
+                            total_size += entry.stat().st_size
+                        except OSError:
+                            continue
+                        file_count += 1
+        except OSError:
+            if top_level:
+                raise
+        top_level = False
+
+    return total_size, file_count
 
 
 async def get_directory_size(directory: Path) -> tuple[int, int]:
@@ -332,26 +698,10 @@ async def get_directory_size(directory: Path) -> tuple[int, int]:
     Raises:
         FileNotFoundError: If directory doesn't exist
     """
-    if not await aiofiles.os.path.exists(directory):
-        raise FileNotFoundError(f"Directory not found: {directory}")
-
-    total_size = 0
-    file_count = 0
-
     try:
-        async for file_path in scan_directory(
-            directory, recursive=True, include_files=True
-        ):
-            try:
-                stat_result = await aiofiles.os.stat(file_path)
-                total_size += stat_result.st_size
-                file_count += 1
-            except OSError:
-                # Skip files that can't be accessed
-                continue
-    except FileOperationError:
-        # Re-raise directory scanning errors
-        raise
+        total_size, file_count = await _run_file_io(_sum_tree, directory)
+    except OSError as e:
+        raise _directory_error(directory, e) from e
 
     logger.debug(
         "Directory size calculated",
@@ -363,6 +713,37 @@ async def get_directory_size(directory: Path) -> tuple[int, int]:
     return total_size, file_count
 
 
+def _remove_empty_directories(root_directory: Path) -> int:
+    """Remove empty directories below a root, children before parents.
+
+    ``os.walk(topdown=False)`` lists each directory before its parent, so a
+    parent emptied by removing its children is removed too. Directories
+    with files are not tried; for the rest the rmdir itself is the
+    emptiness check.
+    """
+
+    def raise_for_root(error: OSError) -> None:
+        if error.filename == str(root_directory):
+            raise error
+
+    removed_count = 0
+
+    for dir_path, _, file_names in os.walk(
+        root_directory, topdown=False, onerror=raise_for_root
+    ):
+        if file_names or dir_path == str(root_directory):
+            continue
+        try:
+            Path(dir_path).rmdir()
+        except OSError:
+            # Not empty, or can't be removed
+            continue
+        removed_count += 1
+        logger.debug("Removed empty directory", path=dir_path)
+
+    return removed_count
+
+
 async def clean_empty_directories(root_directory: Path) -> int:
     """Remove empty directories recursively.
 
@@ -375,40 +756,10 @@ async def clean_empty_directories(root_directory: Path) -> int:
     Raises:
         FileNotFoundError: If root directory doesn't exist
     """
-    if not await aiofiles.os.path.exists(root_directory):
-        raise FileNotFoundError(f"Directory not found: {root_directory}")
-
-    removed_count = 0
-
-    # Collect all directories first (to avoid modification during iteration)
-    directories = []
-    async for dir_path in scan_directory(
-        root_directory, recursive=True, include_files=False, include_dirs=True
-    ):
-        directories.append(dir_path)
-
-    # Sort by depth (deepest first) to ensure we remove child dirs before parents
-    directories.sort(key=lambda p: len(p.parts), reverse=True)
-
-    for dir_path in directories:
-        try:
-            # Don't remove the root directory itself
-            if dir_path == root_directory:
-                continue
-
-            # Check if directory is empty
-            try:
-                next(dir_path.iterdir())
-                # Directory is not empty, skip
-                continue
-            except StopIteration:
-                # Directory is empty, remove it
-                await aiofiles.os.rmdir(dir_path)
-                removed_count += 1
-                logger.debug("Removed empty directory", path=str(dir_path))
-        except OSError:
-            # Skip directories that can't be removed
-            continue
+    try:
+        removed_count = await _run_file_io(_remove_empty_directories, root_directory)
+    except OSError as e:
+        raise _directory_error(root_directory, e) from e
 
     logger.info(
         "Empty directory cleanup completed",
@@ -419,7 +770,7 @@ async def clean_empty_directories(root_directory: Path) -> int:
     return removed_count
 
 
-async def safe_filename(filename: str, *, replacement: str = "_") -> str:
+def safe_filename(filename: str, *, replacement: str = "_") -> str:
     """Create filesystem-safe filename.
 
     Args:
@@ -452,40 +803,76 @@ async def safe_filename(filename: str, *, replacement: str = "_") -> str:
 
 
 # Convenience functions for common file extensions
-VIDEO_EXTENSIONS = {
-    ".mp4",
-    ".mkv",
-    ".avi",
-    ".mov",
-    ".wmv",
-    ".flv",
-    ".webm",
-    ".m4v",
-    ".mpg",
-    ".mpeg",
-    ".3gp",
-    ".ogv",
-    ".rm",
-    ".rmvb",
-    ".asf",
-    ".ts",
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".m4v",
+        ".mpg",
+        ".mpeg",
+        ".3gp",
+        ".ogv",
+        ".rm",
+        ".rmvb",
+        ".asf",
+        ".ts",
+    }
+)
+
+SUBTITLE_EXTENSIONS = frozenset(
+    {".srt", ".ass", ".ssa", ".vtt", ".sub", ".idx", ".sup"}
+)
+
+IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"}
+)
+
+MediaKind = Literal["video", "subtitle", "image"]
+
+# Lowercase extension -> media kind, for classify_media
+_MEDIA_KINDS: dict[str, MediaKind] = {
+    **dict.fromkeys(VIDEO_EXTENSIONS, "video"),
+    **dict.fromkeys(SUBTITLE_EXTENSIONS, "subtitle"),
+    **dict.fromkeys(IMAGE_EXTENSIONS, "image"),
 }
 
-SUBTITLE_EXTENSIONS = {".srt", ".ass", ".ssa", ".vtt", ".sub", ".idx", ".sup"}
 
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"}
+def name_suffix(name: str) -> str:
+    """Get the lowercase suffix of a file name, like ``Path.suffix``.
+
+    Works on the bare name, so directory walks can filter ``DirEntry``
+    names without building a ``Path`` first.
+    """
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+
+
+def classify_media(file_path: Path) -> MediaKind | None:
+    """Classify a file as video, subtitle or image based on extension.
+
+    The suffix is looked up once for all three kinds.
+
+    Returns:
+        The media kind, or None for any other file
+    """
+    return _MEDIA_KINDS.get(name_suffix(file_path.name))
 
 
 def is_video_file(file_path: Path) -> bool:
     """Check if file is a video file based on extension."""
-    return file_path.suffix.lower() in VIDEO_EXTENSIONS
+    return classify_media(file_path) == "video"
 
 
 def is_subtitle_file(file_path: Path) -> bool:
     """Check if file is a subtitle file based on extension."""
-    return file_path.suffix.lower() in SUBTITLE_EXTENSIONS
+    return classify_media(file_path) == "subtitle"
 
 
 def is_image_file(file_path: Path) -> bool:
     """Check if file is an image file based on extension."""
-    return file_path.suffix.lower() in IMAGE_EXTENSIONS
+    return classify_media(file_path) == "image"
@@ -413,7 +413,7 @@ async def format_movie_file_name(
         filename += file_extension
 
     # Make filename safe
-    return await safe_filename(filename)
+    return safe_filename(filename)
 
 
 def format_tv_show_folder_name(
@@ -564,7 +564,7 @@ async def format_tv_episode_file_name(
         filename += file_extension
 
     # Make filename safe
-    return await safe_filename(filename)
+    return safe_filename(filename)
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -0,0 +1,312 @@
+"""Unit tests for the async file operation utilities.
+
+This module tests directory scanning, hashing, copying and cleanup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import hashlib
+import os
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from smart_media_organizer.utils import file_ops
+from smart_media_organizer.utils.file_ops import (
+    TREE_HASH_ALGORITHM,
+    FileIntegrityError,
+    FileNotFoundError,
+    FileOperationError,
+    _fast_copy,
+    _tree_hash,
+    calculate_file_hash,
+    classify_media,
+    clean_empty_directories,
+    copy_file_atomic,
+    get_directory_size,
+    name_suffix,
+    scan_directory,
+)
+
+
+class TestScanDirectory:
+    """Test the scan_directory function."""
+
+    @pytest.mark.asyncio
+    async def test_scan_directory_finds_nested_files(self, temp_dir) -> None:
+        """Test recursive scanning with a glob pattern."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "top.mkv").write_bytes(b"x")
+        (temp_dir / "a" / "b" / "deep.mkv").write_bytes(b"x")
+        (temp_dir / "a" / "notes.txt").write_bytes(b"x")
+
+        found = [path async for path in scan_directory(temp_dir, pattern="*.mkv")]
+
+        assert sorted(found) == sorted(
+            [temp_dir / "top.mkv", temp_dir / "a" / "b" / "deep.mkv"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_scan_directory_cancelled_mid_step(self, temp_dir) -> None:
+        """Test cancelling while a directory read is still on the pool thread."""
+        for i in range(3):
+            subdir = temp_dir / f"dir{i}"
+            subdir.mkdir()
+            (subdir / "file.mkv").write_bytes(b"x")
+
+        real_scandir = os.scandir
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_scandir(path):
+            started.set()
+            release.wait(5)
+            return real_scandir(path)
+
+        async def consume() -> None:
+            async for _ in scan_directory(temp_dir):
+                pass
+
+        with patch.object(file_ops.os, "scandir", side_effect=slow_scandir):
+            task = asyncio.create_task(consume())
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            await asyncio.sleep(0)
+            release.set()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+
+class TestCopyFileAtomic:
+    """Test the copy_file_atomic function."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("verify", [True, False])
+    async def test_copy_file_atomic(self, temp_dir, verify) -> None:
+        """Test verified and unverified copies produce identical files."""
+        source = temp_dir / "source.mkv"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        destination = temp_dir / "out" / "copy.mkv"
+
+        result = await copy_file_atomic(
+            source, destination, verify_integrity=verify, preserve_metadata=False
+        )
+
+        assert result == destination
+        assert destination.read_bytes() == source.read_bytes()
+        assert list(destination.parent.iterdir()) == [destination]
+
+    @pytest.mark.asyncio
+    async def test_copy_file_atomic_missing_source(self, temp_dir) -> None:
+        """Test a missing source raises before creating any directories."""
+        destination = temp_dir / "out" / "copy.mkv"
+
+        with pytest.raises(FileNotFoundError):
+            await copy_file_atomic(
+                temp_dir / "missing.mkv", destination, preserve_metadata=False
+            )
+
+        assert not (temp_dir / "out").exists()
+
+    @pytest.mark.asyncio
+    async def test_copy_file_atomic_hash_mismatch(self, temp_dir) -> None:
+        """Test a failed integrity check raises and removes the temp file."""
+        source = temp_dir / "source.mkv"
+        source.write_bytes(b"content")
+        destination = temp_dir / "copy.mkv"
+
+        with patch.object(
+            file_ops, "calculate_file_hash", return_value="mismatch"
+        ), pytest.raises(FileOperationError) as exc_info:
+            await copy_file_atomic(source, destination, preserve_metadata=False)
+
+        assert isinstance(exc_info.value.__cause__, FileIntegrityError)
+        assert sorted(temp_dir.iterdir()) == [source]
+
+
+class TestTreeHash:
+    """Test the sha256-tree digest."""
+
+    @pytest.mark.asyncio
+    async def test_tree_hash_matches_definition(self, temp_dir) -> None:
+        """Test the digest is sha256 over the shard digests, in order."""
+        data = os.urandom(10 * 1000 + 123)
+        test_file = temp_dir / "test.mkv"
+        test_file.write_bytes(data)
+
+        expected = hashlib.sha256(
+            b"".join(
+                hashlib.sha256(data[start : start + 1000]).digest()
+                for start in range(0, len(data), 1000)
+            )
+        ).hexdigest()
+
+        assert await _tree_hash(test_file, shard_size=1000) == expected
+        assert await _tree_hash(test_file, shard_size=1000) == expected
+        assert await _tree_hash(test_file, shard_size=4096) != expected
+
+    @pytest.mark.asyncio
+    async def test_tree_hash_empty_file(self, temp_dir) -> None:
+        """Test an empty file hashes to the digest of no shards."""
+        test_file = temp_dir / "empty.mkv"
+        test_file.write_bytes(b"")
+
+        assert await _tree_hash(test_file) == hashlib.sha256().hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_tree_hash_missing_file(self, temp_dir) -> None:
+        """Test a missing file raises the module's FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await calculate_file_hash(
+                temp_dir / "missing.mkv", algorithm=TREE_HASH_ALGORITHM
+            )
+
+    @pytest.mark.asyncio
+    async def test_tree_hash_closes_mapping_after_failed_shard(self, temp_dir) -> None:
+        """Test a failing shard leaves the mapping closed, not leaked."""
+        test_file = temp_dir / "test.mkv"
+        test_file.write_bytes(os.urandom(8 * 1000))
+
+        real_map_file = file_ops._map_file
+        real_hash_shard = file_ops._hash_shard
+        mappings = []
+
+        def map_file(path):
+            mapping = real_map_file(path)
+            mappings.append(mapping)
+            return mapping
+
+        def hash_shard(mapped, start, shard_size):
+            if start == 3000:
+                raise OSError("read error")
+            return real_hash_shard(mapped, start, shard_size)
+
+        with patch.object(file_ops, "_map_file", side_effect=map_file), patch.object(
+            file_ops, "_hash_shard", side_effect=hash_shard
+        ), pytest.raises(OSError, match="read error"):
+            await _tree_hash(test_file, shard_size=1000)
+
+        f, mapped = mappings[0]
+        assert mapped.closed
+        assert f.closed
+
+
+class TestFastCopy:
+    """Test the kernel copy fallback chain."""
+
+    @staticmethod
+    def _fail_after_first_chunk(real_copy, error_number):
+        """Wrap a kernel copy call to copy one small chunk, then fail."""
+        calls = []
+
+        def copy_chunk(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise OSError(error_number, os.strerror(error_number))
+            return real_copy(*args[:-1], 1000)
+
+        return copy_chunk
+
+    @pytest.mark.parametrize("sendfile_fails", [False, True])
+    def test_fast_copy_falls_back_part_way(self, temp_dir, sendfile_fails) -> None:
+        """Test a copy interrupted by EXDEV resumes with the next method."""
+        data = os.urandom(64 * 1024 + 5)
+        source = temp_dir / "source.mkv"
+        source.write_bytes(data)
+        destination = temp_dir / "copy.mkv"
+
+        copy_file_range = self._fail_after_first_chunk(os.copy_file_range, errno.EXDEV)
+        sendfile = (
+            self._fail_after_first_chunk(os.sendfile, errno.EINVAL)
+            if sendfile_fails
+            else os.sendfile
+        )
+
+        with patch.object(
+            file_ops.os, "copy_file_range", side_effect=copy_file_range
+        ), patch.object(file_ops.os, "sendfile", side_effect=sendfile):
+            _fast_copy(source, destination)
+
+        assert destination.read_bytes() == data
+
+
+class TestDirectoryMaintenance:
+    """Test directory size and empty-directory cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_get_directory_size(self, temp_dir) -> None:
+        """Test sizes and counts are totalled across nested directories."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "one.mkv").write_bytes(b"x" * 10)
+        (temp_dir / "a" / "two.srt").write_bytes(b"x" * 20)
+        (temp_dir / "a" / "b" / "three.jpg").write_bytes(b"x" * 30)
+
+        assert await get_directory_size(temp_dir) == (60, 3)
+
+    @pytest.mark.asyncio
+    async def test_get_directory_size_missing(self, temp_dir) -> None:
+        """Test a missing directory raises the module's FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await get_directory_size(temp_dir / "missing")
+
+    @pytest.mark.asyncio
+    async def test_clean_empty_directories(self, temp_dir) -> None:
+        """Test nested empty directories are removed and others are kept."""
+        (temp_dir / "empty" / "nested" / "deeper").mkdir(parents=True)
+        (temp_dir / "kept" / "empty").mkdir(parents=True)
+        (temp_dir / "kept" / "movie.mkv").write_bytes(b"x")
+
+        removed = await clean_empty_directories(temp_dir)
+
+        assert removed == 4
+        assert temp_dir.exists()
+        assert sorted(temp_dir.rglob("*")) == [
+            temp_dir / "kept",
+            temp_dir / "kept" / "movie.mkv",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_clean_empty_directories_keeps_empty_root(self, temp_dir) -> None:
+        """Test the root itself is kept even when it ends up empty."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+
+        assert await clean_empty_directories(temp_dir) == 2
+        assert temp_dir.is_dir()
+        assert not any(temp_dir.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_clean_empty_directories_missing_root(self, temp_dir) -> None:
+        """Test a missing root raises the module's FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await clean_empty_directories(temp_dir / "missing")
+
+
+class TestMediaClassification:
+    """Test extension parsing and media classification."""
+
+    @pytest.mark.parametrize(
+        ("name", "suffix"),
+        [
+            ("movie.MKV", ".mkv"),
+            ("archive.tar.gz", ".gz"),
+            (".mkv", ""),
+            ("movie.", ""),
+            ("README", ""),
+        ],
+    )
+    def test_name_suffix_matches_path_suffix(self, name, suffix) -> None:
+        """Test the suffix follows ``Path.suffix``, lowercased."""
+        assert name_suffix(name) == suffix == Path(name).suffix.lower()
+
+    def test_classify_media(self) -> None:
+        """Test each media kind is recognized regardless of case."""
+        assert classify_media(Path("movie.MKV")) == "video"
+        assert classify_media(Path("subs.srt")) == "subtitle"
+        assert classify_media(Path("poster.jpg")) == "image"
+        assert classify_media(Path("notes.txt")) is None
+        assert classify_media(Path(".mkv")) is None
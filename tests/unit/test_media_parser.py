@@ -5,16 +5,27 @@ This module tests the MediaFileParser and MediaInfoExtractor components.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import gc
+import hashlib
+import json
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from smart_media_organizer.models.media_file import (
     AudioCodec,
+    AudioTrackInfo,
+    GeneralTrackInfo,
+    MediaFile,
+    MediaFileInfo,
     ProcessingStatus,
     VideoCodec,
     VideoFormat,
     VideoResolution,
+    VideoTrackInfo,
 )
 from smart_media_organizer.services.media_parser import (
     CorruptedFileError,
@@ -22,9 +33,18 @@ from smart_media_organizer.services.media_parser import (
     MediaInfoExtractor,
     MediaParserError,
     UnsupportedFileError,
+    _inform_json,
+    _json_output_supported,
+    _read_media_info,
+    iter_verified_media_files,
     parse_media_file,
     verify_media_files,
 )
+from smart_media_organizer.utils.file_ops import HASH_CHUNK_SIZE
+
+# Minimal container headers padded past the parser's minimum file size
+MP4_CONTENT = b"\x00\x00\x00\x20ftypisom" + bytes(2048)
+MKV_CONTENT = b"\x1a\x45\xdf\xa3" + bytes(2048)
 
 
 class TestMediaInfoExtractor:
@@ -35,28 +55,6 @@ class TestMediaInfoExtractor:
         extractor = MediaInfoExtractor()
         assert extractor is not None
 
-    def test_safe_get_track_value(self) -> None:
-        """Test safe track value retrieval."""
-        extractor = MediaInfoExtractor()
-
-        # Mock track with some attributes
-        mock_track = Mock()
-        mock_track.width = 1920
-        mock_track.height = 1080
-
-        # Test successful retrieval
-        assert extractor._safe_get_track_value(mock_track, "width") == 1920
-        assert extractor._safe_get_track_value(mock_track, "height") == 1080
-
-        # Test missing attribute with default
-        assert (
-            extractor._safe_get_track_value(mock_track, "missing", "default")
-            == "default"
-        )
-
-        # Test missing attribute without default
-        assert extractor._safe_get_track_value(mock_track, "missing") is None
-
     def test_parse_video_codec(self) -> None:
         """Test video codec parsing."""
         extractor = MediaInfoExtractor()
@@ -142,35 +140,227 @@ class TestMediaInfoExtractor:
         """Test successful media info extraction."""
         extractor = MediaInfoExtractor()
         test_file = temp_dir / "test.mp4"
-        test_file.write_bytes(b"fake video content")
+        test_file.write_bytes(MP4_CONTENT)
 
-        # Mock MediaInfo.parse
+        # Mock the libmediainfo parse
         mock_media_info = Mock()
         mock_media_info.tracks = [Mock(), Mock()]  # Some tracks
 
         with patch(
-            "smart_media_organizer.services.media_parser.MediaInfo.parse"
+            "smart_media_organizer.services.media_parser._read_media_info"
         ) as mock_parse:
             mock_parse.return_value = mock_media_info
 
             result = await extractor.extract_media_info(test_file)
 
             assert result == mock_media_info
-            mock_parse.assert_called_once_with(str(test_file))
+            mock_parse.assert_called_once_with(str(test_file), False)
+
+    @pytest.mark.asyncio
+    async def test_extract_media_info_runs_on_parse_pool(self, temp_dir) -> None:
+        """Test media info parsing runs on the dedicated parse threads."""
+        extractor = MediaInfoExtractor()
+        test_file = temp_dir / "test.mkv"
+        test_file.write_bytes(MKV_CONTENT)
+
+        mock_media_info = Mock()
+        mock_media_info.tracks = [Mock()]
+        thread_names = []
+
+        def fake_parse(path: str, quick: bool = False) -> Mock:
+            thread_names.append(threading.current_thread().name)
+            return mock_media_info
+
+        with patch(
+            "smart_media_organizer.services.media_parser._read_media_info",
+            side_effect=fake_parse,
+        ):
+            result = await extractor.extract_media_info(test_file)
+
+        assert result is mock_media_info
+        assert thread_names[0].startswith("mediainfo")
+
+    def test_extract_media_info_sync(self, temp_dir) -> None:
+        """Test synchronous extraction parses on the calling thread."""
+        extractor = MediaInfoExtractor()
+        test_file = temp_dir / "test.mkv"
+        test_file.write_bytes(MKV_CONTENT)
+
+        mock_media_info = Mock()
+        mock_media_info.tracks = [Mock()]
+        thread_names = []
+
+        def fake_parse(path: str) -> Mock:
+            thread_names.append(threading.current_thread().name)
+            return mock_media_info
+
+        with patch(
+            "smart_media_organizer.services.media_parser._read_media_info",
+            side_effect=fake_parse,
+        ):
+            assert extractor.extract_media_info_sync(test_file) is mock_media_info
+
+            mock_media_info.tracks = []
+            with pytest.raises(UnsupportedFileError):
+                extractor.extract_media_info_sync(test_file)
+
+        assert thread_names == [threading.current_thread().name] * 2
+
+    @pytest.mark.parametrize(
+        ("message", "expected_error"),
+        [
+            ("File is Corrupted", CorruptedFileError),
+            ("Invalid header", CorruptedFileError),
+            ("stream truncated", CorruptedFileError),
+            ("malformed atom", CorruptedFileError),
+            ("Unknown container", UnsupportedFileError),
+        ],
+    )
+    def test_parse_errors_are_classified(
+        self, temp_dir, message, expected_error
+    ) -> None:
+        """Test that parse failures map to corrupted or unsupported errors."""
+        extractor = MediaInfoExtractor()
+        test_file = temp_dir / "test.mkv"
+        test_file.write_bytes(MKV_CONTENT)
+
+        with patch(
+            "smart_media_organizer.services.media_parser._read_media_info",
+            side_effect=RuntimeError(message),
+        ), pytest.raises(expected_error):
+            extractor.extract_media_info_sync(test_file)
+
+    def test_read_media_info_maps_json_fields(self) -> None:
+        """Test that JSON output is mapped onto pymediainfo track names."""
+        document = {
+            "media": {
+                "track": [
+                    {"@type": "General", "Duration": "7200.500", "Format": "Matroska"},
+                    {"@type": "Video", "Width": "1920", "Height": "1080"},
+                    {"@type": "Audio", "Channels": "6", "SamplingRate": "48000"},
+                ]
+            }
+        }
+
+        with patch(
+            "smart_media_organizer.services.media_parser._json_output_supported",
+            return_value=True,
+        ), patch(
+            "smart_media_organizer.services.media_parser._inform_json",
+            return_value=json.dumps(document),
+        ) as mock_inform:
+            media_info = _read_media_info("movie.mkv")
+
+        mock_inform.assert_called_once_with("movie.mkv", False)
+
+        extractor = MediaInfoExtractor()
+        tracks = extractor.classify_tracks(media_info)
+        assert extractor.extract_general_info(media_info, tracks).duration == 7200
+        assert extractor.extract_video_info(media_info, tracks).resolution == (
+            VideoResolution.FHD_1080P
+        )
+        assert extractor.extract_audio_info(media_info, tracks).channels == 6
+
+    @pytest.mark.parametrize(
+        "library",
+        [
+            AttributeError("_get_library"),
+            ValueError("not enough values to unpack"),
+            (Mock(), "handle", None),
+        ],
+        ids=["missing", "raises", "shape"],
+    )
+    def test_json_output_unsupported_private_api(self, library) -> None:
+        """Test that an unexpected private pymediainfo API falls back to XML."""
+        _json_output_supported.cache_clear()
+        try:
+            with patch(
+                "smart_media_organizer.services.media_parser.MediaInfo._get_library",
+                **(
+                    {"side_effect": library}
+                    if isinstance(library, Exception)
+                    else {"return_value": library}
+                ),
+            ):
+                assert _json_output_supported() is False
+        finally:
+            _json_output_supported.cache_clear()
+
+    def test_inform_json_frees_handle_with_thread(self) -> None:
+        """Test that a parse thread's libmediainfo handle is freed when it exits."""
+        lib = Mock()
+        lib.MediaInfo_Open.return_value = 1
+        lib.MediaInfo_Inform.return_value = "{}"
+
+        with patch(
+            "smart_media_organizer.services.media_parser.MediaInfo._get_library",
+            return_value=(lib, "handle", None, (24, 12)),
+        ):
+            worker = threading.Thread(target=_inform_json, args=("movie.mkv", False))
+            worker.start()
+            worker.join()
+
+        gc.collect()
+        lib.MediaInfo_Delete.assert_called_once_with("handle")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("file_name", "content"),
+        [
+            ("empty.mp4", b""),
+            ("short.mkv", MKV_CONTENT[:100]),
+            ("mislabeled.mkv", MP4_CONTENT),
+        ],
+        ids=["empty", "too-small", "header"],
+    )
+    async def test_extract_media_info_rejects_non_media(
+        self, temp_dir, file_name, content
+    ) -> None:
+        """Test that obvious non-media files are rejected without parsing."""
+        extractor = MediaInfoExtractor()
+        test_file = temp_dir / file_name
+        test_file.write_bytes(content)
+
+        with patch(
+            "smart_media_organizer.services.media_parser._read_media_info"
+        ) as mock_parse, pytest.raises(UnsupportedFileError):
+            await extractor.extract_media_info(test_file)
+
+        mock_parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_media_info_accepts_configured_extension(
+        self, temp_dir
+    ) -> None:
+        """Test that extensions outside the built-in video set are still parsed."""
+        extractor = MediaInfoExtractor()
+        test_file = temp_dir / "movie.divx"
+        test_file.write_bytes(MP4_CONTENT)
+
+        mock_media_info = Mock()
+        mock_media_info.tracks = [Mock(track_type="General")]
+
+        with patch(
+            "smart_media_organizer.services.media_parser._read_media_info",
+            return_value=mock_media_info,
+        ) as mock_parse:
+            assert await extractor.extract_media_info(test_file) is mock_media_info
+
+        mock_parse.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_extract_media_info_no_tracks(self, temp_dir) -> None:
         """Test media info extraction with no tracks."""
         extractor = MediaInfoExtractor()
         test_file = temp_dir / "test.mp4"
-        test_file.write_bytes(b"fake content")
+        test_file.write_bytes(MP4_CONTENT)
 
-        # Mock MediaInfo.parse to return info with no tracks
+        # Mock the libmediainfo parse to return info with no tracks
         mock_media_info = Mock()
         mock_media_info.tracks = []
 
         with patch(
-            "smart_media_organizer.services.media_parser.MediaInfo.parse"
+            "smart_media_organizer.services.media_parser._read_media_info"
         ) as mock_parse:
             mock_parse.return_value = mock_media_info
 
@@ -182,10 +372,10 @@ class TestMediaInfoExtractor:
         """Test media info extraction with corrupted file."""
         extractor = MediaInfoExtractor()
         test_file = temp_dir / "corrupted.mp4"
-        test_file.write_bytes(b"corrupted content")
+        test_file.write_bytes(MP4_CONTENT)
 
         with patch(
-            "smart_media_organizer.services.media_parser.MediaInfo.parse"
+            "smart_media_organizer.services.media_parser._read_media_info"
         ) as mock_parse:
             mock_parse.side_effect = Exception("File is corrupted")
 
@@ -212,13 +402,13 @@ class TestMediaInfoExtractor:
 
         result = extractor.extract_video_info(mock_media_info)
 
-        assert result["codec"] == VideoCodec.H264
-        assert result["width"] == 1920
-        assert result["height"] == 1080
-        assert result["resolution"] == VideoResolution.FHD_1080P
-        assert result["bitrate"] == 5000000
-        assert result["fps"] == 23.976
-        assert result["bit_depth"] == 8
+        assert result.codec == VideoCodec.H264
+        assert result.width == 1920
+        assert result.height == 1080
+        assert result.resolution == VideoResolution.FHD_1080P
+        assert result.bitrate == 5000000
+        assert result.fps == 23.976
+        assert result.bit_depth == 8
 
     def test_extract_video_info_no_track(self) -> None:
         """Test video info extraction without video track."""
@@ -229,10 +419,10 @@ class TestMediaInfoExtractor:
 
         result = extractor.extract_video_info(mock_media_info)
 
-        assert result["codec"] == VideoCodec.UNKNOWN
-        assert result["resolution"] == VideoResolution.UNKNOWN
-        assert result["width"] is None
-        assert result["height"] is None
+        assert result.codec == VideoCodec.UNKNOWN
+        assert result.resolution == VideoResolution.UNKNOWN
+        assert result.width is None
+        assert result.height is None
 
     def test_extract_audio_info_with_track(self) -> None:
         """Test audio info extraction with audio track."""
@@ -251,10 +441,32 @@ class TestMediaInfoExtractor:
 
         result = extractor.extract_audio_info(mock_media_info)
 
-        assert result["codec"] == AudioCodec.AAC
-        assert result["channels"] == 6
-        assert result["sample_rate"] == 48000
-        assert result["bitrate"] == 320000
+        assert result.codec == AudioCodec.AAC
+        assert result.channels == 6
+        assert result.sample_rate == 48000
+        assert result.bitrate == 320000
+
+    def test_classify_tracks(self) -> None:
+        """Test the first track of each type is found in one pass."""
+        extractor = MediaInfoExtractor()
+
+        general, video, audio, commentary, text = (
+            Mock(track_type=track_type)
+            for track_type in ("General", "Video", "Audio", "Audio", "Text")
+        )
+        mock_media_info = Mock()
+        mock_media_info.tracks = [general, video, audio, commentary, text]
+
+        tracks = extractor.classify_tracks(mock_media_info)
+
+        assert tracks == {"General": general, "Video": video, "Audio": audio}
+
+        mock_media_info.tracks = [text, audio]
+        assert extractor.classify_tracks(mock_media_info) == {
+            "Text": text,
+            "Audio": audio,
+        }
+        assert extractor.extract_video_info(mock_media_info).width is None
 
     def test_extract_general_info_with_track(self) -> None:
         """Test general info extraction with general track."""
@@ -272,9 +484,40 @@ class TestMediaInfoExtractor:
 
         result = extractor.extract_general_info(mock_media_info)
 
-        assert result["duration"] == 7200  # 2 hours in seconds
-        assert result["file_size"] == 1073741824
-        assert result["container"] == "matroska"
+        assert result.duration == 7200  # 2 hours in seconds
+        assert result.file_size == 1073741824
+        assert result.container == "matroska"
+
+    @pytest.mark.asyncio
+    async def test_extract_all_reuses_unchanged_file(self, tmp_path) -> None:
+        """Test that extraction is cached until the file changes."""
+        extractor = MediaInfoExtractor()
+        media_path = tmp_path / "movie.mkv"
+        media_path.write_bytes(b"video")
+
+        mock_media_info = Mock()
+        mock_media_info.tracks = []
+
+        with patch.object(
+            extractor, "extract_media_info", new=AsyncMock(return_value=mock_media_info)
+        ) as mock_extract:
+            first = await extractor.extract_all(media_path)
+            second = await extractor.extract_all(media_path)
+
+            assert second is first
+            assert mock_extract.await_count == 1
+
+            # Cached records are shared, so callers cannot change them
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                first[0].fps = 25.0
+
+            media_path.write_bytes(b"longer video")
+            await extractor.extract_all(media_path)
+            assert mock_extract.await_count == 2
+
+            extractor.clear_cache()
+            await extractor.extract_all(media_path)
+            assert mock_extract.await_count == 3
 
 
 class TestMediaFileParser:
@@ -304,27 +547,27 @@ class TestMediaFileParser:
             parser.extractor, "extract_general_info"
         ) as mock_general:
             mock_extract.return_value = mock_media_info
-            mock_video.return_value = {
-                "codec": VideoCodec.H264,
-                "resolution": VideoResolution.FHD_1080P,
-                "width": 1920,
-                "height": 1080,
-                "bitrate": 5000000,
-                "fps": 23.976,
-                "bit_depth": 8,
-                "format": VideoFormat.BLURAY,
-            }
-            mock_audio.return_value = {
-                "codec": AudioCodec.AAC,
-                "channels": 6,
-                "sample_rate": 48000,
-                "bitrate": 320000,
-            }
-            mock_general.return_value = {
-                "duration": 7200,
-                "file_size": 1073741824,
-                "container": "matroska",
-            }
+            mock_video.return_value = VideoTrackInfo(
+                codec=VideoCodec.H264,
+                resolution=VideoResolution.FHD_1080P,
+                width=1920,
+                height=1080,
+                bitrate=5000000,
+                fps=23.976,
+                bit_depth=8,
+                format=VideoFormat.BLURAY,
+            )
+            mock_audio.return_value = AudioTrackInfo(
+                codec=AudioCodec.AAC,
+                channels=6,
+                sample_rate=48000,
+                bitrate=320000,
+            )
+            mock_general.return_value = GeneralTrackInfo(
+                duration=7200,
+                file_size=1073741824,
+                container="matroska",
+            )
 
             result = await parser.parse_media_file(sample_media_file)
 
@@ -348,6 +591,46 @@ class TestMediaFileParser:
             assert sample_media_file.processing_status == ProcessingStatus.FAILED
             assert sample_media_file.error_message is not None
 
+    @pytest.mark.asyncio
+    async def test_parse_many_bounds_files_in_flight(self, temp_dir) -> None:
+        """Test batch parsing keeps a bounded number of files in flight."""
+        parser = MediaFileParser()
+        media_files = [
+            MediaFile(
+                info=MediaFileInfo(
+                    file_path=temp_dir / f"file{i}.mkv",
+                    file_size=1024,
+                    file_extension=".mkv",
+                )
+            )
+            for i in range(10)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract_all(file_path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if file_path.name == "file3.mkv":
+                raise UnsupportedFileError("Test error")
+            return VideoTrackInfo(), AudioTrackInfo(), GeneralTrackInfo()
+
+        with patch.object(
+            parser.extractor, "extract_all", side_effect=fake_extract_all
+        ):
+            results = await parser.parse_many(media_files, concurrency=3)
+
+        assert peak == 3
+        assert results == media_files
+        assert [
+            media_file.info.file_path.name
+            for media_file in results
+            if media_file.processing_status == ProcessingStatus.FAILED
+        ] == ["file3.mkv"]
+
     @pytest.mark.asyncio
     async def test_verify_file_integrity_valid(self, temp_dir) -> None:
         """Test file integrity verification for valid file."""
@@ -369,6 +652,52 @@ class TestMediaFileParser:
             result = await parser.verify_file_integrity(test_file)
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_verify_file_integrity_parses_headers_first(self, temp_dir) -> None:
+        """Test that a full parse only follows a quick parse lacking duration."""
+        parser = MediaFileParser()
+        test_file = temp_dir / "valid.mp4"
+
+        headers_only = Mock()
+        headers_only.tracks = [Mock(track_type="General", duration=None)]
+        complete = Mock()
+        complete.tracks = [Mock(track_type="General", duration=7200000)]
+
+        with patch.object(parser.extractor, "extract_media_info") as mock_extract:
+            mock_extract.return_value = complete
+            assert await parser.verify_file_integrity(test_file) is True
+            mock_extract.assert_called_once_with(test_file, quick=True)
+
+            mock_extract.reset_mock()
+            mock_extract.side_effect = [headers_only, complete]
+            assert await parser.verify_file_integrity(test_file) is True
+            assert mock_extract.call_count == 2
+            assert mock_extract.call_args.kwargs == {}
+
+    @pytest.mark.asyncio
+    async def test_verify_file_integrity_without_json_output(self, temp_dir) -> None:
+        """Test quick verification through pymediainfo's XML parse."""
+        parser = MediaFileParser()
+        test_file = temp_dir / "valid.mkv"
+        test_file.write_bytes(MKV_CONTENT)
+
+        display_only = Mock()
+        display_only.tracks = [Mock(track_type="General", duration="2 s 0 ms")]
+        complete = Mock()
+        complete.tracks = [Mock(track_type="General", duration=2000.0)]
+
+        with patch(
+            "smart_media_organizer.services.media_parser._json_output_supported",
+            return_value=False,
+        ), patch(
+            "smart_media_organizer.services.media_parser.MediaInfo.parse",
+            side_effect=[display_only, complete],
+        ) as mock_parse:
+            assert await parser.verify_file_integrity(test_file) is True
+
+        assert mock_parse.call_args_list[0].kwargs == {"parse_speed": 0}
+        assert mock_parse.call_args_list[1].kwargs == {}
+
     @pytest.mark.asyncio
     async def test_verify_file_integrity_invalid(self, temp_dir) -> None:
         """Test file integrity verification for invalid file."""
@@ -392,11 +721,23 @@ class TestMediaFileParser:
         hash_result = await parser.calculate_file_hash(test_file)
 
         assert isinstance(hash_result, str)
-        assert len(hash_result) == 32  # MD5 hash length
+        assert len(hash_result) == 64  # SHA256 hash length
 
         # Test with different algorithm
-        sha256_hash = await parser.calculate_file_hash(test_file, "sha256")
-        assert len(sha256_hash) == 64  # SHA256 hash length
+        md5_hash = await parser.calculate_file_hash(test_file, "md5")
+        assert len(md5_hash) == 32  # MD5 hash length
+
+    @pytest.mark.asyncio
+    async def test_calculate_file_hash_spans_chunks(self, temp_dir) -> None:
+        """Test hashing a file larger than one read chunk."""
+        parser = MediaFileParser()
+        test_file = temp_dir / "large.mkv"
+        content = bytes(range(256)) * (HASH_CHUNK_SIZE // 128 + 3)
+        test_file.write_bytes(content)
+
+        hash_result = await parser.calculate_file_hash(test_file, "sha256")
+
+        assert hash_result == hashlib.sha256(content).hexdigest()
 
 
 class TestConvenienceFunctions:
@@ -456,6 +797,83 @@ class TestConvenienceFunctions:
             assert results[file1] is True
             assert results[file2] is False
 
+    @pytest.mark.asyncio
+    async def test_verify_media_files_bounds_concurrency(self, temp_dir) -> None:
+        """Test verification keeps a bounded number of files in flight."""
+        test_files = [temp_dir / f"file{i}.mp4" for i in range(10)]
+        for test_file in test_files:
+            test_file.write_bytes(b"content")
+        in_flight = 0
+        peak = 0
+
+        async def mock_verify(file_path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if file_path.name == "file3.mp4":
+                raise RuntimeError("parse crashed")
+            return True
+
+        with patch(
+            "smart_media_organizer.services.media_parser.MediaFileParser"
+        ) as mock_parser_class, patch(
+            "smart_media_organizer.services.media_parser.VERIFY_CONCURRENCY", 3
+        ):
+            mock_parser_class.return_value.verify_file_integrity = mock_verify
+
+            results = await verify_media_files(test_files)
+
+        assert peak == 3
+        assert list(results) == test_files
+        assert [path.name for path, ok in results.items() if not ok] == ["file3.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_iter_verified_media_files_yields_in_completion_order(
+        self, temp_dir
+    ) -> None:
+        """Test that a slow verification does not hold back later results."""
+        test_files = [temp_dir / name for name in ("slow.mp4", "fast.mp4")]
+        for test_file in test_files:
+            test_file.write_bytes(b"content")
+        slow_release = asyncio.Event()
+
+        async def mock_verify(file_path):
+            if file_path.name == "slow.mp4":
+                await slow_release.wait()
+            return True
+
+        results = []
+        with patch(
+            "smart_media_organizer.services.media_parser.MediaFileParser"
+        ) as mock_parser_class:
+            mock_parser_class.return_value.verify_file_integrity = mock_verify
+
+            async for file_path, is_valid in iter_verified_media_files(test_files):
+                results.append((file_path.name, is_valid))
+                slow_release.set()
+
+        assert results == [("fast.mp4", True), ("slow.mp4", True)]
+
+    @pytest.mark.asyncio
+    async def test_verify_media_files_skips_missing(self, temp_dir) -> None:
+        """Test that missing files fail verification without being parsed."""
+        present = temp_dir / "present.mp4"
+        present.write_bytes(b"content")
+        missing = temp_dir / "missing.mp4"
+
+        with patch(
+            "smart_media_organizer.services.media_parser.MediaFileParser"
+        ) as mock_parser_class:
+            mock_verify = AsyncMock(return_value=True)
+            mock_parser_class.return_value.verify_file_integrity = mock_verify
+
+            results = await verify_media_files([missing, present])
+
+        assert results == {missing: False, present: True}
+        mock_verify.assert_awaited_once_with(present)
+
 
 class TestErrorHandling:
     """Test error handling scenarios."""
@@ -465,31 +883,16 @@ class TestErrorHandling:
         """Test extractor when thread pool execution fails."""
         extractor = MediaInfoExtractor()
         test_file = temp_dir / "error.mp4"
-        test_file.write_bytes(b"content")
+        test_file.write_bytes(MP4_CONTENT)
 
         with patch(
-            "smart_media_organizer.services.media_parser.MediaInfo.parse"
+            "smart_media_organizer.services.media_parser._read_media_info"
         ) as mock_parse:
             mock_parse.side_effect = RuntimeError("Thread pool error")
 
             with pytest.raises(UnsupportedFileError):
                 await extractor.extract_media_info(test_file)
 
-    def test_safe_get_track_value_with_exception(self) -> None:
-        """Test safe track value retrieval when attribute access raises exception."""
-        extractor = MediaInfoExtractor()
-
-        # Mock track that raises exception on attribute access
-        mock_track = Mock()
-        mock_track.configure_mock(
-            **{"problematic_attr.side_effect": TypeError("Type error")}
-        )
-
-        result = extractor._safe_get_track_value(
-            mock_track, "problematic_attr", "fallback"
-        )
-        assert result == "fallback"
-
     @pytest.mark.asyncio
     async def test_calculate_file_hash_with_invalid_algorithm(self, temp_dir) -> None:
         """Test file hash calculation with invalid algorithm."""
@@ -5,7 +5,12 @@ This module tests the Pydantic data models to ensure they work correctly.
 
 from __future__ import annotations
 
+import copy
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+import json
 from pathlib import Path
+import pickle
 
 from pydantic import ValidationError
 import pytest
@@ -18,8 +23,25 @@ from smart_media_organizer.models.media_file import (
     ProcessingStatus,
     VideoCodec,
     VideoResolution,
+    parse_media_file_infos,
+)
+from smart_media_organizer.models.movie import (
+    AIMovieIdentification,
+    Movie,
+    MovieGenre,
+    TMDBMovieInfo,
+)
+from smart_media_organizer.models.tv_show import (
+    AITVIdentification,
+    Episode,
+    TMDBTVShowInfo,
+    TVCrew,
+    TVEpisode,
+    dump_tv_episodes_json,
+    parse_tmdb_episodes,
+    parse_tmdb_tv_shows,
+    parse_tv_episodes,
 )
-from smart_media_organizer.models.movie import AIMovieIdentification
 
 
 class TestMediaFileInfo:
@@ -52,6 +74,55 @@ class TestMediaFileInfo:
         assert sample_media_file_info.resolution_display == "1920x1080"
         assert sample_media_file_info.audio_channels_display == "5.1 (Surround)"
 
+    def test_cached_fields_follow_assignment(
+        self, sample_media_file_info: MediaFileInfo
+    ) -> None:
+        """Test cached computed fields are reset when a field changes."""
+        assert sample_media_file_info.resolution_display == "1920x1080"
+
+        sample_media_file_info.video_width = 3840
+        sample_media_file_info.video_height = 2160
+        assert sample_media_file_info.resolution_display == "3840x2160"
+
+        copied = sample_media_file_info.model_copy(update={"duration_seconds": 60})
+        assert copied.duration_formatted == "00:01:00"
+        assert sample_media_file_info.duration_formatted == "02:00:00"
+
+    def test_cached_fields_survive_copies_and_revalidation(
+        self, sample_media_file_info: MediaFileInfo
+    ) -> None:
+        """Test cached computed fields stay consistent across model round trips."""
+        info = sample_media_file_info
+        assert info.resolution_display == "1920x1080"
+
+        shallow = copy.copy(info)
+        shallow.video_width = 1280
+        deep = info.model_copy(deep=True)
+        deep.video_height = 800
+        assert shallow.resolution_display == "1280x1080"
+        assert deep.resolution_display == "1920x800"
+        assert info.resolution_display == "1920x1080"
+
+        assert MediaFileInfo.model_validate(info.model_dump()) == info
+        assert MediaFileInfo.model_validate_json(info.model_dump_json()) == info
+        assert pickle.loads(pickle.dumps(info)) == info
+        assert "resolution_display='1920x1080'" in repr(info)
+
+    def test_parse_batch(self, sample_media_file_info: MediaFileInfo) -> None:
+        """Test validating a batch of records from JSON and from dicts."""
+        payload = "[" + sample_media_file_info.model_dump_json() + "]"
+
+        (from_json,) = parse_media_file_infos(payload)
+        (from_records,) = parse_media_file_infos(
+            [{"file_path": "/media/a.mkv", "file_size": "10", "file_extension": ".mkv"}]
+        )
+
+        assert from_json == sample_media_file_info
+        assert from_records.file_path == Path("/media/a.mkv")
+        assert from_records.file_size == 10
+        with pytest.raises(ValidationError):
+            parse_media_file_infos(b'[{"file_path": "a.mkv", "file_size": -1}]')
+
     def test_validation_errors(self, sample_video_file: Path) -> None:
         """Test validation errors for invalid data."""
         with pytest.raises(ValidationError):
@@ -84,6 +155,10 @@ class TestMediaFile:
 
     def test_update_status(self, sample_media_file: MediaFile) -> None:
         """Test updating processing status."""
+        # Intermediate statuses do not stamp the processing time
+        sample_media_file.update_status(ProcessingStatus.IDENTIFYING)
+        assert sample_media_file.processed_at is None
+
         # Update to completed
         sample_media_file.update_status(ProcessingStatus.COMPLETED)
         assert sample_media_file.processing_status == ProcessingStatus.COMPLETED
@@ -106,6 +181,8 @@ class TestMediaFile:
         assert "has_error" in data
         assert "file_path" in data
         assert "filename" in data
+        assert data["file_path"] == str(sample_media_file.info.file_path)
+        assert data["info"]["file_size_mb"] == sample_media_file.info.file_size_mb
 
 
 class TestAIMovieIdentification:
@@ -128,6 +205,22 @@ class TestAIMovieIdentification:
         assert ai_result.year == 1999
         assert ai_result.confidence == 0.95
 
+    def test_raw_response_kept_as_received(self) -> None:
+        """Test the raw AI payload is stored without a validation copy."""
+        raw = {"choices": [{"message": {"content": "{}"}}], "usage": {"tokens": 9}}
+        ai_result = AIMovieIdentification(
+            confidence=0.5,
+            model_used="test-model",
+            processing_time=0.1,
+            raw_response=raw,
+        )
+
+        assert ai_result.raw_response is raw
+        restored = AIMovieIdentification.model_validate_json(
+            ai_result.model_dump_json()
+        )
+        assert restored.raw_response == raw
+
     def test_best_title_fallback(self) -> None:
         """Test best title fallback logic."""
         # Only English title
@@ -202,6 +295,411 @@ class TestAIMovieIdentification:
             )
 
 
+class TestTMDBMovieInfo:
+    """Test TMDBMovieInfo model."""
+
+    def test_main_cast(self, mock_tmdb_movie_response: dict) -> None:
+        """Test main cast keeps the ten lowest billing orders in order."""
+        cast = [
+            {"id": i, "name": f"Actor {i}", "character": "Role", "order": order}
+            for i, order in enumerate([12, 3, 0, 7, 3, 1, 9, 11, 2, 5, 4, 8, 6, 10])
+        ]
+        movie = TMDBMovieInfo(**mock_tmdb_movie_response, cast=cast)
+
+        expected_orders = [0, 1, 2, 3, 3, 4, 5, 6, 7, 8]
+        assert [member.order for member in movie.main_cast] == expected_orders
+        # Equal billing orders keep their original relative order
+        assert [member.id for member in movie.main_cast[3:5]] == [1, 4]
+        assert movie.genre_names == ["Action", "Science Fiction"]
+
+    def test_runtime_formatted(self, mock_tmdb_movie_response: dict) -> None:
+        """Test runtime formatting."""
+        movie = TMDBMovieInfo(**mock_tmdb_movie_response)
+        assert movie.runtime_formatted == "2h 16m"
+
+        movie.runtime = 45
+        assert movie.runtime_formatted == "45m"
+
+        movie.runtime = None
+        assert movie.runtime_formatted == "Unknown"
+
+    def test_directors(self, mock_tmdb_movie_response: dict) -> None:
+        """Test directors are looked up from the crew by job."""
+        crew = [
+            {"id": 1, "name": "Lana", "job": "Director", "department": "Directing"},
+            {"id": 2, "name": "Joel", "job": "Producer", "department": "Production"},
+            {"id": 3, "name": "Lilly", "job": "Director", "department": "Directing"},
+        ]
+        movie = TMDBMovieInfo(**mock_tmdb_movie_response, crew=crew)
+
+        assert movie.director_names == ["Lana", "Lilly"]
+        assert next(movie.iter_director_names(), "Unknown") == "Lana"
+        assert list(movie.iter_genre_names()) == movie.genre_names
+
+        movie.crew = []
+        assert next(movie.iter_director_names(), "Unknown") == "Unknown"
+        assert movie.directors == []
+
+    def test_leaf_records_are_slotted(self, mock_tmdb_movie_response: dict) -> None:
+        """Test nested TMDB records are validated, frozen and slotted."""
+        genres = [{"id": "28", "name": "Action", "extra": "ignored"}]
+        movie = TMDBMovieInfo(**{**mock_tmdb_movie_response, "genres": genres})
+        genre = movie.genres[0]
+
+        assert genre == MovieGenre(id=28, name="Action")
+        assert not hasattr(genre, "__dict__")
+        assert hash(genre) == hash(MovieGenre(id=28, name="Action"))
+        with pytest.raises(FrozenInstanceError):
+            genre.name = "Drama"
+        with pytest.raises(ValidationError):
+            MovieGenre(id="not-an-id", name="Action")
+
+
+class TestMovie:
+    """Test Movie model."""
+
+    def test_identity_resolution(
+        self, sample_media_file: MediaFile, mock_tmdb_movie_response: dict
+    ) -> None:
+        """Test title, year and completeness across identification sources."""
+        ai_result = AIMovieIdentification(
+            chinese_title="黑客帝国",
+            year=2000,
+            confidence=0.9,
+            model_used="test-model",
+            processing_time=1.0,
+            raw_response={},
+        )
+        tmdb_info = TMDBMovieInfo(**mock_tmdb_movie_response)
+
+        movie = Movie(media_file=sample_media_file)
+        assert movie.best_title is None
+        assert movie.formatted_title == "Unknown Movie"
+        assert not movie.is_complete
+
+        movie = Movie(media_file=sample_media_file, ai_identification=ai_result)
+        assert movie.formatted_title == "黑客帝国 (2000)"
+        assert not movie.is_complete
+
+        movie = Movie(
+            media_file=sample_media_file,
+            ai_identification=ai_result,
+            tmdb_info=tmdb_info.model_copy(update={"release_date": None}),
+        )
+        assert movie.best_title == "The Matrix"
+        assert movie.best_year == 2000
+        assert movie.is_complete
+
+        movie = Movie(
+            media_file=sample_media_file,
+            ai_identification=ai_result,
+            tmdb_info=tmdb_info,
+        )
+        assert movie.formatted_title == "The Matrix (1999)"
+        assert movie.to_dict()["is_complete"]
+
+
+class TestTMDBTVShowInfo:
+    """Test TMDBTVShowInfo model."""
+
+    def test_parse_batch(self, mock_tmdb_tv_response: dict) -> None:
+        """Test validating a batch of TMDB show payloads."""
+        payload = json.dumps([mock_tmdb_tv_response])
+
+        (from_json,) = parse_tmdb_tv_shows(payload)
+        (from_records,) = parse_tmdb_tv_shows([mock_tmdb_tv_response])
+
+        assert from_json.model_dump(exclude={"fetched_at"}) == (
+            from_records.model_dump(exclude={"fetched_at"})
+        )
+        assert from_json.genre_names == ["Drama", "Crime"]
+        assert from_json.year_range == "2008-2013"
+        with pytest.raises(ValidationError):
+            parse_tmdb_tv_shows([{**mock_tmdb_tv_response, "vote_average": 11}])
+
+    def test_derived_lists(self, mock_tmdb_tv_response: dict) -> None:
+        """Test creators and main cast are derived once and follow assignment."""
+        crew = [
+            {"id": 1, "name": "Vince", "job": "Creator", "department": "Writing"},
+            {"id": 2, "name": "Mark", "job": "Executive Producer", "department": ""},
+            {"id": 3, "name": "Michelle", "job": "Producer", "department": ""},
+        ]
+        crew = [{**member, "credit_id": str(member["id"])} for member in crew]
+        cast = [
+            {
+                "id": i,
+                "name": f"Actor {i}",
+                "character": "",
+                "credit_id": "",
+                "order": 11 - i,
+            }
+            for i in range(12)
+        ]
+        show = TMDBTVShowInfo(**mock_tmdb_tv_response, crew=crew, cast=cast)
+
+        assert show.creator_names == ["Vince", "Mark"]
+        assert show.creators is show.creators
+        assert [member.order for member in show.main_cast] == list(range(10))
+
+        show.crew = []
+        assert show.creator_names == []
+
+        show.crew = [TVCrew(**crew[0]), TVCrew(**crew[1]), TVCrew(**crew[0])]
+        assert show.creator_names == ["Vince", "Mark"]
+
+    def test_average_runtime(self, mock_tmdb_tv_response: dict) -> None:
+        """Test the average episode runtime is floored and cached per show."""
+        show = TMDBTVShowInfo(**mock_tmdb_tv_response, episode_run_time=[45, 47, 58])
+        assert show.average_runtime == 50
+
+        show.episode_run_time = []
+        assert show.average_runtime is None
+
+    def test_main_cast_keeps_billing_order(self, mock_tmdb_tv_response: dict) -> None:
+        """Test main cast is selected once and keeps API order for ties."""
+        cast = [
+            {
+                "id": i,
+                "name": f"Actor {i}",
+                "character": "",
+                "credit_id": "",
+                "order": i // 2,
+            }
+            for i in range(30)
+        ]
+        show = TMDBTVShowInfo(**mock_tmdb_tv_response, cast=cast)
+
+        assert show.main_cast == show.cast[:10]
+        assert show.main_cast is show.main_cast
+
+        show.cast = list(reversed(show.cast))
+        assert [member.id for member in show.main_cast] == [
+            1,
+            0,
+            3,
+            2,
+            5,
+            4,
+            7,
+            6,
+            9,
+            8,
+        ]
+
+    def test_recurring_records_are_shared(self, mock_tmdb_tv_response: dict) -> None:
+        """Test equal genre and people records share one instance across shows."""
+        cast = [
+            {
+                "id": 17419,
+                "name": "Bryan",
+                "character": "Walter",
+                "credit_id": "x",
+                "order": 0,
+            }
+        ]
+        first = TMDBTVShowInfo(**mock_tmdb_tv_response, cast=cast)
+        second = TMDBTVShowInfo(**mock_tmdb_tv_response, cast=cast)
+        episode = Episode(
+            id=62085, season_number=1, episode_number=1, name="Pilot", cast=cast
+        )
+        recast = TMDBTVShowInfo(
+            **mock_tmdb_tv_response, cast=[{**cast[0], "character": "Heisenberg"}]
+        )
+
+        assert first.genres[0] is second.genres[0]
+        assert first.cast[0] is second.cast[0] is episode.cast[0]
+        assert recast.cast[0] is not first.cast[0]
+        assert recast.cast[0].character == "Heisenberg"
+
+    def test_leaf_records_are_slotted(self, mock_tmdb_tv_response: dict) -> None:
+        """Test nested TMDB show records are validated, frozen and slotted."""
+        seasons = [
+            {"id": "3572", "season_number": 1, "name": "Season 1", "episode_count": 7}
+        ]
+        show = TMDBTVShowInfo(**{**mock_tmdb_tv_response, "seasons": seasons})
+        season = show.seasons[0]
+
+        assert season.id == 3572
+        assert not hasattr(season, "__dict__")
+        assert not hasattr(show.genres[0], "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            season.episode_count = 8
+        with pytest.raises(ValidationError):
+            TMDBTVShowInfo(
+                **{
+                    **mock_tmdb_tv_response,
+                    "seasons": [{**seasons[0], "episode_count": -1}],
+                }
+            )
+
+
+class TestEpisode:
+    """Test Episode model."""
+
+    def test_parse_batch(self) -> None:
+        """Test validating a season's episode payloads."""
+        payload = (
+            b'[{"id": 62085, "season_number": 1, "episode_number": 1,'
+            b' "name": "Pilot", "air_date": "2008-01-20", "runtime": 58},'
+            b' {"id": 62086, "season_number": 1, "episode_number": 2,'
+            b' "name": "Cat\'s in the Bag...", "vote_average": 8.2}]'
+        )
+
+        pilot, second = parse_tmdb_episodes(payload)
+        (from_records,) = parse_tmdb_episodes([pilot.model_dump()])
+
+        assert pilot.episode_code == "S01E01"
+        assert pilot.runtime_formatted == "58m"
+        assert pilot.model_copy(update={"runtime": 125}).runtime_formatted == "2h 5m"
+        assert second.runtime_formatted == "Unknown"
+        assert second.name == "Cat's in the Bag..."
+        assert from_records == pilot
+        with pytest.raises(ValidationError):
+            parse_tmdb_episodes(
+                '[{"id": 1, "season_number": 1, "episode_number": 0, "name": ""}]'
+            )
+
+
+class TestTVEpisode:
+    """Test TVEpisode model."""
+
+    def test_to_dict(
+        self, sample_media_file: MediaFile, mock_tmdb_tv_response: dict
+    ) -> None:
+        """Test converting an episode with its sources to a dictionary."""
+        ai_result = AITVIdentification(
+            show_chinese_title="绝命毒师",
+            season_number=1,
+            episode_number=5,
+            episode_english_title="Gray Matter",
+            confidence=0.9,
+            model_used="test-model",
+            processing_time=1.0,
+            raw_response={},
+        )
+        episode = TVEpisode(
+            media_file=sample_media_file,
+            ai_identification=ai_result,
+            show_info=TMDBTVShowInfo(**mock_tmdb_tv_response),
+        )
+
+        data = episode.to_dict()
+        assert data["best_show_title"] == "Breaking Bad"
+        assert data["best_year"] == 2008
+        assert data["episode_code"] == "S01E05"
+        assert data["formatted_title"] == "Breaking Bad S01E05 - Gray Matter"
+        assert data["is_complete"]
+        assert data["media_file"]["file_path"] == str(sample_media_file.file_path)
+        assert data["show_info"]["genre_names"] == ["Drama", "Crime"]
+        assert data["ai_identification"]["best_show_title"] == "绝命毒师"
+
+        computed = set(TVEpisode.model_computed_fields)
+        assert computed <= data.keys()
+        assert set(AITVIdentification.model_computed_fields) <= (
+            data["ai_identification"].keys()
+        )
+        assert set(TMDBTVShowInfo.model_computed_fields) <= data["show_info"].keys()
+
+        payload = json.loads(episode.model_dump_json())
+        assert computed <= payload.keys()
+        assert payload["ai_identification"]["raw_response"] == {}
+        assert payload["show_info"]["first_air_date"] == "2008-01-20"
+        assert payload["created_at"] == episode.created_at.isoformat()
+
+    def test_episode_numbers_prefer_tmdb(self, sample_media_file: MediaFile) -> None:
+        """Test season and episode numbers come from TMDB before the AI result."""
+        ai_result = AITVIdentification(
+            season_number=1,
+            episode_number=5,
+            confidence=0.9,
+            model_used="test-model",
+            processing_time=1.0,
+            raw_response={},
+        )
+        episode = TVEpisode(media_file=sample_media_file, ai_identification=ai_result)
+        assert episode.episode_code == "S01E05"
+        assert episode.episode_code is ai_result.episode_code
+        assert not episode.is_complete
+
+        episode.episode_info = Episode(
+            id=62085, season_number=2, episode_number=3, name="Bit by a Dead Bee"
+        )
+        assert (episode.season_number, episode.episode_number) == (2, 3)
+        assert episode.formatted_title == "Unknown Show S02E03 - Bit by a Dead Bee"
+
+        episode.ai_identification = None
+        episode.episode_info = None
+        assert episode.episode_code is None
+
+    def test_dump_batch(self, sample_media_file: MediaFile) -> None:
+        """Test serializing a batch of episodes to one JSON array."""
+        episodes = [
+            TVEpisode(media_file=sample_media_file, target_filename=f"{i}.mkv")
+            for i in range(3)
+        ]
+
+        payload = json.loads(dump_tv_episodes_json(iter(episodes)))
+
+        assert payload == [json.loads(ep.model_dump_json()) for ep in episodes]
+        assert dump_tv_episodes_json([]) == b"[]"
+
+    def test_parse_batch_round_trip(
+        self, sample_media_file: MediaFile, mock_tmdb_tv_response: dict
+    ) -> None:
+        """Test episodes dumped as a batch validate back to equal episodes."""
+        episode = TVEpisode(
+            media_file=sample_media_file,
+            show_info=TMDBTVShowInfo(**mock_tmdb_tv_response),
+            episode_info=Episode(
+                id=62085, season_number=1, episode_number=1, name="Pilot"
+            ),
+        )
+
+        (from_json,) = parse_tv_episodes(dump_tv_episodes_json([episode]))
+        (from_records,) = parse_tv_episodes([episode.to_dict()])
+
+        assert from_json == episode
+        assert from_records == episode
+        assert from_json.formatted_title == "Breaking Bad S01E01 - Pilot"
+
+    def test_formatted_title(self, sample_media_file: MediaFile) -> None:
+        """Test formatted titles with and without show, code and episode title."""
+        episode = TVEpisode(media_file=sample_media_file)
+        assert episode.formatted_title == "Unknown Show Unknown"
+
+        episode.ai_identification = AITVIdentification(
+            show_english_title="Breaking Bad",
+            season_number=1,
+            episode_number=5,
+            confidence=0.9,
+            model_used="test-model",
+            processing_time=1.0,
+            raw_response={},
+        )
+        assert episode.formatted_title == "Breaking Bad S01E05"
+
+        episode.ai_identification.episode_english_title = "Gray Matter"
+        assert episode.formatted_title == "Breaking Bad S01E05 - Gray Matter"
+
+        episode.ai_identification.show_english_title = None
+        assert episode.formatted_title == "Unknown Show S01E05 - Gray Matter"
+
+    def test_update_timestamp(self, sample_media_file: MediaFile) -> None:
+        """Test updating the timestamp from the clock or a shared batch value."""
+        batch_time = datetime(2024, 1, 1, 12, 0)
+        episodes = [
+            TVEpisode(media_file=sample_media_file, created_at=batch_time)
+            for _ in range(2)
+        ]
+
+        for episode in episodes:
+            episode.update_timestamp(batch_time)
+        assert {episode.updated_at for episode in episodes} == {batch_time}
+
+        episodes[0].update_timestamp()
+        assert episodes[0].updated_at > batch_time
+
+
 class TestSettings:
     """Test Settings model."""
 
@@ -222,6 +720,36 @@ class TestSettings:
         assert mock_settings.should_skip_file(Path("movie.sample.mkv"))
         assert not mock_settings.should_skip_file(Path("movie.mkv"))
 
+    def test_file_lookups_follow_assignment(self) -> None:
+        """Test precomputed file lookups are rebuilt on assignment."""
+        settings = Settings(
+            hf_token="test",
+            tmdb_api_key="test",
+            video_extensions=".MKV,.mp4",
+            skip_patterns=[".Sample"],
+        )
+        assert settings.is_video_file(Path("movie.mkv"))
+        assert settings.should_skip_file(Path("movie.SAMPLE.mkv"))
+        assert settings.get_file_size_limits() == (10 * 1024 * 1024, None)
+
+        settings.video_extensions = [".avi"]
+        settings.max_file_size_gb = 2
+        assert not settings.is_video_file(Path("movie.mkv"))
+        assert settings.is_video_file(Path("movie.AVI"))
+        assert settings.get_file_size_limits()[1] == 2 * 1024 * 1024 * 1024
+
+    def test_skip_patterns_are_literal(self) -> None:
+        """Test skip patterns match as case-insensitive literal substrings."""
+        settings = Settings(
+            hf_token="test", tmdb_api_key="test", skip_patterns=["(1)", ".Sample"]
+        )
+        assert settings.should_skip_file(Path("Movie (1).mkv"))
+        assert settings.should_skip_file(Path("movie.SAMPLE.mkv"))
+        assert not settings.should_skip_file(Path("Movie 1.mkv"))
+
+        settings.skip_patterns = []
+        assert not settings.should_skip_file(Path("movie.sample.mkv"))
+
 
 class TestEnums:
     """Test enumeration types."""
@@ -260,3 +788,28 @@ class TestEnums:
         assert ProcessingStatus.PENDING == "pending"
         assert ProcessingStatus.COMPLETED == "completed"
         assert ProcessingStatus.FAILED == "failed"
+
+    def test_resolution_display_from_stored_value(
+        self, sample_video_file: Path
+    ) -> None:
+        """Test resolution display when the enum is stored as its value."""
+        info = MediaFileInfo(
+            file_path=sample_video_file,
+            file_size=1000,
+            file_extension=".mkv",
+            video_resolution=VideoResolution.FHD_1080P,
+        )
+
+        assert info.video_resolution == "1080p"
+        assert info.resolution_display == "1080p"
+
+    def test_enum_from_value(self) -> None:
+        """Test fast enum lookups by value."""
+        assert VideoCodec.from_value("hevc") is VideoCodec.HEVC
+        assert VideoCodec.from_value("mpeg2") is VideoCodec.UNKNOWN
+        assert AudioCodec.from_value("dts-hd") is AudioCodec.DTS_HD
+        assert ProcessingStatus.from_value("done") is None
+        assert (
+            ProcessingStatus.from_value("done", ProcessingStatus.PENDING)
+            is ProcessingStatus.PENDING
+        )
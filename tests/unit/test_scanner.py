@@ -5,20 +5,28 @@ This module tests the MediaFileScanner and related components.
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from smart_media_organizer.core.mime_cache import MimeCache
 from smart_media_organizer.core.scanner import (
+    MEDIA_EXTENSIONS,
     InvalidDirectoryError,
     MediaFileScanner,
+    ScannerError,
     ScanProgress,
+    _read_header,
     get_media_file_count,
     scan_for_media,
 )
-from smart_media_organizer.models.media_file import ProcessingStatus
+from smart_media_organizer.models.config import Settings
+from smart_media_organizer.models.media_file import (
+    MediaFile,
+    MediaFileInfo,
+    ProcessingStatus,
+)
 
 
 class TestScanProgress:
@@ -48,6 +56,22 @@ class TestScanProgress:
             progress.update_analysis(advance=2)
             progress.set_analysis_total(15)
 
+    @pytest.mark.asyncio
+    async def test_analysis_updates_are_throttled(self) -> None:
+        """Test that analysis updates within the interval are accumulated."""
+        progress = ScanProgress(update_interval=3600)
+
+        async with progress:
+            task_id = progress.start_analysis("Test analysis", total=10)
+            progress.update_analysis(advance=2)
+            progress.update_analysis(advance=3, description="Latest")
+            assert progress.progress.tasks[task_id].completed == 2
+
+            progress.flush_analysis()
+            task = progress.progress.tasks[task_id]
+            assert task.completed == 5
+            assert task.description == "Latest"
+
 
 class TestMediaFileScanner:
     """Test the MediaFileScanner class."""
@@ -57,7 +81,12 @@ class TestMediaFileScanner:
         scanner = MediaFileScanner(mock_settings)
         assert scanner.settings == mock_settings
         assert scanner.magic_mime is not None
-        assert scanner.magic_type is not None
+
+    def test_scanners_share_magic_instance(self, mock_settings) -> None:
+        """Test that scanners reuse a single libmagic detector."""
+        first = MediaFileScanner(mock_settings)
+        second = MediaFileScanner(mock_settings)
+        assert first.magic_mime is second.magic_mime
 
     @pytest.mark.asyncio
     async def test_scan_nonexistent_directory(self, mock_settings) -> None:
@@ -78,29 +107,6 @@ class TestMediaFileScanner:
         with pytest.raises(InvalidDirectoryError):
             await scanner.scan_single_file(nonexistent_file)
 
-    @pytest.mark.asyncio
-    async def test_is_potential_media_file(self, mock_settings) -> None:
-        """Test media file detection by extension."""
-        scanner = MediaFileScanner(mock_settings)
-
-        # Video files
-        assert scanner._is_potential_media_file(Path("movie.mp4"))
-        assert scanner._is_potential_media_file(Path("show.mkv"))
-        assert scanner._is_potential_media_file(Path("video.avi"))
-
-        # Subtitle files
-        assert scanner._is_potential_media_file(Path("subtitles.srt"))
-        assert scanner._is_potential_media_file(Path("subs.ass"))
-
-        # Image files
-        assert scanner._is_potential_media_file(Path("poster.jpg"))
-        assert scanner._is_potential_media_file(Path("banner.png"))
-
-        # Non-media files
-        assert not scanner._is_potential_media_file(Path("document.txt"))
-        assert not scanner._is_potential_media_file(Path("archive.zip"))
-        assert not scanner._is_potential_media_file(Path("config.json"))
-
     @pytest.mark.asyncio
     async def test_verify_media_file_success(self, mock_settings, temp_dir) -> None:
         """Test successful media file verification."""
@@ -129,6 +135,23 @@ class TestMediaFileScanner:
             result = await scanner._verify_media_file(test_file)
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_verify_media_file_memoizes_header(
+        self, mock_settings, temp_dir
+    ) -> None:
+        """Test that identical headers are only sniffed once."""
+        scanner = MediaFileScanner(mock_settings)
+        scanner.magic_mime = Mock()
+        scanner.magic_mime.from_buffer.return_value = "image/png"
+
+        header = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+        for name in ("first.png", "second.png"):
+            (temp_dir / name).write_bytes(header)
+            assert await scanner._verify_media_file(temp_dir / name) is True
+
+        # Memoized by prefix, but libmagic is given the whole header
+        scanner.magic_mime.from_buffer.assert_called_once_with(header)
+
     @pytest.mark.asyncio
     async def test_analyze_file_skip_patterns(self, mock_settings, temp_dir) -> None:
         """Test file analysis with skip patterns."""
@@ -163,9 +186,7 @@ class TestMediaFileScanner:
         media_file.write_bytes(b"x" * (2 * 1024 * 1024))  # 2MB file
 
         # Mock various checks
-        with patch.object(
-            scanner, "_is_potential_media_file", return_value=True
-        ), patch.object(scanner, "_verify_media_file", return_value=True):
+        with patch.object(scanner, "_verify_media_file", return_value=True):
             result = await scanner._analyze_file(media_file)
 
             assert result is not None
@@ -173,6 +194,44 @@ class TestMediaFileScanner:
             assert result.info.file_extension == ".mp4"
             assert result.processing_status == ProcessingStatus.SCANNING
 
+    @pytest.mark.asyncio
+    async def test_analyze_file_trusts_video_extension(self, temp_dir) -> None:
+        """Test that configured video extensions skip magic verification."""
+        settings = Settings(hf_token="test", tmdb_api_key="test", min_file_size_mb=0)
+        scanner = MediaFileScanner(settings)
+
+        media_file = temp_dir / "movie.mkv"
+        media_file.write_bytes(b"x" * 1024)
+
+        with patch.object(scanner, "_verify_media_file") as mock_verify:
+            result = await scanner._analyze_file(media_file)
+
+        assert result is not None
+        mock_verify.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_file_matches_validated_model(self, temp_dir) -> None:
+        """Test that unvalidated construction matches the validated models."""
+        settings = Settings(hf_token="test", tmdb_api_key="test", min_file_size_mb=0)
+        scanner = MediaFileScanner(settings)
+
+        media_file = temp_dir / "Movie.MKV"
+        media_file.write_bytes(b"x" * 1024)
+
+        result = await scanner._analyze_file(media_file)
+        validated = MediaFile(
+            info=MediaFileInfo(
+                file_path=media_file,
+                file_size=1024,
+                file_extension=".mkv",
+                created_at=result.info.created_at,
+            ),
+            processing_status=ProcessingStatus.SCANNING,
+        )
+
+        assert result.processing_status == ProcessingStatus.SCANNING.value
+        assert result.model_dump() == validated.model_dump()
+
     @pytest.mark.asyncio
     async def test_get_directory_stats(
         self, mock_settings, sample_files_structure
@@ -197,8 +256,31 @@ class TestMediaFileScanner:
         assert stats["total_size"] >= 0
 
     @pytest.mark.asyncio
-    @patch("smart_media_organizer.core.scanner.aiofiles.os.path.exists")
-    @patch("smart_media_organizer.core.scanner.aiofiles.os.path.isdir")
+    async def test_get_directory_stats_counts(self, mock_settings, temp_dir) -> None:
+        """Test that directory statistics count every file by type."""
+        scanner = MediaFileScanner(mock_settings)
+
+        sub_dir = temp_dir / "Movie"
+        sub_dir.mkdir()
+        (sub_dir / "movie.MKV").write_bytes(b"x" * 100)
+        (sub_dir / "movie.srt").write_bytes(b"x" * 10)
+        (temp_dir / "poster.jpg").write_bytes(b"x" * 5)
+        (temp_dir / "notes.txt").write_bytes(b"x")
+
+        stats = await scanner.get_directory_stats(temp_dir)
+
+        assert stats == {
+            "total_files": 4,
+            "video_files": 1,
+            "subtitle_files": 1,
+            "image_files": 1,
+            "other_files": 1,
+            "total_size": 116,
+        }
+
+    @pytest.mark.asyncio
+    @patch("smart_media_organizer.core.scanner.Path.exists")
+    @patch("smart_media_organizer.core.scanner.Path.is_dir")
     async def test_scan_directory_with_progress(
         self, mock_isdir, mock_exists, mock_settings
     ) -> None:
@@ -208,10 +290,14 @@ class TestMediaFileScanner:
 
         scanner = MediaFileScanner(mock_settings)
 
-        # Mock the file discovery to return empty list
-        with patch.object(scanner, "_discover_files") as mock_discover:
-            mock_discover.return_value = asyncio.iter([])
+        async def no_batches(*args, **kwargs):
+            for batch in ():
+                yield batch
 
+        # Mock the file discovery to find nothing
+        with patch.object(
+            scanner, "_discover_batches", side_effect=no_batches
+        ) as mock_discover:
             files = []
             async for media_file in scanner.scan_directory(
                 Path("/fake/dir"), show_progress=True
@@ -222,7 +308,42 @@ class TestMediaFileScanner:
             mock_discover.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_discover_files_recursive(
+    async def test_scan_directory_without_progress(self, temp_dir) -> None:
+        """Test that a silent scan never creates a progress display."""
+        settings = Settings(hf_token="test", tmdb_api_key="test", min_file_size_mb=0)
+        scanner = MediaFileScanner(settings)
+        (temp_dir / "movie.mkv").write_bytes(b"x" * 1024)
+
+        with patch("smart_media_organizer.core.scanner.ScanProgress") as mock_progress:
+            files = [
+                media_file
+                async for media_file in scanner.scan_directory(
+                    temp_dir, show_progress=False
+                )
+            ]
+
+        assert [media_file.filename for media_file in files] == ["movie.mkv"]
+        mock_progress.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_chunk_shares_timestamp(self, temp_dir) -> None:
+        """Test that files analyzed together share one creation timestamp."""
+        settings = Settings(hf_token="test", tmdb_api_key="test", min_file_size_mb=0)
+        scanner = MediaFileScanner(settings)
+
+        chunk = []
+        for name in ("a.mkv", "b.mp4"):
+            file_path = temp_dir / name
+            file_path.write_bytes(b"x" * 1024)
+            chunk.append((file_path, file_path.stat()))
+
+        media_files = await scanner._analyze_chunk(chunk)
+
+        assert len(media_files) == 2
+        assert media_files[0].info.created_at is media_files[1].info.created_at
+
+    @pytest.mark.asyncio
+    async def test_discover_batches_recursive(
         self, mock_settings, sample_files_structure
     ) -> None:
         """Test recursive file discovery."""
@@ -232,15 +353,17 @@ class TestMediaFileScanner:
         root_dir = next(iter(sample_files_structure.values())).parent.parent
 
         files = []
-        async for file_path in scanner._discover_files(root_dir, recursive=True):
-            files.append(file_path)
+        async for batch in scanner._discover_batches(root_dir, recursive=True):
+            files.extend(file_path for file_path, _ in batch)
 
         assert len(files) > 0
         # Should find files in subdirectories
         assert any("movies" in str(f) for f in files)
 
     @pytest.mark.asyncio
-    async def test_discover_files_non_recursive(self, mock_settings, temp_dir) -> None:
+    async def test_discover_batches_non_recursive(
+        self, mock_settings, temp_dir
+    ) -> None:
         """Test non-recursive file discovery."""
         scanner = MediaFileScanner(mock_settings)
 
@@ -254,14 +377,168 @@ class TestMediaFileScanner:
         sub_file.write_text("sub")
 
         files = []
-        async for file_path in scanner._discover_files(temp_dir, recursive=False):
-            files.append(file_path)
+        async for batch in scanner._discover_batches(temp_dir, recursive=False):
+            files.extend(file_path for file_path, _ in batch)
 
         # Should only find root level files
         file_names = [f.name for f in files]
         assert "root_file.txt" in file_names
         assert "sub_file.txt" not in file_names
 
+    @pytest.mark.asyncio
+    async def test_discover_batches_filters_extensions(
+        self, mock_settings, temp_dir
+    ) -> None:
+        """Test that non-media files are dropped during the walk."""
+        scanner = MediaFileScanner(mock_settings)
+
+        (temp_dir / "movie.MKV").write_bytes(b"video")
+        (temp_dir / "movie.nfo").write_text("info")
+        (temp_dir / ".mkv").write_text("hidden")
+
+        entries = []
+        async for batch in scanner._discover_batches(
+            temp_dir, extensions=MEDIA_EXTENSIONS
+        ):
+            entries.extend(
+                (file_path.name, stat_result.st_size)
+                for file_path, stat_result in batch
+            )
+
+        assert entries == [("movie.MKV", 5)]
+
+    @pytest.mark.asyncio
+    async def test_discover_batches_per_directory(
+        self, mock_settings, temp_dir
+    ) -> None:
+        """Test that discovery hands over one batch per directory."""
+        scanner = MediaFileScanner(mock_settings)
+
+        (temp_dir / "a.mkv").write_bytes(b"a")
+        sub_dir = temp_dir / "subdir"
+        sub_dir.mkdir()
+        (sub_dir / "b.mkv").write_bytes(b"b")
+        (sub_dir / "c.mkv").write_bytes(b"c")
+
+        batches = []
+        async for batch in scanner._discover_batches(temp_dir):
+            batches.append(sorted(file_path.name for file_path, _ in batch))
+
+        assert sorted(batches) == [["a.mkv"], ["b.mkv", "c.mkv"]]
+
+    @pytest.mark.asyncio
+    async def test_discover_batches_parallel_subtrees(
+        self, mock_settings, temp_dir
+    ) -> None:
+        """Test that subtrees walked in parallel are all discovered."""
+        scanner = MediaFileScanner(mock_settings)
+
+        expected = set()
+        for top in ("Movies", "TV", "Anime"):
+            nested = temp_dir / top / "nested"
+            nested.mkdir(parents=True)
+            for directory in (temp_dir / top, nested):
+                file_path = directory / f"{top}.mkv"
+                file_path.write_bytes(b"x")
+                expected.add(file_path)
+
+        with patch("smart_media_organizer.core.scanner.WALK_WORKERS", 2):
+            found = {
+                file_path
+                async for batch in scanner._discover_batches(temp_dir)
+                for file_path, _ in batch
+            }
+
+        assert found == expected
+
+    @pytest.mark.asyncio
+    async def test_discover_batches_missing_directory(
+        self, mock_settings, temp_dir
+    ) -> None:
+        """Test that walk errors surface as ScannerError."""
+        scanner = MediaFileScanner(mock_settings)
+
+        with pytest.raises(ScannerError):
+            async for _ in scanner._discover_batches(temp_dir / "missing"):
+                pass
+
+    def test_read_header(self, temp_dir) -> None:
+        """Test reading a file header with positional reads."""
+        file_path = temp_dir / "movie.mkv"
+        file_path.write_bytes(b"\x1aE\xdf\xa3" + b"x" * 1024)
+
+        assert _read_header(file_path, 4) == b"\x1aE\xdf\xa3"
+        assert len(_read_header(file_path)) == 512
+
+        with pytest.raises(FileNotFoundError):
+            _read_header(temp_dir / "missing.mkv")
+
+
+class TestMimeCache:
+    """Test the persistent MIME cache."""
+
+    def test_round_trip(self, temp_dir) -> None:
+        """Test cached entries survive reopening and track file changes."""
+        media_file = temp_dir / "poster.jpg"
+        media_file.write_bytes(b"jpeg data")
+        key = MimeCache.make_key(media_file, media_file.stat())
+
+        cache = MimeCache(temp_dir / "mime.db")
+        assert cache.get(key) is None
+        cache.put(key, "image/jpeg")
+        cache.close()
+
+        cache = MimeCache(temp_dir / "mime.db")
+        assert cache.get(key) == "image/jpeg"
+
+        media_file.write_bytes(b"changed jpeg data")
+        changed_key = MimeCache.make_key(media_file, media_file.stat())
+        assert cache.get(changed_key) is None
+        assert cache.get_many([key, changed_key]) == {key: "image/jpeg"}
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_scanner_uses_cache(self, mock_settings, temp_dir) -> None:
+        """Test that a cached MIME type skips reading the file header."""
+        media_file = temp_dir / "poster.jpg"
+        media_file.write_bytes(b"jpeg data")
+        stat_result = media_file.stat()
+
+        scanner = MediaFileScanner(mock_settings, cache_path=temp_dir / "mime.db")
+        scanner.mime_cache.put(
+            MimeCache.make_key(media_file, stat_result), "image/jpeg"
+        )
+        scanner.mime_cache.flush()
+
+        with patch("smart_media_organizer.core.scanner._read_header") as mock_read:
+            assert await scanner._verify_media_file(media_file, stat_result) is True
+
+        mock_read.assert_not_called()
+        scanner.close()
+
+    @pytest.mark.asyncio
+    async def test_chunk_looks_up_cache_once(self, temp_dir) -> None:
+        """Test a chunk is looked up with one batched query off the loop."""
+        settings = Settings(hf_token="test", tmdb_api_key="test", min_file_size_mb=0)
+        scanner = MediaFileScanner(settings, cache_path=temp_dir / "mime.db")
+        chunk = []
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            media_file = temp_dir / name
+            media_file.write_bytes(b"jpeg data")
+            chunk.append((media_file, media_file.stat()))
+
+        with patch.object(
+            scanner.mime_cache, "get_many", wraps=scanner.mime_cache.get_many
+        ) as mock_get_many, patch.object(scanner, "_verify_media_file") as mock_verify:
+            await scanner._analyze_chunk(chunk)
+
+        mock_get_many.assert_called_once()
+        assert len(mock_get_many.call_args.args[0]) == 3
+        assert mock_verify.call_count == 3
+        for call in mock_verify.call_args_list:
+            assert call.args[2] == {}
+        scanner.close()
+
 
 class TestConvenienceFunctions:
     """Test convenience functions."""